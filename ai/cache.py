@@ -0,0 +1,180 @@
+"""Content-addressed on-disk cache for AI image-analysis responses.
+
+A response is stored under the SHA-256 of everything that determines it:
+provider + model (and its image preprocessing settings), the JSON schema name,
+the prompt text and the bytes of every image (in order). Re-running `parse` on byte-identical images therefore returns
+the previous result instantly instead of spending another API call.
+
+Entries live in data/ai_cache/<key>.json. A cache hit touches the file's
+mtime, and whenever the directory grows past AI_CACHE_MAX_MB (default 20) the
+least recently used entries are evicted first.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+import PIL.Image
+
+from ai.interfaces import ImageAnalysisProvider
+from ai.preprocess import profile_tag
+
+logger = logging.getLogger("bible_bot.ai.cache")
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(BASE_DIR, "data", "ai_cache")
+DEFAULT_MAX_BYTES = 20 * 1024 * 1024
+
+# Bump to invalidate every stored response (e.g. when the key layout changes).
+CACHE_VERSION = 1
+
+
+def image_digest(image: PIL.Image.Image) -> bytes:
+    """SHA-256 of an image's bytes.
+
+    File-backed images hash the encoded file as it is on disk; in-memory images
+    (e.g. Google Drive downloads) hash their mode, size and raw pixel data.
+    """
+    digest = hashlib.sha256()
+    path = getattr(image, "filename", None)
+    if path and os.path.exists(path):
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    else:
+        digest.update(f"{image.mode}:{image.size[0]}x{image.size[1]}:".encode())
+        if image.mode == "P":
+            digest.update(bytes(image.getpalette() or ()))
+        digest.update(image.tobytes())
+    return digest.digest()
+
+
+def cache_key(
+    identity: str,
+    images: List[PIL.Image.Image],
+    prompt: str,
+    json_schema: Dict[str, Any],
+) -> str:
+    """Hex key for one request. `identity` names the provider and model."""
+    digest = hashlib.sha256()
+    digest.update(f"v{CACHE_VERSION}\0{identity}\0{json_schema.get('name', '')}\0".encode())
+    digest.update(prompt.encode("utf-8"))
+    for image in images:
+        digest.update(b"\0")
+        digest.update(image_digest(image))
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """Directory of JSON responses with size-bounded LRU eviction."""
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = None):
+        self.cache_dir = cache_dir or CACHE_DIR
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("AI_CACHE_MAX_MB", "0")) * 1024 * 1024) or DEFAULT_MAX_BYTES
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.warning("[WARN] Ignoring unreadable AI cache entry: %s", path)
+            return None
+        # Mark as recently used for LRU eviction.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry.get("response")
+
+    def put(self, key: str, response: Dict[str, Any], **meta: Any) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        entry = {"key": key, "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"), **meta, "response": response}
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+        self.evict(keep=key)
+
+    def evict(self, keep: str = None) -> int:
+        """Drop least recently used entries until the cache fits in max_bytes.
+        Returns the number of entries removed."""
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for item in it:
+                if not item.name.endswith(".json"):
+                    continue
+                st = item.stat()
+                entries.append((st.st_mtime_ns, st.st_size, item.path, item.name[:-5]))
+                total += st.st_size
+
+        removed = 0
+        for _, size, path, key in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        if removed:
+            logger.info("[INFO] AI cache: evicted %d old response(s)", removed)
+        return removed
+
+
+class CachedProvider(ImageAnalysisProvider):
+    """Wraps a provider so identical requests are answered from ResponseCache.
+
+    With refresh=True the wrapped provider is always called and its fresh
+    response replaces the stored one (`--no-cache`).
+    """
+
+    def __init__(
+        self,
+        provider: ImageAnalysisProvider,
+        name: str,
+        cache: ResponseCache = None,
+        refresh: bool = False,
+    ):
+        self.provider = provider
+        self.name = name
+        self.model = getattr(provider, "model", "")
+        self.cache = cache or ResponseCache()
+        self.refresh = refresh
+
+    @property
+    def identity(self) -> str:
+        return f"{self.name}:{self.model}:{profile_tag(getattr(self.provider, 'image_profile', None))}"
+
+    def generate_from_images(
+        self,
+        images: List[PIL.Image.Image],
+        prompt: str,
+        json_schema: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        key = cache_key(self.identity, images, prompt, json_schema)
+        if not self.refresh:
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.info("[INFO] AI cache hit (%s, key=%s) - skipping API call", self.identity, key[:12])
+                return cached
+
+        result = self.provider.generate_from_images(images, prompt, json_schema)
+        self.cache.put(key, result, provider=self.name, model=self.model, schema=json_schema.get("name"))
+        logger.info("[INFO] AI response cached (key=%s)", key[:12])
+        return result
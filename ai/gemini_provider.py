@@ -21,6 +21,7 @@ from ai.interfaces import (
     AIResponseFormatError,
     ImageAnalysisProvider,
 )
+from ai.preprocess import GEMINI_PROFILE, prepare_images
 
 logger = logging.getLogger("bible_bot.ai.gemini")
 
@@ -28,6 +29,8 @@ DEFAULT_MODEL = "gemini-2.5-flash"
 
 
 class GeminiProvider(ImageAnalysisProvider):
+    image_profile = GEMINI_PROFILE
+
     def __init__(self, api_key: str, model: str = DEFAULT_MODEL):
         if not api_key:
             raise AIAuthenticationError(
@@ -43,7 +46,10 @@ class GeminiProvider(ImageAnalysisProvider):
         json_schema: Dict[str, Any],
     ) -> Dict[str, Any]:
         logger.info("[INFO] Loading image...")
-        contents = [prompt, *images]
+        contents = [prompt] + [
+            types.Part.from_bytes(data=image.data, mime_type=image.mime_type)
+            for image in prepare_images(images, self.image_profile)
+        ]
 
         logger.info("[INFO] Sending request to Gemini (model=%s)...", self.model)
         try:
@@ -1,7 +1,6 @@
 """OpenAI Vision implementation of ImageAnalysisProvider."""
 
 import base64
-import io
 import json
 import logging
 from typing import Any, Dict, List
@@ -21,6 +20,7 @@ from ai.interfaces import (
     AIResponseFormatError,
     ImageAnalysisProvider,
 )
+from ai.preprocess import OPENAI_PROFILE, PreparedImage, prepare_images
 
 logger = logging.getLogger("bible_bot.ai.openai")
 
@@ -28,6 +28,8 @@ DEFAULT_MODEL = "gpt-5.5"
 
 
 class OpenAIProvider(ImageAnalysisProvider):
+    image_profile = OPENAI_PROFILE
+
     def __init__(self, api_key: str, model: str = DEFAULT_MODEL):
         if not api_key:
             raise AIAuthenticationError(
@@ -37,15 +39,9 @@ class OpenAIProvider(ImageAnalysisProvider):
         self._client = OpenAI(api_key=api_key)
 
     @staticmethod
-    def _to_data_url(image: PIL.Image.Image) -> str:
-        """Encode a PIL image as a base64 data URL (PNG/JPEG only)."""
-        fmt = (image.format or "PNG").upper()
-        if fmt not in ("PNG", "JPEG", "JPG"):
-            fmt = "PNG"
-        buf = io.BytesIO()
-        image.convert("RGB" if fmt != "PNG" else image.mode).save(buf, format=fmt)
-        mime = "image/jpeg" if fmt in ("JPEG", "JPG") else "image/png"
-        return f"data:{mime};base64,{base64.b64encode(buf.getvalue()).decode('utf-8')}"
+    def _to_data_url(image: PreparedImage) -> str:
+        """Encode a preprocessed image (JPEG/WebP/PNG bytes) as a base64 data URL."""
+        return f"data:{image.mime_type};base64,{base64.b64encode(image.data).decode('utf-8')}"
 
     def generate_from_images(
         self,
@@ -55,7 +51,7 @@ class OpenAIProvider(ImageAnalysisProvider):
     ) -> Dict[str, Any]:
         logger.info("[INFO] Loading image...")
         content = [{"type": "text", "text": prompt}]
-        for image in images:
+        for image in prepare_images(images, self.image_profile):
             content.append(
                 {"type": "image_url", "image_url": {"url": self._to_data_url(image)}}
             )
@@ -0,0 +1,243 @@
+"""Shrink plan images before they are uploaded to a vision provider.
+
+The reading-plan / QT images are phone photos or scans of printed tables. None
+of their colour, margins or pixels beyond the provider's own working resolution
+help the model read them, but all of it costs upload time and image tokens.
+prepare_image() runs each image through:
+
+1. EXIF-aware rotation (phone photos are often stored sideways)
+2. grayscale
+3. trimming to the printed area (drops empty page/desk margins)
+4. downscaling to the largest size the provider actually uses
+5. JPEG or WebP encoding, whichever is smaller, stepping quality down until the
+   image fits the profile's byte target
+
+and records bytes and estimated image tokens before/after in PreprocessStats.
+Images that are already upright, within the provider's working resolution and
+under the byte target are uploaded unchanged: re-encoding them costs more time
+than the smaller upload saves, and the provider would not downscale them anyway.
+Set AI_PREPROCESS=off to upload the original images unchanged.
+"""
+
+import io
+import logging
+import math
+import os
+from typing import List, Tuple
+
+import PIL.Image
+import PIL.ImageOps
+
+logger = logging.getLogger("bible_bot.ai.preprocess")
+
+# Pixels darker than this (0-255) count as printed content when trimming.
+TRIM_THRESHOLD = 200
+# Keep this fraction of the trimmed box as extra margin on each side.
+TRIM_MARGIN = 0.02
+# Only trim when the content box is at least this fraction of the image area;
+# a smaller box usually means the threshold picked up noise, not the table.
+TRIM_MIN_AREA = 0.25
+# EXIF Orientation tag; 1 (or missing) means the pixels are already upright.
+EXIF_ORIENTATION = 0x0112
+
+
+class ImageProfile:
+    """What one provider does with an uploaded image.
+
+    max_side / max_short: the provider downsizes anything larger, so pixels
+    beyond these limits are wasted upload.
+    tile / tile_tokens / base_tokens: the provider's image-token pricing, used to
+    estimate tokens (base_tokens + tiles * tile_tokens).
+    """
+
+    def __init__(self, name, max_side, max_short, tile, tile_tokens, base_tokens,
+                 formats=("JPEG", "WEBP"), qualities=(85, 75, 65), target_bytes=400_000):
+        self.name = name
+        self.max_side = max_side
+        self.max_short = max_short
+        self.tile = tile
+        self.tile_tokens = tile_tokens
+        self.base_tokens = base_tokens
+        self.formats = formats
+        self.qualities = qualities
+        self.target_bytes = target_bytes
+
+    @property
+    def tag(self) -> str:
+        """Identifies the preprocessing settings (part of the AI response cache key)."""
+        return (f"{self.name}/{self.max_side}x{self.max_short}/{'+'.join(self.formats)}"
+                f"/q{'-'.join(map(str, self.qualities))}/{self.target_bytes}")
+
+    def working_size(self, width: int, height: int) -> Tuple[int, int]:
+        """Size the provider would downscale (width, height) to."""
+        scale = min(1.0, self.max_side / max(width, height), self.max_short / min(width, height))
+        return max(1, round(width * scale)), max(1, round(height * scale))
+
+    def estimate_tokens(self, width: int, height: int) -> int:
+        width, height = self.working_size(width, height)
+        tiles = math.ceil(width / self.tile) * math.ceil(height / self.tile)
+        return self.base_tokens + tiles * self.tile_tokens
+
+
+# OpenAI (detail=high): fit in 2048x2048, then shortest side 768; 170 tokens
+# per 512px tile + 85 base.
+OPENAI_PROFILE = ImageProfile("openai", max_side=2048, max_short=768, tile=512,
+                              tile_tokens=170, base_tokens=85)
+# Gemini: 258 tokens per 768px tile. Table text stays legible at about three
+# tiles across, so larger uploads only add tokens.
+GEMINI_PROFILE = ImageProfile("gemini", max_side=2304, max_short=1536, tile=768,
+                              tile_tokens=258, base_tokens=0)
+
+
+def preprocessing_enabled() -> bool:
+    return os.getenv("AI_PREPROCESS", "on").lower() not in ("0", "off", "false", "no")
+
+
+def profile_tag(profile: ImageProfile = None) -> str:
+    """Cache-key tag for how images will be prepared for upload."""
+    if profile is None or not preprocessing_enabled():
+        return "original"
+    return profile.tag
+
+
+class PreprocessStats:
+    """Before/after numbers for one image."""
+
+    __slots__ = ("size_before", "size_after", "bytes_before", "bytes_after",
+                 "tokens_before", "tokens_after", "format")
+
+    def __init__(self, size_before, size_after, bytes_before, bytes_after,
+                 tokens_before, tokens_after, format):
+        self.size_before = size_before
+        self.size_after = size_after
+        self.bytes_before = bytes_before
+        self.bytes_after = bytes_after
+        self.tokens_before = tokens_before
+        self.tokens_after = tokens_after
+        self.format = format
+
+    def __str__(self):
+        (w0, h0), (w1, h1) = self.size_before, self.size_after
+        return (f"{w0}x{h0} {_kb(self.bytes_before)} (~{self.tokens_before} tokens) -> "
+                f"{w1}x{h1} {self.format} {_kb(self.bytes_after)} (~{self.tokens_after} tokens)")
+
+
+class PreparedImage:
+    """Encoded upload payload for one image."""
+
+    __slots__ = ("data", "mime_type", "stats")
+
+    def __init__(self, data: bytes, mime_type: str, stats: PreprocessStats):
+        self.data = data
+        self.mime_type = mime_type
+        self.stats = stats
+
+
+def _kb(n: int) -> str:
+    return f"{n / 1024:.0f}KB"
+
+
+def _original_bytes(image: PIL.Image.Image) -> Tuple[bytes, str]:
+    """The image as it would be uploaded without preprocessing."""
+    path = getattr(image, "filename", None)
+    fmt = (image.format or "PNG").upper()
+    if path and os.path.exists(path) and fmt in ("PNG", "JPEG", "WEBP"):
+        with open(path, "rb") as f:
+            return f.read(), f"image/{fmt.lower()}"
+    buf = io.BytesIO()
+    image.save(buf, format="PNG")
+    return buf.getvalue(), "image/png"
+
+
+def trim_to_content(gray: PIL.Image.Image) -> PIL.Image.Image:
+    """Crop a grayscale page image to the box around its printed content."""
+    mask = gray.point(lambda p: 255 if p < TRIM_THRESHOLD else 0)
+    bbox = mask.getbbox()
+    if bbox is None:
+        return gray
+    left, top, right, bottom = bbox
+    width, height = gray.size
+    if (right - left) * (bottom - top) < TRIM_MIN_AREA * width * height:
+        return gray
+    pad_x, pad_y = round(width * TRIM_MARGIN), round(height * TRIM_MARGIN)
+    return gray.crop((max(0, left - pad_x), max(0, top - pad_y),
+                      min(width, right + pad_x), min(height, bottom + pad_y)))
+
+
+def _encode(image: PIL.Image.Image, profile: ImageProfile) -> Tuple[bytes, str]:
+    """Smallest of the profile's formats, at the first quality that meets the byte target."""
+    best = None
+    for quality in profile.qualities:
+        for fmt in profile.formats:
+            buf = io.BytesIO()
+            if fmt == "WEBP":
+                image.save(buf, format=fmt, quality=quality, method=4)
+            else:
+                image.save(buf, format=fmt, quality=quality, optimize=True)
+            if best is None or buf.tell() < len(best[0]):
+                best = (buf.getvalue(), fmt)
+        if len(best[0]) <= profile.target_bytes:
+            break
+    return best
+
+
+def _fits_profile(image: PIL.Image.Image, original: bytes, profile: ImageProfile) -> bool:
+    """Already upright, within the working resolution and under the byte target."""
+    return (image.getexif().get(EXIF_ORIENTATION, 1) == 1
+            and profile.working_size(*image.size) == image.size
+            and len(original) <= profile.target_bytes)
+
+
+def prepare_image(image: PIL.Image.Image, profile: ImageProfile) -> PreparedImage:
+    """Rotate, grayscale, trim, downscale and encode one image for `profile`.
+
+    Images that already fit the profile (see _fits_profile) are passed through unchanged.
+    """
+    original, original_mime = _original_bytes(image)
+    size_before = image.size
+    tokens_before = profile.estimate_tokens(*size_before)
+
+    if not preprocessing_enabled() or _fits_profile(image, original, profile):
+        stats = PreprocessStats(size_before, size_before, len(original), len(original),
+                                tokens_before, tokens_before, original_mime.split("/")[1].upper())
+        return PreparedImage(original, original_mime, stats)
+
+    work = PIL.ImageOps.exif_transpose(image)
+    work = trim_to_content(work.convert("L"))
+    target = profile.working_size(*work.size)
+    if target != work.size:
+        work = work.resize(target, PIL.Image.LANCZOS)
+
+    data, fmt = _encode(work, profile)
+    if len(data) >= len(original) and work.size == size_before:
+        # Nothing gained (already small and tight): keep the original bytes.
+        data, mime, fmt = original, original_mime, original_mime.split("/")[1].upper()
+    else:
+        mime = f"image/{fmt.lower()}"
+
+    stats = PreprocessStats(size_before, work.size, len(original), len(data),
+                            tokens_before, profile.estimate_tokens(*work.size), fmt)
+    return PreparedImage(data, mime, stats)
+
+
+def prepare_images(images: List[PIL.Image.Image], profile: ImageProfile) -> List[PreparedImage]:
+    """prepare_image() for each image, logging per-image and total savings."""
+    prepared = [prepare_image(image, profile) for image in images]
+    for i, item in enumerate(prepared, 1):
+        logger.info("[INFO] Image %d: %s", i, item.stats)
+    log_savings(prepared)
+    return prepared
+
+
+def log_savings(prepared: List[PreparedImage]) -> None:
+    if not prepared:
+        return
+    before = sum(p.stats.bytes_before for p in prepared)
+    after = sum(p.stats.bytes_after for p in prepared)
+    tokens_before = sum(p.stats.tokens_before for p in prepared)
+    tokens_after = sum(p.stats.tokens_after for p in prepared)
+    saved = 100 * (1 - after / before) if before else 0.0
+    logger.info(
+        "[INFO] Upload: %s -> %s (-%.0f%%), image tokens ~%d -> ~%d",
+        _kb(before), _kb(after), saved, tokens_before, tokens_after,
+    )
@@ -4,10 +4,15 @@ Callers (tools/plan_parser.py, tools/issue_to_plan.py) only ever call
 get_provider() and talk to the returned object through ImageAnalysisProvider.
 Adding a new provider (Claude, Gemini, ...) means writing a new *_provider.py
 and adding a branch here -- no caller changes.
+
+The returned provider is wrapped in ai.cache.CachedProvider, so requests with
+byte-identical images, prompt and schema are answered from data/ai_cache/.
+no_cache=True (`--no-cache`) always calls the API and refreshes the entry.
 """
 
 import os
 
+from ai.cache import CachedProvider
 from ai.interfaces import AIAuthenticationError, ImageAnalysisProvider
 
 # Gemini의 무료 티어를 기본값으로 둔다: OPENAI_API_KEY에 결제 수단이 등록되면
@@ -15,9 +20,12 @@ from ai.interfaces import AIAuthenticationError, ImageAnalysisProvider
 DEFAULT_PROVIDER = "gemini"
 
 
-def get_provider(name: str = None) -> ImageAnalysisProvider:
+def get_provider(name: str = None, no_cache: bool = False) -> ImageAnalysisProvider:
     name = (name or os.getenv("AI_PROVIDER", DEFAULT_PROVIDER)).lower()
+    return CachedProvider(_create_provider(name), name, refresh=no_cache)
+
 
+def _create_provider(name: str) -> ImageAnalysisProvider:
     if name == "openai":
         from ai.openai_provider import DEFAULT_MODEL, OpenAIProvider
 
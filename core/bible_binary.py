@@ -0,0 +1,149 @@
+"""번역본 하나를 담는 버전 관리 바이너리 파일(.bin) 형식과 mmap 기반 조회 백엔드.
+
+tools/build_bible_db.py 가 bible.db 의 각 테이블을 data/<테이블명>.bin 으로 내보내고,
+BIBLE_RESOLVER_BACKEND=mmap 이면 MmapVerseIndex 가 SQLite 없이 이 파일을 mmap 해서 조회한다.
+여러 워커 프로세스가 같은 파일을 열면 OS 페이지 캐시를 공유하므로 본문을 각자 복사하지 않는다.
+
+파일 구조 (모두 little-endian, 각 구간은 4바이트 정렬):
+  HEADER    magic 'BBIN', version, n_books, n_chapters, n_verses, names_len, text_len
+  names     책 이름 UTF-8, '\\n' 으로 구분 (입력 순서 = 책 인덱스)
+  books     u32 × (n_books + 1)      책 b 의 장 구간 = chapters[books[b] : books[b+1]]
+  chapters  u32 × (n_chapters + 1)   장 구간 k 의 절 범위 = [chapters[k], chapters[k+1])
+  verses    u16 × n_verses           절 번호
+  offsets   u32 × (n_verses + 1)     절 i 의 본문 = text[offsets[i]:offsets[i+1]]
+  text      UTF-8 본문
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from core.bible_scripture_resolver import DB_FILE, TABLE_MAP
+from core.verse_index import IndexedVerseResolver
+
+MAGIC = b'BBIN'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHH5I')
+
+# 기본 위치: bible.db 와 같은 data/ 폴더
+BIN_DIR = os.path.dirname(DB_FILE)
+
+
+def bin_path(table, bin_dir=None):
+    return os.path.join(bin_dir or BIN_DIR, f"{table}.bin")
+
+
+def _pad(n):
+    return (-n) % 4
+
+
+def write_bible_binary(path, rows):
+    """(book, chapter, verse, content) 행들(성경 순서)을 .bin 파일로 저장. 저장한 절 수 반환.
+
+    임시 파일에 쓴 뒤 교체하므로, 이미 mmap 중인 프로세스는 이전 파일을 계속 안전하게 읽는다.
+    """
+    names = []
+    books = array('I')
+    chapters = array('I')
+    verses = array('H')
+    offsets = array('I', [0])
+    text = bytearray()
+    last_book = last_chap = None
+    book_first_chapter = 0
+
+    for book, chap, verse, content in rows:
+        if book != last_book:
+            names.append(book)
+            books.append(len(chapters))
+            book_first_chapter = len(chapters)
+            last_book, last_chap = book, None
+        if chap != last_chap:
+            # 빠진 장은 빈 구간으로 채워서 '장 번호 - 1 = 책 안의 위치' 를 유지
+            while len(chapters) - book_first_chapter < chap:
+                chapters.append(len(verses))
+            last_chap = chap
+        text += content.encode('utf-8')
+        offsets.append(len(text))
+        verses.append(verse)
+
+    books.append(len(chapters))
+    chapters.append(len(verses))
+    names_blob = '\n'.join(names).encode('utf-8')
+    if sys.byteorder != 'little':
+        for arr in (books, chapters, verses, offsets):
+            arr.byteswap()
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(names), len(chapters) - 1,
+                            len(verses), len(names_blob), len(text)))
+        for blob in (names_blob, books.tobytes(), chapters.tobytes(), verses.tobytes(), offsets.tobytes()):
+            f.write(blob)
+            f.write(b'\0' * _pad(len(blob)))
+        f.write(text)
+    os.replace(tmp_path, path)
+    return len(verses)
+
+
+class BibleBinary:
+    """.bin 파일 하나를 mmap 하고 구간별 memoryview 를 잡아두는 읽기 전용 객체"""
+
+    def __init__(self, path):
+        if sys.byteorder != 'little':
+            raise RuntimeError("BibleBinary 는 little-endian 환경에서만 지원됩니다.")
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, n_books, n_chapters, n_verses, names_len, text_len = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"성경 바이너리 파일이 아닙니다: {path}")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 바이너리 버전입니다: v{version} (필요: v{FORMAT_VERSION})")
+
+        view = memoryview(self._mm)
+        pos = HEADER.size
+
+        def section(size):
+            nonlocal pos
+            part = view[pos:pos + size]
+            pos += size + _pad(size)
+            return part
+
+        names = bytes(section(names_len)).decode('utf-8').split('\n') if n_books else []
+        self.books = section(4 * (n_books + 1)).cast('I')
+        self.chapters = section(4 * (n_chapters + 1)).cast('I')
+        self.verses = section(2 * n_verses).cast('H')
+        self.offsets = section(4 * (n_verses + 1)).cast('I')
+        self.text = section(text_len)
+        self.book_index = {name: i for i, name in enumerate(names)}
+
+    def chapter_bounds(self, book, chapter):
+        """장의 절 인덱스 범위 [lo, hi). 없으면 None"""
+        b = self.book_index.get(book)
+        if b is None: return None
+        k = self.books[b] + chapter - 1
+        if chapter < 1 or k >= self.books[b + 1]:
+            return None
+        return self.chapters[k], self.chapters[k + 1]
+
+    def verse_text(self, i):
+        # memoryview 에서 바로 디코딩: 최종 str 을 만들 때까지 바이트 복사가 없음
+        return str(self.text[self.offsets[i]:self.offsets[i + 1]], 'utf-8')
+
+
+class MmapVerseIndex(IndexedVerseResolver):
+    """data/<테이블명>.bin 을 mmap 해서 ScriptureResolver 와 같은 API 를 제공 (SQLite 미사용)"""
+    backend = 'mmap'
+
+    def __init__(self, bin_dir=None):
+        super().__init__()
+        self.bin_dir = bin_dir or BIN_DIR
+
+    def source_files(self):
+        # bible.db 가 아니라 내보낸 .bin 파일을 읽으므로 그 파일들이 기준
+        return [bin_path(table, self.bin_dir) for table in TABLE_MAP.values()]
+
+    def _load_table(self, table):
+        path = bin_path(table, self.bin_dir)
+        if not os.path.exists(path): return None
+        return BibleBinary(path)
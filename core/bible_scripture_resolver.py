@@ -1,48 +1,24 @@
 import sqlite3
 import os
-import re
+import threading
+from pathlib import Path
+
+# 성경 약어/책 번호 매핑과 인용 파서는 core.citation 에서 관리 (기존 import 경로 유지용 re-export)
+from core.citation import (
+    BIBLE_MAP,
+    BOOK_IDS,
+    BOOKS_BY_ID,
+    Citation,
+    book_id_of,
+    book_name,
+    chapter_citation,
+    parse_citation,
+)
+from core.plan_format import as_plan_day
 
 # DB 파일 경로 (data/bible.db)
 DB_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'bible.db')
 
-# --- [이동] 성경 약어 매핑 (이곳에서 통합 관리해야 QT 파싱 때 씁니다) ---
-BIBLE_MAP = {
-    '창': {'EN': 'Gen', 'MN': 'Эхл'}, '출': {'EN': 'Ex', 'MN': 'Гэт'},
-    '레': {'EN': 'Lev', 'MN': 'Лев'}, '민': {'EN': 'Num', 'MN': 'Тоо'},
-    '신': {'EN': 'Deut', 'MN': 'Дэд'}, '수': {'EN': 'Josh', 'MN': 'Иош'},
-    '삿': {'EN': 'Judg', 'MN': 'Шүү'}, '룻': {'EN': 'Ruth', 'MN': 'Рут'},
-    '삼상': {'EN': '1Sam', 'MN': '1Сам'}, '삼하': {'EN': '2Sam', 'MN': '2Сам'},
-    '왕상': {'EN': '1Kin', 'MN': '1Хаа'}, '왕하': {'EN': '2Kin', 'MN': '2Хаа'},
-    '대상': {'EN': '1Chr', 'MN': '1Шас'}, '대하': {'EN': '2Chr', 'MN': '2Шас'},
-    '스': {'EN': 'Ezra', 'MN': 'Езр'}, '느': {'EN': 'Neh', 'MN': 'Нех'},
-    '에': {'EN': 'Esther', 'MN': 'Ест'}, '욥': {'EN': 'Job', 'MN': 'Иов'},
-    '시': {'EN': 'Ps', 'MN': 'Дуу'}, '잠': {'EN': 'Prov', 'MN': 'Сур'},
-    '전': {'EN': 'Eccles', 'MN': 'Ном'}, '아': {'EN': 'Song', 'MN': 'Доо'},
-    '사': {'EN': 'Is', 'MN': 'Иса'}, '렘': {'EN': 'Jer', 'MN': 'Иер'},
-    '애': {'EN': 'Lam', 'MN': 'Гаш'}, '겔': {'EN': 'Ezek', 'MN': 'Езе'},
-    '단': {'EN': 'Dan', 'MN': 'Дан'}, '호': {'EN': 'Hos', 'MN': 'Хос'},
-    '욜': {'EN': 'Joel', 'MN': 'Иое'}, '암': {'EN': 'Amos', 'MN': 'Амо'},
-    '옵': {'EN': 'Obad', 'MN': 'Оба'}, '욘': {'EN': 'Jonah', 'MN': 'Ион'},
-    '미': {'EN': 'Mic', 'MN': 'Мик'}, '나': {'EN': 'Nah', 'MN': 'Нах'},
-    '합': {'EN': 'Hab', 'MN': 'Хаб'}, '습': {'EN': 'Zeph', 'MN': 'Зеф'},
-    '학': {'EN': 'Hag', 'MN': 'Хаг'}, '슥': {'EN': 'Zech', 'MN': 'Зех'},
-    '말': {'EN': 'Mal', 'MN': 'Мал'},
-    '마': {'EN': 'Matt', 'MN': 'Мат'}, '막': {'EN': 'Mark', 'MN': 'Марк'},
-    '눅': {'EN': 'Luke', 'MN': 'Лук'}, '요': {'EN': 'John', 'MN': 'Иох'},
-    '행': {'EN': 'Acts', 'MN': 'Үйл'}, '롬': {'EN': 'Rom', 'MN': 'Ром'},
-    '고전': {'EN': '1Cor', 'MN': '1Кор'}, '고후': {'EN': '2Cor', 'MN': '2Кор'},
-    '갈': {'EN': 'Gal', 'MN': 'Гал'}, '엡': {'EN': 'Eph', 'MN': 'Еф'},
-    '빌': {'EN': 'Phil', 'MN': 'Фил'}, '골': {'EN': 'Col', 'MN': 'Кол'},
-    '살전': {'EN': '1Thess', 'MN': '1Тес'}, '살후': {'EN': '2Thess', 'MN': '2Тес'},
-    '딤전': {'EN': '1Tim', 'MN': '1Тим'}, '딤후': {'EN': '2Tim', 'MN': '2Тим'},
-    '딛': {'EN': 'Titus', 'MN': 'Тит'}, '몬': {'EN': 'Philem', 'MN': 'Филм'},
-    '히': {'EN': 'Heb', 'MN': 'Евр'}, '약': {'EN': 'James', 'MN': 'Иак'},
-    '벧전': {'EN': '1Pet', 'MN': '1Пет'}, '벧후': {'EN': '2Pet', 'MN': '2Пет'},
-    '요일': {'EN': '1John', 'MN': '1Иох'}, '요이': {'EN': '2John', 'MN': '2Иох'},
-    '요삼': {'EN': '3John', 'MN': '3Иох'}, '유': {'EN': 'Jude', 'MN': 'Иуд'},
-    '계': {'EN': 'Rev', 'MN': 'Илч'}
-}
-
 # 테이블 및 버전 정보 매핑 (공통 사용)
 TABLE_MAP = {'KO': 'bible_ko_KRV', 'EN': 'bible_en_ESV', 'MN': 'bible_mn_MUV'}
 META_INFO = {
@@ -52,124 +28,425 @@ META_INFO = {
 def translate_citation(text, lang_code):
     """한글 약어(예: 마1-4)를 타 언어(Matt 1-4)로 변환 (표시용)"""
     if lang_code == 'KO' or not text: return text
-    match = re.match(r"([가-힣]+)\s*(.*)", text)
-    if match:
-        book_ko = match.group(1)
-        rest = match.group(2)
-        if book_ko in BIBLE_MAP:
-            book_trans = BIBLE_MAP[book_ko].get(lang_code, book_ko)
-            return f"{book_trans} {rest}".strip()
-    return text
+    return parse_citation(text).display(lang_code)
+
+def _as_citation(citation):
+    """문자열이면 파싱(메모이즈)하고, 이미 Citation 이면 그대로"""
+    if isinstance(citation, Citation) or not citation:
+        return citation
+    return parse_citation(citation)
+
+def plan_row_citations(row):
+    """플랜 한 줄(PlanDay 또는 v1 목록 [nt, ot, ps, pr, qt])에서 발송 본문 대상 인용 {'qt', 'ps', 'pr'} (빈 칸 제외)
+
+    QT 칸이 책 이름 없이 숫자로 시작하면 마태복음으로 본다 (발송 로직과 동일).
+    v2 플랜에서 읽은 PlanDay 는 미리 풀어 둔 구간을 그대로 쓴다.
+    """
+    return as_plan_day(row).citations()
+
+class ScriptureResolver:
+    """bible.db 읽기 전용 연결 하나를 계속 들고 있으면서 본문을 조회하는 객체.
+
+    매 호출마다 connect/os.path.exists 를 하지 않도록 연결은 최초 조회 시 한 번만 연다.
+    DB는 발송 중 바뀌지 않으므로 immutable=1 로 열어 파일 잠금/변경 검사도 생략한다.
+    그래서 열려 있는 bible.db 를 제자리에서 고쳐 쓰면 안 된다: 다른 경로에 새로 빌드한 뒤
+    os.replace 로 통째로 바꿔야 한다 (immutable 연결은 중간에 바뀐 페이지를 감지하지 못함).
+    (DB를 다시 빌드했다면 reset_resolver() 후 재조회하면 새 파일로 다시 연결된다.
+     상주 프로세스에서는 core.message_cache 가 원본 해시가 바뀐 것을 보고 알아서 호출한다.)
+    """
+
+    PRAGMAS = (
+        "PRAGMA mmap_size = 268435456",  # 256MB: DB 전체를 mmap 으로 읽기
+        "PRAGMA cache_size = -32768",    # 32MB 페이지 캐시
+        "PRAGMA temp_store = MEMORY",
+    )
+    # BIBLE_RESOLVER_BACKEND 값 (메시지 캐시 키에 포함)
+    backend = 'sqlite'
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or DB_FILE
+        self._conn = None
+        self._lock = threading.Lock()
+        self._queries = {}
+        self._has_ordinal = {}
+
+    def _connect(self):
+        """최초 1회만 연결. DB 파일이 없으면 None (다음 호출에서 다시 시도)."""
+        if self._conn is not None:
+            return self._conn
+        if not os.path.exists(self.db_path):
+            return None
+        uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro&immutable=1"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=64)
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        self._conn = conn
+        return conn
+
+    def source_files(self):
+        """본문을 읽어 오는 파일 목록 (메시지 캐시가 내용 해시로 변경 여부를 판단)"""
+        return [self.db_path]
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _sql(self, table):
+        """번역본 테이블별 SQL 문자열을 한 번만 만들어 재사용 (sqlite3 statement 캐시 적중용)"""
+        queries = self._queries.get(table)
+        if queries is None:
+            queries = {
+                'chapters': f"SELECT chapter, verse, content FROM {table} WHERE book=? AND chapter BETWEEN ? AND ? ORDER BY chapter ASC, verse ASC",
+                'verse_range': f"SELECT verse, content FROM {table} WHERE book=? AND chapter=? AND verse BETWEEN ? AND ? ORDER BY verse ASC",
+                'verse': f"SELECT verse, content FROM {table} WHERE book=? AND chapter=? AND verse=? ORDER BY verse ASC",
+                'chapter': f"SELECT verse, content FROM {table} WHERE book=? AND chapter=? ORDER BY verse ASC",
+                # (book_id, chapter, verse) 행 값 비교로 양 끝을 잡아 인덱스 구간 하나만 훑는다.
+                # 시작 절/장이 DB 에 없어도 그 뒤 첫 절부터 읽으므로 메모리/mmap 백엔드와 결과가 같다
+                'span': (
+                    f"SELECT book, chapter, verse, content FROM {table} "
+                    f"WHERE (book_id, chapter, verse) >= (?, ?, ?) AND (book_id, chapter, verse) <= (?, ?, ?) "
+                    f"ORDER BY book_id, chapter, verse"
+                ),
+            }
+            self._queries[table] = queries
+        return queries
+
+    def _fetch(self, lang_code, query, params):
+        conn = self._connect()
+        if conn is None: return None
+        sql = self._sql(TABLE_MAP.get(lang_code, TABLE_MAP['KO']))[query]
+        with self._lock:
+            return conn.execute(sql, params).fetchall()
+
+    def fetch_chapters(self, lang_code, book, start_c, end_c):
+        """(chapter, verse, content) 목록"""
+        return self._fetch(lang_code, 'chapters', (book, start_c, end_c))
+
+    def fetch_verses(self, lang_code, book, chapter, start_v=None, end_v=None):
+        """(verse, content) 목록. 절 범위가 없으면 장 전체"""
+        if start_v and end_v:
+            return self._fetch(lang_code, 'verse_range', (book, chapter, start_v, end_v))
+        if start_v:
+            return self._fetch(lang_code, 'verse', (book, chapter, start_v))
+        return self._fetch(lang_code, 'chapter', (book, chapter))
+
+    def _supports_ordinal(self, table):
+        """ordinal/book_id 컬럼이 있는 (신규 스키마) 테이블인지 한 번만 확인"""
+        if table not in self._has_ordinal:
+            conn = self._connect()
+            if conn is None: return False
+            with self._lock:
+                columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+            self._has_ordinal[table] = {'ordinal', 'book_id'} <= columns
+        return self._has_ordinal[table]
+
+    def fetch_span(self, lang_code, start, end):
+        """start/end = (한글 약어, 장, 절 또는 None) 구간의 (book, chapter, verse, content) 목록.
+
+        장/책을 넘는 구간도 신규 스키마에서는 (book_id, chapter, verse) 인덱스 범위 쿼리 한 번으로 가져온다.
+        구 스키마 DB(또는 메모리/mmap 백엔드)는 책 단위로 fetch_chapters 를 이어 붙인다.
+        어느 경로든 양 끝 절이 DB 에 없으면 구간 안에 있는 절만 돌려준다 (없으면 빈 목록).
+        """
+        book1, c1, v1 = start
+        book2, c2, v2 = end
+        table = TABLE_MAP.get(lang_code, TABLE_MAP['KO'])
+        if self._supports_ordinal(table):
+            params = (BOOK_IDS[book1], c1, v1 or 0, BOOK_IDS[book2], c2, v2 or 9999)
+            return self._fetch(lang_code, 'span', params)
+
+        rows = []
+        for book_id in range(BOOK_IDS[book1], BOOK_IDS[book2] + 1):
+            book_ko = BOOKS_BY_ID[book_id]
+            search_book = book_name(book_ko, lang_code)
+            first = c1 if book_id == BOOK_IDS[book1] else 1
+            last = c2 if book_id == BOOK_IDS[book2] else 999
+            chapters = self.fetch_chapters(lang_code, search_book, first, last)
+            if chapters is None: return None
+            for c, v, content in chapters:
+                if book_id == BOOK_IDS[book1] and c == c1 and v1 and v < v1: continue
+                if book_id == BOOK_IDS[book2] and c == c2 and v2 and v > v2: continue
+                rows.append((search_book, c, v, content))
+        return rows
+
+    def _render(self, cite, rows, lang_code):
+        """(book, chapter, verse, content) 행을 발송용 본문 문자열로 포맷팅 (모든 조회 경로 공통)"""
+        book1, c1, v1 = cite.book, cite.start_chapter, cite.start_verse
+        book2, c2, v2 = cite.end_book, cite.end_chapter, cite.end_verse
+
+        ver_name = META_INFO[lang_code]['ver']
+        name1, name2 = book_name(book1, lang_code), book_name(book2, lang_code)
+        # 표시용 범위 문자열 (예: 8:1-22, 1-3, 26-Rom 2)
+        start_str = f"{c1}:{v1}" if v1 else f"{c1}"
+        end_str = f"{c2}:{v2}" if v2 else f"{c2}"
+        if book1 != book2:
+            end_str = f"{name2} {end_str}"
+        elif c1 == c2 and v1 and v2:
+            end_str = f"{v2}" if v2 != v1 else start_str
+        range_str = start_str if start_str == end_str else f"{start_str}-{end_str}"
+        lines = [f"({name1} {range_str} / {ver_name})"]
+
+        multi = (book1, c1) != (book2, c2)
+        current = None
+        for b, c, v, content in rows:
+            # 여러 장일 경우 장 구분 표시 (책이 바뀌는 범위는 책 이름도 표시)
+            if multi and current != (b, c):
+                lines.append(f"\n[{b} {c}장]" if book1 != book2 else f"\n[{c}장]")
+                current = (b, c)
+            lines.append(f"{v}. {content}")
+        return "\n".join(lines)
+
+    def get_range_text(self, citation, lang_code='KO'):
+        """'행26-롬2', '롬13-고전1', '욥 1:35-2:5' 처럼 장/책을 넘는 범위의 본문."""
+        cite = _as_citation(citation)
+        if not cite or not cite.is_resolvable: return None
+        if cite.end_book_id < cite.book_id: return None
+
+        try:
+            rows = self.fetch_span(
+                lang_code,
+                (cite.book, cite.start_chapter, cite.start_verse),
+                (cite.end_book, cite.end_chapter, cite.end_verse),
+            )
+            if not rows: return None
+            return self._render(cite, rows, lang_code)
+        except Exception as e:
+            print(f"⚠️ Range Error ({lang_code}): {e}")
+            return None
+
+    def get_chapter_text(self, book_abbrev, chapter_str, lang_code='KO'):
+        """(기존 기능) 시편/잠언처럼 '장' 전체를 가져올 때 사용. '시 1-3' 같은 범위도 지원."""
+        if not chapter_str: return None
+
+        # "시 1-3" / "1-3" -> start=1, end=3 (책은 항상 book_abbrev 기준)
+        cite = chapter_citation(book_abbrev, chapter_str)
+        if cite.start_chapter is None: return None
+
+        # '시 119-65-88' 처럼 절 범위가 있으면 절 단위 조회
+        if cite.start_verse is not None:
+            return self.get_qt_text(cite, lang_code)
+
+        # DB 검색용 이름 변환 (시->Psalms 등)
+        search_book = book_name(book_abbrev, lang_code)
+
+        try:
+            rows = self.fetch_chapters(lang_code, search_book, cite.start_chapter, cite.end_chapter)
+            if not rows: return None
+            return self._render(cite, [(search_book, c, v, content) for c, v, content in rows], lang_code)
+        except Exception as e:
+            print(f"⚠️ Chapter Error: {e}")
+            return None
+
+    def get_qt_text(self, citation, lang_code='KO'):
+        """'삼상 8:1-22' 같은 인용(문자열 또는 Citation)의 해당 범위 본문을 가져옵니다."""
+        cite = _as_citation(citation)
+        if not cite or not cite.is_resolvable: return None
+
+        # 장/책을 넘는 범위 (예: '욥 1:35-2:5', '마 26-막2') 는 범위 조회로 처리
+        if not cite.is_single_chapter:
+            return self.get_range_text(cite, lang_code)
+
+        start_v = cite.start_verse
+        end_v = cite.end_verse if cite.end_verse != start_v else None
+
+        # 언어별 책 이름 변환 (DB 검색용)
+        search_book = book_name(cite.book, lang_code)
+
+        try:
+            # 조회 (범위 / 시작절만 / 장 전체)
+            rows = self.fetch_verses(lang_code, search_book, cite.start_chapter, start_v, end_v)
+            if not rows: return None
+            return self._render(cite, [(search_book, cite.start_chapter, v, c) for v, c in rows], lang_code)
+        except Exception as e:
+            print(f"⚠️ QT Error ({lang_code}): {e}")
+            return None
+
+    def get_passage_text(self, cite, lang_code='KO'):
+        """chapter_citation/plan_row_citations 로 만든 Citation 하나의 본문 (종류 무관)"""
+        # 장 전체/절 범위/장·책을 넘는 범위 모두 같은 포맷으로 렌더링된다
+        return self.get_qt_text(cite, lang_code)
+
+    def _fetch_spans_batch(self, lang_code, cites):
+        """여러 구간을 CTE 한 번 + ordinal 조인 한 번으로 조회. {순번: [(book, chapter, verse, content), ...]}"""
+        table = TABLE_MAP.get(lang_code, TABLE_MAP['KO'])
+        values = []
+        params = []
+        for seq, cite in enumerate(cites):
+            values.append("(?,?,?,?,?,?,?)")
+            params += [seq, cite.book_id, cite.start_chapter, cite.start_verse or 0,
+                       cite.end_book_id, cite.end_chapter, cite.end_verse or 9999]
+        sql = (
+            f"WITH req(seq, b1, c1, v1, b2, c2, v2) AS (VALUES {','.join(values)}), "
+            # 양 끝은 fetch_span 과 같은 행 값 비교: 구간 안의 첫/마지막 절 (없으면 빈 구간)
+            f"bounds AS MATERIALIZED (SELECT seq, "
+            f"(SELECT ordinal FROM {table} WHERE (book_id, chapter, verse) >= (b1, c1, v1) "
+            f"ORDER BY book_id, chapter, verse LIMIT 1) AS lo, "
+            f"(SELECT ordinal FROM {table} WHERE (book_id, chapter, verse) <= (b2, c2, v2) "
+            f"ORDER BY book_id DESC, chapter DESC, verse DESC LIMIT 1) AS hi "
+            f"FROM req) "
+            f"SELECT bounds.seq, t.book, t.chapter, t.verse, t.content "
+            f"FROM bounds JOIN {table} AS t ON t.ordinal BETWEEN bounds.lo AND bounds.hi "
+            f"ORDER BY bounds.seq, t.ordinal"
+        )
+        conn = self._connect()
+        grouped = {}
+        with self._lock:
+            for seq, book, chapter, verse, content in conn.execute(sql, params):
+                grouped.setdefault(seq, []).append((book, chapter, verse, content))
+        return grouped
+
+    def resolve_month(self, plan, langs=('KO', 'EN', 'MN')):
+        """한 달 플랜의 QT/시편/잠언 인용을 언어별로 한 번에 해석.
+
+        반환: {day: {lang: {'qt': 본문 또는 None, 'ps': ..., 'pr': ...}}}
+        (빈 칸은 키 자체가 없고, 찾지 못한 인용은 None)
+        신규 스키마 DB 는 언어별 쿼리 한 번, 그 외 백엔드는 인용마다 개별 조회로 처리한다.
+        """
+        requests = []  # (day, kind, Citation)
+        result = {}
+        for day, row in plan.items():
+            result[day] = {lang: {} for lang in langs}
+            for kind, cite in plan_row_citations(row).items():
+                requests.append((day, kind, cite))
+
+        for lang in langs:
+            table = TABLE_MAP.get(lang, TABLE_MAP['KO'])
+            resolvable = [(i, cite) for i, (_, _, cite) in enumerate(requests)
+                          if cite.is_resolvable and cite.end_book_id >= cite.book_id]
+            batch = {}
+            if resolvable and self._supports_ordinal(table):
+                try:
+                    grouped = self._fetch_spans_batch(lang, [cite for _, cite in resolvable])
+                    for seq, (i, cite) in enumerate(resolvable):
+                        rows = grouped.get(seq)
+                        batch[i] = self._render(cite, rows, lang) if rows else None
+                except sqlite3.Error as e:
+                    print(f"⚠️ Month Resolve Error ({lang}): {e}")
+                    batch = {}
+
+            for i, (day, kind, cite) in enumerate(requests):
+                text = batch[i] if i in batch else self.get_passage_text(cite, lang)
+                result[day][lang][kind] = text
+        return result
+
+_resolver = None
+
+def get_resolver():
+    """프로세스 전체에서 공유하는 조회기 (최초 호출 시 생성).
+
+    BIBLE_RESOLVER_BACKEND=memory 이면 메모리 인덱스(core.verse_index),
+    mmap 이면 build_bible_db 가 내보낸 바이너리 파일(core.bible_binary), 기본값은 SQLite.
+    """
+    global _resolver
+    if _resolver is None:
+        backend = os.getenv('BIBLE_RESOLVER_BACKEND', 'sqlite').lower()
+        if backend == 'memory':
+            from core.verse_index import MemoryVerseIndex
+            _resolver = MemoryVerseIndex()
+        elif backend == 'mmap':
+            from core.bible_binary import MmapVerseIndex
+            _resolver = MmapVerseIndex()
+        else:
+            _resolver = ScriptureResolver()
+    return _resolver
+
+def reset_resolver():
+    """공유 조회기를 닫고 버린다. 다음 get_resolver() 는 원본 파일(bible.db / .bin)을 새로 연다."""
+    global _resolver
+    old, _resolver = _resolver, None
+    if old is not None:
+        old.close()
 
 def get_chapter_text(book_abbrev, chapter_str, lang_code='KO'):
     """(기존 기능) 시편/잠언처럼 '장' 전체를 가져올 때 사용. '시 1-3' 같은 범위도 지원."""
-    if not os.path.exists(DB_FILE) or not chapter_str: return None
-    
-    # 숫자 범위 추출 ("시 1-3" -> start=1, end=3)
-    match = re.search(r"(\d+)(?:[-~](\d+))?", str(chapter_str))
-    if not match: return None
-    
-    start_c = int(match.group(1))
-    end_c = int(match.group(2)) if match.group(2) else start_c
-    
-    # DB 검색용 이름 변환 (시->Psalms 등)
-    search_book = book_abbrev
-    if lang_code != 'KO' and book_abbrev in BIBLE_MAP:
-        search_book = BIBLE_MAP[book_abbrev].get(lang_code, book_abbrev)
-
-    target_table = TABLE_MAP.get(lang_code, TABLE_MAP['KO'])
-
-    try:
-        with sqlite3.connect(DB_FILE) as conn:
-            cursor = conn.cursor()
-            sql = f"SELECT chapter, verse, content FROM {target_table} WHERE book=? AND chapter BETWEEN ? AND ? ORDER BY chapter ASC, verse ASC"
-            cursor.execute(sql, (search_book, start_c, end_c))
-            rows = cursor.fetchall()
-            
-            if not rows: return None
+    return get_resolver().get_chapter_text(book_abbrev, chapter_str, lang_code)
 
-            ver_name = META_INFO[lang_code]['ver']
-            range_str = f"{start_c}" if start_c == end_c else f"{start_c}-{end_c}"
-            lines = [f"({search_book} {range_str} / {ver_name})"]
-            
-            current_chap = -1
-            for c, v, content in rows:
-                # 여러 장일 경우 장 구분 표시
-                if start_c != end_c and current_chap != c:
-                    lines.append(f"\n[{c}장]")
-                    current_chap = c
-                lines.append(f"{v}. {content}")
-            return "\n".join(lines)
-    except Exception as e:
-        print(f"⚠️ Chapter Error: {e}")
-        return None
-
-def get_qt_text(citation_str, lang_code='KO'):
+def get_qt_text(citation, lang_code='KO'):
     """
-    [신규 기능] '삼상 8:1-22' 같은 문자열을 파싱해서 해당 범위의 본문을 가져옵니다.
+    [신규 기능] '삼상 8:1-22' 같은 문자열(또는 Citation)을 파싱해서 해당 범위의 본문을 가져옵니다.
     """
-    if not os.path.exists(DB_FILE) or not citation_str: return None
-
-    # 1. 파싱: "삼상", "8", "1", "22" 분리
-    # 정규식 패턴: (책이름) (장):(시작절)-(끝절) 또는 (책이름) (장)
-    pattern = r"([가-힣]+)\s*(\d+)[:장]?\s*(\d+)?[-~]?(\d+)?"
-    match = re.search(pattern, citation_str)
-    
-    if not match: return None
-    
-    book_ko, chapter, start_v, end_v = match.groups()
-    chapter = int(chapter)
-    
-    # 2. 언어별 책 이름 변환 (DB 검색용)
-    search_book = book_ko
-    if lang_code != 'KO' and book_ko in BIBLE_MAP:
-        search_book = BIBLE_MAP[book_ko].get(lang_code, book_ko)
-        
-    target_table = TABLE_MAP.get(lang_code, TABLE_MAP['KO'])
-
-    try:
-        with sqlite3.connect(DB_FILE) as conn:
-            cursor = conn.cursor()
-            
-            # 3. 쿼리 생성
-            if start_v and end_v: # 범위 검색 (예: 1-22)
-                sql = f"SELECT verse, content FROM {target_table} WHERE book=? AND chapter=? AND verse BETWEEN ? AND ? ORDER BY verse ASC"
-                cursor.execute(sql, (search_book, chapter, int(start_v), int(end_v)))
-            elif start_v: # 시작절만 있는 경우 (예: 1절만)
-                sql = f"SELECT verse, content FROM {target_table} WHERE book=? AND chapter=? AND verse=? ORDER BY verse ASC"
-                cursor.execute(sql, (search_book, chapter, int(start_v)))
-            else: # 장 전체 (예: 잠언 14장)
-                sql = f"SELECT verse, content FROM {target_table} WHERE book=? AND chapter=? ORDER BY verse ASC"
-                cursor.execute(sql, (search_book, chapter))
-            
-            rows = cursor.fetchall()
-            if not rows: return None
+    return get_resolver().get_qt_text(citation, lang_code)
+
+def get_range_text(citation, lang_code='KO'):
+    """장/책을 넘는 범위('행26-롬2', '롬13-고전1')의 본문"""
+    return get_resolver().get_range_text(citation, lang_code)
+
+def resolve_monthly_plan(plan, langs=('KO', 'EN', 'MN')):
+    """load_monthly_plan 결과 전체를 한 번에 해석: {day: {lang: {'qt'|'ps'|'pr': 본문 또는 None}}}"""
+    return get_resolver().resolve_month(plan, langs)
+
+# 텔레그램 메시지 최대 길이 (UTF-16 코드 단위 기준)
+TELEGRAM_TEXT_LIMIT = 4096
+
+def utf16_len(text):
+    """텔레그램 기준 길이 (UTF-16 코드 단위: 이모지 등 BMP 밖 문자는 2)"""
+    return len(text.encode('utf-16-le')) // 2
+
+def _hard_split(line, limit):
+    """limit 보다 긴 한 줄(절)을 UTF-16 길이 기준으로 강제 분할 (가능하면 공백에서).
+    공백뿐인 조각은 내보내지 않음 (텔레그램이 빈 메시지를 거부)"""
+    start = 0
+    while utf16_len(line[start:]) > limit:
+        end, size = start, 0
+        while size + (2 if ord(line[end]) > 0xFFFF else 1) <= limit:
+            size += 2 if ord(line[end]) > 0xFFFF else 1
+            end += 1
+        space = line.rfind(' ', start + 1, end)
+        if space != -1:
+            end = space
+        if line[start:end].strip():
+            yield line[start:end]
+        start = end
+        while start < len(line) and line[start] == ' ':
+            start += 1
+    if line[start:].strip():
+        yield line[start:]
+
+def _next_content_line(text, pos):
+    """pos 부터 공백뿐인 줄을 건너뛴 첫 줄의 시작 위치 (없으면 len(text))"""
+    n = len(text)
+    while pos < n:
+        nl = text.find('\n', pos)
+        end = n if nl == -1 else nl
+        if not text[pos:end].isspace() and end > pos:
+            return pos
+        pos = end + 1
+    return n
+
+def iter_telegram_chunks(text, limit=TELEGRAM_TEXT_LIMIT):
+    """본문을 텔레그램 길이(UTF-16) 이하 조각으로 나눠 순서대로 yield.
+
+    텍스트를 한 번만 훑으며 줄(= 절) 경계에서만 자르므로 절 중간이 잘리지 않는다.
+    조각 앞뒤의 빈 줄은 버리고, 공백뿐인 조각은 내보내지 않는다. 한 절이 limit 보다 긴 경우에만 그 절을 강제로 나눈다.
+    """
+    if not text: return
+    n = len(text)
+    # BMP 문자만 있으면 문자 수 = UTF-16 길이. 아니면 후보 조각의 UTF-16 초과분만큼 창을 줄여 다시 찾음
+    bmp_only = utf16_len(text) == n
+    pos = _next_content_line(text, 0)
+    while pos < n:
+        if n - pos <= limit and (bmp_only or utf16_len(text[pos:]) <= limit):
+            if text[pos:].strip():
+                yield text[pos:].rstrip()
+            return
+        window = limit
+        cut = text.rfind('\n', pos, pos + window + 1)
+        while not bmp_only and cut > pos:
+            excess = utf16_len(text[pos:cut]) - limit
+            if excess <= 0: break
+            window -= excess
+            cut = text.rfind('\n', pos, pos + window + 1)
+        if cut <= pos:
+            # 첫 줄(절) 하나가 limit 보다 김
+            nl = text.find('\n', pos)
+            end = n if nl == -1 else nl
+            yield from _hard_split(text[pos:end].rstrip(), limit)
+            cut = end
+        elif text[pos:cut].strip():
+            yield text[pos:cut].rstrip()
+        pos = _next_content_line(text, cut + 1)
 
-            # 4. 결과 포맷팅
-            ver_name = META_INFO[lang_code]['ver']
-            # 표시용 범위 문자열 (예: 8:1-22)
-            range_str = f"{chapter}"
-            if start_v: range_str += f":{start_v}"
-            if end_v: range_str += f"-{end_v}"
-
-            lines = [f"({search_book} {range_str} / {ver_name})"]
-            for v, c in rows:
-                lines.append(f"{v}. {c}")
-            
-            return "\n".join(lines)
-
-    except Exception as e:
-        print(f"⚠️ QT Error ({lang_code}): {e}")
-        return None
-
-def split_text_for_telegram(text, limit=4000):
-    if not text: return []
-    if len(text) <= limit: return [text]
-    parts = []
-    while len(text) > limit:
-        split_at = text.rfind('\n', 0, limit)
-        if split_at == -1: split_at = limit
-        parts.append(text[:split_at])
-        text = text[split_at:].strip()
-    if text: parts.append(text)
-    return parts
\ No newline at end of file
+def split_text_for_telegram(text, limit=TELEGRAM_TEXT_LIMIT):
+    """iter_telegram_chunks 의 리스트 버전 (기존 호출부 호환용)"""
+    return list(iter_telegram_chunks(text, limit))
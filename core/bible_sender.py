@@ -1,168 +1,384 @@
-import json
-import os
 import asyncio
-import re
-from datetime import datetime, timedelta
-from telegram import Bot
-from telegram.request import HTTPXRequest
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 
-# [필수] bible_scripture_resolver.py가 같은 폴더에 있어야 합니다.
-from core.bible_scripture_resolver import get_chapter_text, get_qt_text, split_text_for_telegram, translate_citation
+# 메시지 텍스트는 core.message_render 로 렌더링되어 core.message_cache 에 한 달 단위로 캐시됨
+from core.delivery import GLOBAL_RATE, DeliveryClient
+from core.message_cache import get_day_messages
+from core.message_render import LANGS
+from core.outbox import get_outbox
+from core.plan_store import get_plan_store
+from core.subscribers import get_store
 
 TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
+# ack 가 이만큼 쌓이거나 마지막 기록 후 이 시간(초)이 지나면 발송 기록에 한 번에 씀
+# (그 밖에도 구독자 페이지를 읽을 때마다 씀). 도중에 죽으면 기록 안 된 만큼은 다시 보내질 수 있음
+ACK_BATCH = 200
+ACK_FLUSH_SECONDS = 1.0
 PROXY_URL = os.getenv('TELEGRAM_PROXY_URL')  # socks5://localhost:1080 등
 
 # --- 수신처 설정 ---
-RECIPIENTS = {
-    os.getenv('KO_CHAT_ID'): 'KO',
-    os.getenv('EN_CHAT_ID'): 'EN',
-    os.getenv('MN_CHAT_ID'): 'MN',
-}
-
-# --- 언어별 메시지 템플릿 ---
-translations = {
-    'KO': {
-        'title': "🌟 오늘의 묵상 알림",
-        'qt_label': "📖 [오늘의 QT 본문]",
-        'rd_label': "📚 [성경 읽기 진도]",
-        'ot': "구약", 'nt': "신약", 'ps': "시편", 'pr': "잠언",
-        'unit_ps': "편", 'unit_pr': "장", 'none': "주일(개인독서)",
-        'slogan': "그리스도의 형상을 닮고 그의 형상을 닮게 하라"
-    },
-    'EN': {
-        'title': "🌟 Daily Meditation",
-        'qt_label': "📖 [Today's QT Passage]",
-        'rd_label': "📚 [Bible Reading Plan]",
-        'ot': "OT", 'nt': "NT", 'ps': "Psalms", 'pr': "Proverbs",
-        'unit_ps': "", 'unit_pr': "", 'none': "Sunday (Personal)",
-        'slogan': "Be Like Christ, Make Like Christ."
-    },
-    'MN': {
-        'title': "🌟 Өдрийн бясалгал",
-        'qt_label': "📖 [Өнөөдрийн QT]",
-        'rd_label': "📚 [Библи унших төлөвлөгөө]",
-        'ot': "Хуучин Гэрээ", 'nt': "Шинэ Гэрээ", 'ps': "Дуулал", 'pr': "Сургаалт үгс",
-        'unit_ps': "-р бүлэг", 'unit_pr': "-р бүлэг", 'none': "Ням гараг (Хувийн уншлага)",
-        'slogan': "Христ шиг байж, Христ шиг болгоцгооё." 
-    }
-}
+# 단체방 목록은 data/subscribers.db (core.subscribers). 비어 있으면 KO/EN/MN_CHAT_ID 환경변수로 채워짐
 
-def _create_bot():
-    """프록시 설정을 포함한 Bot 객체 생성"""
-    if PROXY_URL:
+def create_client(bot=None, global_rate=GLOBAL_RATE):
+    """발송 클라이언트 생성 (프록시 설정 포함). bot 을 넘기면 그 Bot 을 감싸기만 함"""
+    if bot is None and PROXY_URL:
         print(f"🌐 프록시 활성화: {PROXY_URL}")
-        return Bot(token=TELEGRAM_TOKEN, request=HTTPXRequest(proxy_url=PROXY_URL))
-    return Bot(token=TELEGRAM_TOKEN)
+    return DeliveryClient(token=TELEGRAM_TOKEN, proxy=PROXY_URL, bot=bot, global_rate=global_rate)
 
-def load_monthly_plan(year, month):
-    filename = f"{int(year):04d}_{int(month):02d}.json"
-    file_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'plans', filename)
-    if os.path.exists(file_path):
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
-
-def format_summary(row, lang_code, date_str):
-    """요약 메시지를 깔끔한 문자열로 포맷팅 (줄바꿈 버그 수정 버전)"""
-    lang_pack = translations.get(lang_code, translations['KO'])
-    raw_nt, raw_ot, raw_ps, raw_pr, raw_qt = (row + [""] * 5)[:5]
-    
-    qt_display = translate_citation(raw_qt, lang_code)
-    ot_display = translate_citation(raw_ot, lang_code)
-    nt_display = translate_citation(raw_nt, lang_code)
-    ps_display = translate_citation(raw_ps, lang_code)
-    pr_display = translate_citation(raw_pr, lang_code)
-
-    summary_lines = [
-        f"{lang_pack['title']} ({date_str})\n",
-        f"{lang_pack['qt_label']}\n👉 {qt_display}\n",
-        f"{lang_pack['rd_label']}"
-    ]
-    summary_lines.append(f"▫️ {lang_pack['nt']}: {nt_display if raw_nt else lang_pack['none']}")
-    summary_lines.append(f"▫️ {lang_pack['ot']}: {ot_display if raw_ot else lang_pack['none']}")
-    summary_lines.append(f"▫️ {lang_pack['ps']}: {ps_display}{lang_pack['unit_ps']}")
-    summary_lines.append(f"▫️ {lang_pack['pr']}: {pr_display}{lang_pack['unit_pr']}\n")
-    summary_lines.append(f"━━━━━━━━━━━━━━━\n\"{lang_pack['slogan']}\"")
-    
-    return "\n".join(summary_lines)
-
-async def send_only_summaries(chat_id, kst_now):
-    """사용자가 요청한 ID로 3개 국어 요약본만 발송"""
-    if not TELEGRAM_TOKEN: return
-    bot = _create_bot()
-    day_str = str(kst_now.day)
-    plan = load_monthly_plan(kst_now.year, kst_now.month)
-    
-    if day_str not in plan: 
-        print(f"ℹ️ [요약본] 데이터 없음: {kst_now.year}년 {kst_now.month}월 {day_str}일")
+@asynccontextmanager
+async def _using_client(client):
+    """넘겨받은 client 는 그대로, 없으면 이번 호출 동안만 쓸 client 를 열고 닫음"""
+    if client is not None:
+        yield client
         return
-    row = plan[day_str]
-    date_display = kst_now.strftime('%Y/%m/%d')
+    async with create_client() as own_client:
+        yield own_client
+
+class SendResult:
+    """발송 결과 (채팅방·언어/요약 단위 건수). bool 로는 성공 여부 (성공한 전송이 있거나 모두 이미 전송된 상태)"""
+    __slots__ = ('ok', 'sent', 'skipped', 'failed')
+
+    def __init__(self, ok=False, sent=0, skipped=0, failed=0):
+        self.ok = ok
+        self.sent = sent
+        self.skipped = skipped
+        self.failed = failed
+
+    def __bool__(self):
+        return self.ok
+
+    @classmethod
+    def from_report(cls, report, ok):
+        return cls(ok, sum(report['sent'].values()), report['skipped'], len(report['failures']))
+
+    @property
+    def all_skipped(self):
+        """보낼 것이 모두 오늘 이미 전송돼 아무것도 보내지 않음"""
+        return self.skipped > 0 and self.sent == 0 and self.failed == 0
+
+    def describe(self):
+        return f"전송 {self.sent}건, 이미 전송돼 건너뜀 {self.skipped}건, 실패 {self.failed}건"
+
+def load_monthly_plan(year, month):
+    """{'1': PlanDay, ...} 날짜별 플랜 (core.plan_format.PlanDay: 칸 이름 nt/ot/ps/pr/qt + 인용 구간).
+    core.plan_store 색인에서 읽고, 원본 JSON 이 바뀌면 자동 갱신. 플랜이 없으면 {}"""
+    return get_plan_store().get_month(year, month) or {}
 
-    for lang in ['KO', 'EN', 'MN']:
-        msg = format_summary(row, lang, date_display)
-        await bot.send_message(chat_id=chat_id, text=msg)
-        await asyncio.sleep(0.5)
+def _plan_pending(jobs, send_date, generation, starts):
+    """발송 기록(core.outbox)을 보고 jobs 에서 이미 전송된 메시지를 빼고 남은 것을 'queued' 로 기록.
+    starts 에 (chat_id, label) 별 시작 메시지 번호를 채움.
+    반환: (보낼 작업, 이미 끝나 건너뛴 작업 수, 중간부터 이어 보낼 작업 수)"""
+    outbox = get_outbox()
+    progress = outbox.progress(send_date, generation, {chat_id for chat_id, _, _ in jobs})
+    pending = []
+    skipped = resumed = 0
+    for chat_id, label, messages in jobs:
+        start = progress.get((chat_id, label), 0)
+        if start >= len(messages):
+            skipped += 1
+            continue
+        resumed += start > 0
+        starts[(chat_id, label)] = start
+        pending.append((chat_id, label, messages[start:]))
+    if pending:
+        outbox.queued(send_date, generation, [
+            (chat_id, label, starts[(chat_id, label)] + index)
+            for chat_id, label, messages in pending for index in range(len(messages))
+        ])
+    return pending, skipped, resumed
+
+class _AckBuffer:
+    """전송된 메시지의 'acked' 를 모아 두었다가 발송 기록에 묶음으로 남김.
+    on_sent 는 이벤트 루프에서 불리므로 목록에 붙이기만 하고, SQLite 쓰기(flush)는
+    구독자 페이지를 읽는 생산자 스레드나 asyncio.to_thread 에서 한다. 끝나면 반드시 close()"""
+
+    def __init__(self, send_date, generation, starts):
+        self.outbox = get_outbox()
+        self.send_date = send_date
+        self.generation = generation
+        self.starts = starts
+        self._entries = []
+        self._lock = threading.Lock()
+        self._flushing = None
+        self._last_flush = time.monotonic()
+
+    def on_sent(self, chat_id, label, index, message):
+        with self._lock:
+            self._entries.append((chat_id, label, self.starts[(chat_id, label)] + index,
+                                  getattr(message, 'message_id', None)))
+            due = (len(self._entries) >= ACK_BATCH
+                   or time.monotonic() - self._last_flush >= ACK_FLUSH_SECONDS)
+        if due and self._flushing is None:
+            self._flushing = asyncio.get_running_loop().create_task(asyncio.to_thread(self.flush))
+            self._flushing.add_done_callback(self._flushed)
+
+    def _flushed(self, task):
+        self._flushing = None
+
+    def flush(self):
+        """(스레드에서 호출) 모인 ack 를 한 트랜잭션으로 기록. 실패하면 다음 flush 때 다시 시도"""
+        with self._lock:
+            entries, self._entries = self._entries, []
+            self._last_flush = time.monotonic()
+        if not entries:
+            return
+        try:
+            self.outbox.acked_many(self.send_date, self.generation, entries)
+        except sqlite3.Error as e:
+            print(f"⚠️ 발송 기록(ack {len(entries)}건) 저장 실패, 다음에 다시 시도: {e}")
+            with self._lock:
+                self._entries[:0] = entries
+
+    async def close(self):
+        if self._flushing is not None:
+            await asyncio.gather(self._flushing, return_exceptions=True)
+        await asyncio.to_thread(self.flush)
+
+async def send_only_summaries(chat_id, kst_now, client=None, force=False):
+    """사용자가 요청한 ID로 3개 국어 요약본만 발송 (사전 렌더링 캐시 사용).
+    client 를 넘기면 그 연결 풀/속도 제한을 재사용 (run, 상주 데몬, 관리 봇).
+    같은 날 이미 보냈으면 보내지 않음 (force 면 다시 발송). 반환: SendResult"""
+    if not TELEGRAM_TOKEN: return SendResult()
+    day = await asyncio.to_thread(get_day_messages, kst_now)
+
+    if day is None:
+        print(f"ℹ️ [요약본] 데이터 없음: {kst_now.year}년 {kst_now.month}월 {kst_now.day}일")
+        return SendResult()
+
+    send_date = kst_now.date().isoformat()
+    generation = get_outbox().begin(send_date, force=force)
+    job = (int(chat_id), 'summary', [day[lang]['summary'] for lang in LANGS])
+    starts = {}
+    pending, skipped, _ = _plan_pending([job], send_date, generation, starts)
+    if skipped:
+        print(f"⏭️ 개인 대화방({chat_id}) 요약본은 오늘 이미 발송됨 (다시 보내려면 --force)")
+        return SendResult(True, skipped=skipped)
+    acks = _AckBuffer(send_date, generation, starts)
+    try:
+        async with _using_client(client) as client:
+            results = await client.engine.deliver(pending, on_sent=acks.on_sent)
+    except Exception as e:
+        print(f"❌ 개인 대화방({chat_id}) 요약본 발송 실패: {e}")
+        return SendResult(failed=1)
+    finally:
+        await acks.close()
+    error = results[0][2]
+    if error is not None:
+        print(f"❌ 개인 대화방({chat_id}) 요약본 발송 실패: {error}")
+        return SendResult(failed=1)
     print(f"✅ 개인 대화방({chat_id}) 요약본 발송 완료")
+    return SendResult(True, sent=1)
 
-async def broadcast_messages(kst_now):
-    if not TELEGRAM_TOKEN:
-        print("❌ 설정 오류: TELEGRAM_TOKEN 없음")
-        return False
-
-    bot = _create_bot()
-    current_year = kst_now.year
-    current_month = kst_now.month
-    day_str = str(kst_now.day)
-    
-    plan = load_monthly_plan(current_year, current_month)
-    if day_str not in plan:
-        print(f"ℹ️ [단체방] 데이터 없음: {current_year}년 {current_month}월 {day_str}일")
-        return False
-
-    row = plan[day_str]
-    raw_nt, raw_ot, raw_ps, raw_pr, raw_qt = (row + [""] * 5)[:5]
-
-    print(f"🚀 {kst_now.strftime('%Y-%m-%d')} (KST) 발송 시작...")
-
-    any_success = False
-    for chat_id, lang_info in RECIPIENTS.items():
-        if not chat_id: continue 
-        target_langs = lang_info if isinstance(lang_info, list) else [lang_info]
-
-        for lang_code in target_langs:
-            try:
-                # 1. 요약 메시지 전송
-                summary_msg = format_summary(row, lang_code, kst_now.strftime('%Y/%m/%d'))
-                await bot.send_message(chat_id=chat_id, text=summary_msg)
-                await asyncio.sleep(0.5)
-
-                # 2. 본문 전송 (QT -> 시편 -> 잠언 순)
-                qt_cite = raw_qt
-                if qt_cite and re.match(r"^\d", qt_cite):
-                    qt_cite = f"마 {qt_cite}"
-                
-                qt_text = get_qt_text(qt_cite, lang_code)
-                if qt_text:
-                    for part in split_text_for_telegram(qt_text):
-                        await bot.send_message(chat_id=chat_id, text=part)
-                        await asyncio.sleep(0.3)
-
-                for book_abbr, raw_chap in [('시', raw_ps), ('잠', raw_pr)]:
-                    if not raw_chap: continue
-                    text = get_chapter_text(book_abbr, raw_chap, lang_code)
-                    if text:
-                        for part in split_text_for_telegram(text):
-                            await bot.send_message(chat_id=chat_id, text=part)
-                            await asyncio.sleep(0.3)
-
-                print(f"   ✅ [{lang_code}] 전송 성공 (Chat: {chat_id})")
-                any_success = True
-            except Exception as e:
-                print(f"   ❌ [{lang_code}] 전송 실패: {e}")
+def shard_of(chat_id, shards):
+    """chat_id 의 샤드 번호. crc32 라서 프로세스/실행이 달라도 같은 채팅방은 항상 같은 샤드"""
+    return zlib.crc32(str(int(chat_id)).encode()) % shards
 
+async def _deliver_to_subscribers(day, client, send_date, generation, shard=None):
+    """구독 채팅방 전체(shard=(k, n) 이면 k번 샤드의 채팅방만)에 발송하고 집계를 반환.
+    발송 기록에 이미 전송된 것으로 남은 메시지는 건너뜀"""
+    # 채팅방별 (요약 → QT → 시편 → 잠언) 작업. 채팅방끼리는 동시에, 채팅방 안에서는 순서대로 발송
+    # 요약만 받는 채팅방은 요약 메시지 하나
+    def page_jobs(page):
+        jobs = []
+        for chat_id, delivery, langs in page:
+            if shard is not None and shard_of(chat_id, shard[1]) != shard[0]:
+                continue
+            for lang_code in sorted(langs, key=LANGS.index):
+                messages = day[lang_code]['messages'] if delivery == 'full' else [day[lang_code]['summary']]
+                jobs.append((chat_id, lang_code, messages))
+        return jobs
+
+    report = {
+        'sent': {lang: 0 for lang in LANGS},
+        'total': {lang: 0 for lang in LANGS},
+        'failures': [],
+        'skipped': 0,
+        'resumed': 0,
+    }
+    starts = {}
+    acks = _AckBuffer(send_date, generation, starts)
+
+    def chat_items():
+        # (스레드 풀에서 실행) 구독자 페이지 읽기 → 그사이 모인 ack 기록 → 발송 기록 대조/queued 기록 → 채팅방별 작업
+        for page in get_store().iter_pages():
+            acks.flush()
+            pending, skipped, resumed = _plan_pending(page_jobs(page), send_date, generation, starts)
+            report['skipped'] += skipped
+            report['resumed'] += resumed
+            by_chat = {}
+            for chat_id, label, messages in pending:
+                by_chat.setdefault(chat_id, []).append((label, messages))
+            yield from by_chat.items()
+
+    started = time.monotonic()
+    stats_before = dict(client.engine.stats)
+    # 작업을 만드는 쪽(DB 조회)과 보내는 쪽(네트워크)이 대기열을 사이에 두고 겹쳐 진행
+    try:
+        results = await client.engine.deliver_pipeline(chat_items(), on_sent=acks.on_sent)
+    finally:
+        await acks.close()
+    for chat_id, lang_code, error in results:
+        report['total'][lang_code] += 1
+        if error is None:
+            report['sent'][lang_code] += 1
+        else:
+            # 워커 프로세스에서 돌려받을 수 있도록 예외는 문자열로
+            report['failures'].append((chat_id, lang_code, str(error)))
+    report['stats'] = {k: v - stats_before[k] for k, v in client.engine.stats.items()}
+    report['elapsed'] = time.monotonic() - started
+    return report
+
+def _print_report(report):
+    """언어별 성공 수, 실패한 채팅방, 재시도 횟수 출력.
+    성공한 전송이 있거나 모두 이미 전송된 상태(재실행)면 True"""
+    sent, total, stats = report['sent'], report['total'], report['stats']
+    for lang_code in LANGS:
+        if total[lang_code]:
+            print(f"   ✅ [{lang_code}] {sent[lang_code]}/{total[lang_code]} 채팅방 전송 성공")
+    for chat_id, lang_code, error in report['failures']:
+        print(f"   ❌ [{lang_code}] 전송 실패 (Chat: {chat_id}): {error}")
+    if report['resumed']:
+        print(f"   ↪️ 중단된 발송 {report['resumed']}건은 전송되지 않은 메시지부터 이어서 발송")
+    if report['skipped']:
+        print(f"   ⏭️ 오늘 이미 전송 완료된 {report['skipped']}건은 건너뜀 (다시 보내려면 --force)")
+    elif not any(total.values()):
+        print("⚠️⚠️ 경고: 발송 대상 채팅방이 0개라 아무에게도 보내지 않았습니다! "
+              "(python tools/manage_subscribers.py add ... 또는 KO/EN/MN_CHAT_ID 환경변수 확인)")
+    if stats['throttled'] or stats['retried']:
+        print(f"   ↻ 전송 {stats['sent']}건 (속도 제한 {stats['throttled']}회, 네트워크 재시도 {stats['retried']}회)")
+    return any(sent.values()) or (report['skipped'] > 0 and not report['failures'])
+
+def _print_finish(any_success):
     if any_success:
         print("🏁 전체 발송 완료")
     else:
         print("🏁 전체 발송 실패 (성공한 전송 없음)")
-    return any_success
+
+async def _load_day_for_broadcast(kst_now):
+    """발송 전 공통 확인 (토큰, 그날 메시지). 발송할 수 없으면 None"""
+    if not TELEGRAM_TOKEN:
+        print("❌ 설정 오류: TELEGRAM_TOKEN 없음")
+        return None
+
+    # 요약 + QT/시편/잠언 본문 메시지는 캐시에서 그대로 읽음 (없거나 입력이 바뀌었으면 자동 재렌더링)
+    # 재렌더링은 한 달치라 오래 걸릴 수 있으므로 이벤트 루프 밖(스레드)에서
+    day = await asyncio.to_thread(get_day_messages, kst_now)
+    if day is None:
+        print(f"ℹ️ [단체방] 데이터 없음: {kst_now.year}년 {kst_now.month}월 {kst_now.day}일")
+    return day
+
+async def broadcast_messages(kst_now, client=None, force=False):
+    """구독 채팅방 전체에 그날 메시지 발송. 같은 날 다시 실행하면 보내지 못한 메시지만 발송 (force 면 처음부터).
+    반환: SendResult"""
+    day = await _load_day_for_broadcast(kst_now)
+    if day is None:
+        return SendResult()
+
+    send_date = kst_now.date().isoformat()
+    generation = get_outbox().begin(send_date, force=force)
+    print(f"🚀 {send_date} (KST) 발송 시작...")
+    try:
+        async with _using_client(client) as client:
+            report = await _deliver_to_subscribers(day, client, send_date, generation)
+    except Exception as e:
+        # 채팅방별 오류는 deliver 가 처리하므로 여기로 오는 것은 봇 초기화(연결/토큰) 실패
+        print(f"❌ 텔레그램 연결 실패: {e}")
+        return SendResult()
+
+    any_success = _print_report(report)
+    _print_finish(any_success)
+    return SendResult.from_report(report, any_success)
+
+# --- 샤드 발송: 구독자가 아주 많을 때 여러 프로세스로 나눠 발송 ---
+
+async def _broadcast_shard(kst_now, shard, shards, generation):
+    """샤드 하나 발송. 자기 Bot/연결 풀과 전체 속도 한도의 1/shards 를 씀"""
+    try:
+        day = await asyncio.to_thread(get_day_messages, kst_now)
+        async with create_client(global_rate=GLOBAL_RATE / shards) as client:
+            report = await _deliver_to_subscribers(
+                day, client, kst_now.date().isoformat(), generation, shard=(shard, shards)
+            )
+    except Exception as e:
+        return {'shard': shard, 'error': str(e)}
+    report['shard'] = shard
+    return report
+
+def _run_shard(kst_now, shard, shards, generation):
+    """워커 프로세스 진입점"""
+    # 구독자 DB 는 조정 프로세스가 이미 열어 채웠으므로 워커끼리 동시에 환경변수로 채우지 않음
+    get_store(seed=False)
+    return asyncio.run(_broadcast_shard(kst_now, shard, shards, generation))
+
+def _merge_reports(reports):
+    merged = {
+        'sent': {lang: 0 for lang in LANGS},
+        'total': {lang: 0 for lang in LANGS},
+        'failures': [],
+        'stats': {'sent': 0, 'throttled': 0, 'retried': 0},
+        'skipped': 0,
+        'resumed': 0,
+    }
+    for report in reports:
+        if 'error' in report:
+            continue
+        for key in ('sent', 'total', 'stats'):
+            for k, v in report[key].items():
+                merged[key][k] += v
+        merged['failures'].extend(report['failures'])
+        merged['skipped'] += report['skipped']
+        merged['resumed'] += report['resumed']
+    return merged
+
+async def broadcast_sharded(kst_now, shards, only_shard=None, force=False):
+    """구독 채팅방을 chat_id 해시로 shards 개로 나눠 샤드마다 워커 프로세스 하나로 발송하고 결과를 합산.
+    only_shard 를 주면 그 샤드만 이 프로세스에서 발송 (여러 서버/서비스에 나눠 돌릴 때). 반환: SendResult"""
+    if shards < 1 or (only_shard is not None and not 0 <= only_shard < shards):
+        print(f"❌ 샤드 설정 오류: --shards {shards} --shard {only_shard}")
+        return SendResult()
+    # 워커들이 디스크 캐시를 바로 읽도록 여기서 먼저 렌더링/검증
+    day = await _load_day_for_broadcast(kst_now)
+    if day is None:
+        return SendResult()
+    # 발송 기록 generation 은 여기서 한 번 정해 모든 워커가 같은 것을 씀
+    generation = get_outbox().begin(kst_now.date().isoformat(), force=force)
+    # 구독자 DB 도 여기서 한 번 열어 (비어 있으면) 환경변수로 채워 둠 → 워커는 채우지 않고 읽기만
+    await asyncio.to_thread(get_store().open)
+
+    if only_shard is None:
+        print(f"🚀 {kst_now.strftime('%Y-%m-%d')} (KST) 발송 시작... (워커 {shards}개, 각 초당 {GLOBAL_RATE / shards:.1f}건)")
+        loop = asyncio.get_running_loop()
+        # 이벤트 루프가 도는 프로세스를 fork 하지 않도록 spawn 사용
+        with ProcessPoolExecutor(max_workers=shards, mp_context=multiprocessing.get_context('spawn')) as pool:
+            reports = await asyncio.gather(*(
+                loop.run_in_executor(pool, _run_shard, kst_now, k, shards, generation) for k in range(shards)
+            ))
+    else:
+        print(f"🚀 {kst_now.strftime('%Y-%m-%d')} (KST) 발송 시작... (샤드 {only_shard}/{shards}, 초당 {GLOBAL_RATE / shards:.1f}건)")
+        reports = [await _broadcast_shard(kst_now, only_shard, shards, generation)]
+
+    for report in reports:
+        if 'error' in report:
+            print(f"   🧩 샤드 {report['shard']}: ❌ 텔레그램 연결 실패: {report['error']}")
+            continue
+        chats = sum(report['total'].values())
+        ok = sum(report['sent'].values())
+        sent, elapsed = report['stats']['sent'], report['elapsed']
+        rate = sent / elapsed if elapsed > 0 else 0.0
+        print(f"   🧩 샤드 {report['shard']}: 채팅방 {ok}/{chats} 성공, 메시지 {sent}건, "
+              f"{elapsed:.1f}초 ({rate:.1f}건/초), 실패 {len(report['failures'])}건")
+
+    if all('error' in report for report in reports):
+        _print_finish(False)
+        return SendResult()
+    merged = _merge_reports(reports)
+    any_success = _print_report(merged)
+    _print_finish(any_success)
+    return SendResult.from_report(merged, any_success)
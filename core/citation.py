@@ -0,0 +1,183 @@
+"""성경 인용 문자열 파서.
+
+'삼상 17:22-40', '시 1-3', '행26-롬2', '시 119-65-88', 책 이름이 빠진 '1: 18-25' 같은 문자열을
+__slots__ Citation 값(책 번호, 장/절 범위)으로 한 번만 파싱한다. 결과는 크기 제한 LRU 로 메모이즈되므로
+같은 인용은 프로세스당 한 번만 정규식을 탄다. (반환된 Citation 은 공유 객체이므로 수정하지 않는다.)
+"""
+import re
+from functools import lru_cache
+
+# --- 성경 약어 매핑 (이곳에서 통합 관리, core.bible_scripture_resolver 에서도 re-export) ---
+BIBLE_MAP = {
+    '창': {'EN': 'Gen', 'MN': 'Эхл'}, '출': {'EN': 'Ex', 'MN': 'Гэт'},
+    '레': {'EN': 'Lev', 'MN': 'Лев'}, '민': {'EN': 'Num', 'MN': 'Тоо'},
+    '신': {'EN': 'Deut', 'MN': 'Дэд'}, '수': {'EN': 'Josh', 'MN': 'Иош'},
+    '삿': {'EN': 'Judg', 'MN': 'Шүү'}, '룻': {'EN': 'Ruth', 'MN': 'Рут'},
+    '삼상': {'EN': '1Sam', 'MN': '1Сам'}, '삼하': {'EN': '2Sam', 'MN': '2Сам'},
+    '왕상': {'EN': '1Kin', 'MN': '1Хаа'}, '왕하': {'EN': '2Kin', 'MN': '2Хаа'},
+    '대상': {'EN': '1Chr', 'MN': '1Шас'}, '대하': {'EN': '2Chr', 'MN': '2Шас'},
+    '스': {'EN': 'Ezra', 'MN': 'Езр'}, '느': {'EN': 'Neh', 'MN': 'Нех'},
+    '에': {'EN': 'Esther', 'MN': 'Ест'}, '욥': {'EN': 'Job', 'MN': 'Иов'},
+    '시': {'EN': 'Ps', 'MN': 'Дуу'}, '잠': {'EN': 'Prov', 'MN': 'Сур'},
+    '전': {'EN': 'Eccles', 'MN': 'Ном'}, '아': {'EN': 'Song', 'MN': 'Доо'},
+    '사': {'EN': 'Is', 'MN': 'Иса'}, '렘': {'EN': 'Jer', 'MN': 'Иер'},
+    '애': {'EN': 'Lam', 'MN': 'Гаш'}, '겔': {'EN': 'Ezek', 'MN': 'Езе'},
+    '단': {'EN': 'Dan', 'MN': 'Дан'}, '호': {'EN': 'Hos', 'MN': 'Хос'},
+    '욜': {'EN': 'Joel', 'MN': 'Иое'}, '암': {'EN': 'Amos', 'MN': 'Амо'},
+    '옵': {'EN': 'Obad', 'MN': 'Оба'}, '욘': {'EN': 'Jonah', 'MN': 'Ион'},
+    '미': {'EN': 'Mic', 'MN': 'Мик'}, '나': {'EN': 'Nah', 'MN': 'Нах'},
+    '합': {'EN': 'Hab', 'MN': 'Хаб'}, '습': {'EN': 'Zeph', 'MN': 'Зеф'},
+    '학': {'EN': 'Hag', 'MN': 'Хаг'}, '슥': {'EN': 'Zech', 'MN': 'Зех'},
+    '말': {'EN': 'Mal', 'MN': 'Мал'},
+    '마': {'EN': 'Matt', 'MN': 'Мат'}, '막': {'EN': 'Mark', 'MN': 'Марк'},
+    '눅': {'EN': 'Luke', 'MN': 'Лук'}, '요': {'EN': 'John', 'MN': 'Иох'},
+    '행': {'EN': 'Acts', 'MN': 'Үйл'}, '롬': {'EN': 'Rom', 'MN': 'Ром'},
+    '고전': {'EN': '1Cor', 'MN': '1Кор'}, '고후': {'EN': '2Cor', 'MN': '2Кор'},
+    '갈': {'EN': 'Gal', 'MN': 'Гал'}, '엡': {'EN': 'Eph', 'MN': 'Еф'},
+    '빌': {'EN': 'Phil', 'MN': 'Фил'}, '골': {'EN': 'Col', 'MN': 'Кол'},
+    '살전': {'EN': '1Thess', 'MN': '1Тес'}, '살후': {'EN': '2Thess', 'MN': '2Тес'},
+    '딤전': {'EN': '1Tim', 'MN': '1Тим'}, '딤후': {'EN': '2Tim', 'MN': '2Тим'},
+    '딛': {'EN': 'Titus', 'MN': 'Тит'}, '몬': {'EN': 'Philem', 'MN': 'Филм'},
+    '히': {'EN': 'Heb', 'MN': 'Евр'}, '약': {'EN': 'James', 'MN': 'Иак'},
+    '벧전': {'EN': '1Pet', 'MN': '1Пет'}, '벧후': {'EN': '2Pet', 'MN': '2Пет'},
+    '요일': {'EN': '1John', 'MN': '1Иох'}, '요이': {'EN': '2John', 'MN': '2Иох'},
+    '요삼': {'EN': '3John', 'MN': '3Иох'}, '유': {'EN': 'Jude', 'MN': 'Иуд'},
+    '계': {'EN': 'Rev', 'MN': 'Илч'}
+}
+
+# 정경 순서 책 번호 (창=1 ... 계=66). BIBLE_MAP 의 등록 순서가 곧 정경 순서
+BOOK_IDS = {book_ko: i for i, book_ko in enumerate(BIBLE_MAP, 1)}
+BOOKS_BY_ID = {i: book_ko for book_ko, i in BOOK_IDS.items()}
+
+# DB 에 저장된 책 이름(KO 약어 / EN / MN) -> 책 번호
+_BOOK_ID_BY_NAME = dict(BOOK_IDS)
+for _book_ko, _names in BIBLE_MAP.items():
+    for _name in _names.values():
+        _BOOK_ID_BY_NAME.setdefault(_name, BOOK_IDS[_book_ko])
+
+# 앞쪽 한글 책 이름과 나머지 분리 (표시용 번역도 이 분리를 그대로 사용)
+BOOK_PATTERN = re.compile(r"([가-힣]+)\s*(.*)")
+
+# 책 이름 뒤의 장/절 범위: 장[:절][-[책]장[:절]][-절]
+#   마지막 '-절' 은 '시 119-65-88' (= 119편 65-88절) 표기용
+SPAN_PATTERN = re.compile(
+    r"(\d+)(?:\s*[:장]\s*(\d+))?"
+    r"(?:\s*[-~]\s*(?:([가-힣]+)\s*)?(\d+)(?:\s*[:장]\s*(\d+))?)?"
+    r"(?:\s*[-~]\s*(\d+))?"
+)
+
+
+def book_id_of(name):
+    """DB 책 이름(어느 언어든) -> 정경 순서 번호. 모르면 None"""
+    return _BOOK_ID_BY_NAME.get(name)
+
+
+def book_name(book_ko, lang_code):
+    """한글 약어 -> 해당 언어 DB 책 이름"""
+    if lang_code == 'KO' or book_ko not in BIBLE_MAP: return book_ko
+    return BIBLE_MAP[book_ko].get(lang_code, book_ko)
+
+
+class Citation:
+    """파싱된 인용 하나. 범위를 읽지 못하면 start_chapter 가 None.
+
+    - book / rest     : 앞쪽 한글 책 이름(없으면 None)과 나머지 원문 (표시용)
+    - book_id         : 정경 순서 번호 (BIBLE_MAP 에 없는 책이면 None)
+    - start_*, end_*  : 장/절 범위. 절이 없으면 None (= 장 처음/끝)
+    """
+    __slots__ = ('raw', 'book', 'rest', 'book_id', 'start_chapter', 'start_verse',
+                 'end_book', 'end_chapter', 'end_verse')
+
+    def __init__(self, raw, book, rest, start_chapter=None, start_verse=None,
+                 end_book=None, end_chapter=None, end_verse=None):
+        self.raw = raw
+        self.book = book
+        self.rest = rest
+        self.book_id = BOOK_IDS.get(book)
+        self.start_chapter = start_chapter
+        self.start_verse = start_verse
+        self.end_book = end_book or book
+        self.end_chapter = end_chapter if end_chapter is not None else start_chapter
+        self.end_verse = end_verse
+
+    def __repr__(self):
+        return f"Citation({self.raw!r})"
+
+    @property
+    def end_book_id(self):
+        return BOOK_IDS.get(self.end_book)
+
+    @property
+    def is_bare(self):
+        """'1: 18-25' 처럼 책 이름 없이 숫자로 시작하는 인용"""
+        return self.book is None and self.raw[:1].isdigit()
+
+    @property
+    def is_resolvable(self):
+        return self.book_id is not None and self.end_book_id is not None and self.start_chapter is not None
+
+    @property
+    def is_single_chapter(self):
+        return self.end_book == self.book and self.end_chapter == self.start_chapter
+
+    def with_book(self, book):
+        """책 이름이 빠진 인용에 책을 채운 Citation (예: QT '1:18-25' -> '마 1:18-25')"""
+        return parse_citation(f"{book} {self.raw}")
+
+    def display(self, lang_code):
+        """한글 약어(예: 마1-4)를 타 언어(Matt 1-4)로 바꾼 표시용 문자열"""
+        if lang_code == 'KO' or self.book not in BIBLE_MAP: return self.raw
+        return f"{BIBLE_MAP[self.book].get(lang_code, self.book)} {self.rest}".strip()
+
+
+def chapter_citation(book_abbrev, chapter_str):
+    """시편/잠언 칸('시 1-3', '1-3', '119-65-88')을 book_abbrev 책의 Citation 으로.
+
+    책 이름 없이 숫자만 있으면 book_abbrev 책으로 본다. 칸에 다른 책 이름이 적혀 있으면
+    (예: 잠 칸의 '삼상 10:1-27', '시28편') 그 칸을 시/잠으로 바꿔 읽지 않고 해석 불가(is_resolvable False)로 둔다.
+    """
+    cite = parse_citation(str(chapter_str))
+    if cite.book is None:
+        return parse_citation(f"{book_abbrev} {cite.rest}")
+    if cite.book != book_abbrev:
+        return Citation(cite.raw, cite.book, cite.rest)
+    return cite
+
+
+@lru_cache(maxsize=1024)
+def parse_citation(text):
+    """인용 문자열 -> Citation (메모이즈). 빈 문자열/None 이면 None"""
+    if not text: return None
+    match = BOOK_PATTERN.match(text)
+    if match:
+        book, rest = match.groups()
+    else:
+        book, rest = None, text.strip()
+
+    span = SPAN_PATTERN.match(rest)
+    if not span:
+        return Citation(text, book, rest)
+
+    c1, v1, book2, n2, v2, extra = span.groups()
+    c1 = int(c1)
+    v1 = int(v1) if v1 else None
+    if book2 and book2 not in BOOK_IDS:
+        book2, n2, v2, extra = None, None, None, None
+    if n2 is None:
+        # 장 하나 (또는 절 하나)
+        return Citation(text, book, rest, c1, v1, None, c1, v1)
+    n2 = int(n2)
+    if v2:
+        # 장:절-장:절 (다른 책 포함)
+        return Citation(text, book, rest, c1, v1, book2, n2, int(v2))
+    if book2:
+        # 장-책장 (예: 행26-롬2)
+        return Citation(text, book, rest, c1, v1, book2, n2, None)
+    if v1 is not None:
+        # 장:절-절
+        return Citation(text, book, rest, c1, v1, None, c1, n2)
+    if extra:
+        # 장-절-절 (예: 시 119-65-88)
+        return Citation(text, book, rest, c1, n2, None, c1, int(extra))
+    # 장-장
+    return Citation(text, book, rest, c1, None, None, n2, None)
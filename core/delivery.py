@@ -0,0 +1,299 @@
+"""텔레그램 발송 엔진: 채팅방별 동시 발송 + 토큰 버킷 속도 제한.
+
+고정 sleep 대신 텔레그램 제한에 맞춘 토큰 버킷으로 속도를 맞춘다.
+- 전체: 초당 30건
+- 채팅방 하나: 초당 1건 (짧은 연속 전송은 CHAT_BURST 건까지 허용)
+- 그룹/채널(chat_id 음수): 추가로 분당 20건
+채팅방마다 별도 태스크로 보내므로 전체 소요 시간은 가장 느린 채팅방 하나의 시간에 가깝고,
+같은 채팅방 안의 메시지 순서는 그대로 유지된다.
+
+429(RetryAfter) 를 받으면 그 메시지를 버리지 않고 retry_after 동안 해당 채팅방 버킷만 멈춘 뒤
+같은 메시지를 다시 보낸다. 여러 채팅방이 동시에 429 를 받으면 전역 제한으로 보고 전체 버킷을 멈춘다.
+속도는 AIMD 로 조절한다: 429 마다 속도를 절반으로, 성공할 때마다 원래 속도까지 조금씩 회복.
+NetworkError/TimedOut 은 지수 백오프로 재시도하고, BadRequest/Forbidden 등은 바로 실패 처리한다.
+
+DeliveryClient 는 Bot 하나(= HTTP 연결 풀 하나)와 그 위의 DeliveryEngine 을 묶은 비동기 컨텍스트 매니저로,
+run 한 번의 단체방 발송과 개인 요약본 발송이 같은 연결(TLS 세션)과 같은 속도 제한 버킷을 쓰게 한다.
+"""
+import asyncio
+import itertools
+import time
+from datetime import timedelta
+
+import httpx
+from telegram import Bot
+from telegram.error import BadRequest, NetworkError, RetryAfter
+from telegram.request import HTTPXRequest
+
+GLOBAL_RATE = 30.0
+CHAT_RATE = 1.0
+CHAT_BURST = 3
+GROUP_RATE = 20 / 60
+GROUP_BURST = 20
+
+# 429 가 이 수 이상의 채팅방에서 동시에 걸려 있으면 전역 제한으로 판단
+GLOBAL_THROTTLE_CHATS = 2
+MAX_THROTTLE_RETRIES = 10
+MAX_NETWORK_RETRIES = 4
+NETWORK_BACKOFF = 1.0
+MIN_RATE_FACTOR = 0.1
+
+# 연결 풀: 동시에 보내는 채팅방 수만큼이면 충분. keep-alive 는 발송 사이 짧은 공백에도 연결을 유지할 만큼
+POOL_SIZE = 8
+KEEPALIVE_EXPIRY = 120.0
+POOL_TIMEOUT = 10.0
+
+# deliver_pipeline: 동시에 발송하는 채팅방 수, 대기열 길이(채팅방 단위), 스레드에서 한 번에 만들어 오는 채팅방 수
+SENDER_TASKS = 64
+QUEUE_SIZE = 256
+PRODUCE_BATCH = 64
+
+
+class TokenBucket:
+    """초당 rate 개씩 채워지고 최대 capacity 개까지 쌓이는 asyncio 토큰 버킷"""
+
+    def __init__(self, rate, capacity):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now):
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = max(self._updated, now)
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds):
+        """seconds 동안 토큰 지급 중단. 재개 직후 몰아서 보내지 않도록 쌓인 토큰도 비움"""
+        until = time.monotonic() + seconds
+        if until > self._paused_until:
+            self._paused_until = until
+        self._tokens = 0.0
+        self._updated = self._paused_until
+
+    @property
+    def paused(self):
+        return time.monotonic() < self._paused_until
+
+    def slow_down(self):
+        """AIMD 감소: 속도 절반 (원래 속도의 MIN_RATE_FACTOR 아래로는 내리지 않음)"""
+        self.rate = max(self.max_rate * MIN_RATE_FACTOR, self.rate / 2)
+
+    def speed_up(self):
+        """AIMD 증가: 성공 한 번마다 원래 속도의 10% 씩 회복"""
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * 0.1)
+
+
+def is_group_chat(chat_id):
+    return str(chat_id).startswith('-')
+
+
+def retry_after_seconds(error):
+    """RetryAfter.retry_after 는 버전에 따라 int(초) 또는 timedelta"""
+    value = error.retry_after
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return float(value)
+
+
+class DeliveryEngine:
+    """Bot 하나를 감싸 채팅방별 순서를 지키며 여러 채팅방에 동시에 발송"""
+
+    def __init__(self, bot, global_rate=GLOBAL_RATE):
+        self.bot = bot
+        self.global_bucket = TokenBucket(global_rate, max(1, int(global_rate)))
+        self._chat_buckets = {}
+        self.stats = {'sent': 0, 'throttled': 0, 'retried': 0}
+
+    def _buckets_for(self, chat_id):
+        buckets = self._chat_buckets.get(chat_id)
+        if buckets is None:
+            buckets = [TokenBucket(CHAT_RATE, CHAT_BURST)]
+            if is_group_chat(chat_id):
+                buckets.append(TokenBucket(GROUP_RATE, GROUP_BURST))
+            self._chat_buckets[chat_id] = buckets
+        return buckets
+
+    def _on_throttled(self, chat_id, seconds):
+        # 초 단위 버킷만 멈추고 감속. 그룹의 분당 버킷은 실제 할당량 추적용이라 그대로 둠
+        bucket = self._buckets_for(chat_id)[0]
+        bucket.pause(seconds)
+        bucket.slow_down()
+        throttled_chats = sum(
+            1 for buckets in self._chat_buckets.values() if buckets[0].paused
+        )
+        if throttled_chats >= GLOBAL_THROTTLE_CHATS:
+            self.global_bucket.pause(seconds)
+            self.global_bucket.slow_down()
+        print(f"   ⏳ 속도 제한(429): Chat {chat_id} {seconds:g}초 대기 후 재전송 "
+              f"(동시 제한 채팅방 {throttled_chats}개)")
+
+    def _on_success(self, chat_id):
+        self._buckets_for(chat_id)[0].speed_up()
+        self.global_bucket.speed_up()
+
+    async def send(self, chat_id, text):
+        """메시지 하나: 채팅방 버킷 → 전체 버킷 순으로 토큰을 받은 뒤 전송.
+
+        429 는 대기 후 같은 메시지를 다시 보내고(최대 MAX_THROTTLE_RETRIES 회),
+        네트워크 오류는 지수 백오프로 재시도(최대 MAX_NETWORK_RETRIES 회)한다.
+        """
+        throttled = failures = 0
+        while True:
+            for bucket in self._buckets_for(chat_id):
+                await bucket.acquire()
+            await self.global_bucket.acquire()
+            try:
+                result = await self.bot.send_message(chat_id=chat_id, text=text)
+            except RetryAfter as e:
+                throttled += 1
+                self.stats['throttled'] += 1
+                if throttled > MAX_THROTTLE_RETRIES:
+                    raise
+                self._on_throttled(chat_id, retry_after_seconds(e))
+                continue
+            except BadRequest:
+                # 잘못된 요청(메시지 길이, 없는 채팅방 등)은 재시도해도 같은 결과
+                raise
+            except NetworkError as e:
+                failures += 1
+                if failures > MAX_NETWORK_RETRIES:
+                    raise
+                self.stats['retried'] += 1
+                delay = NETWORK_BACKOFF * 2 ** (failures - 1)
+                print(f"   🔁 네트워크 오류, {delay:g}초 후 재시도 ({failures}/{MAX_NETWORK_RETRIES}): {e}")
+                await asyncio.sleep(delay)
+                continue
+            self._on_success(chat_id)
+            self.stats['sent'] += 1
+            return result
+
+    async def send_sequence(self, chat_id, messages, on_sent=None):
+        """한 채팅방에 메시지들을 순서대로 발송. on_sent(index, 보낸 Message) 는 메시지마다 전송 직후 호출"""
+        for index, text in enumerate(messages):
+            result = await self.send(chat_id, text)
+            if on_sent is not None:
+                on_sent(index, result)
+
+    async def _run_chat(self, chat_id, jobs, on_sent):
+        results = []
+        for label, messages in jobs:
+            callback = None
+            if on_sent is not None:
+                callback = lambda index, result, label=label: on_sent(chat_id, label, index, result)
+            try:
+                await self.send_sequence(chat_id, messages, on_sent=callback)
+                results.append((chat_id, label, None))
+            except Exception as e:
+                results.append((chat_id, label, e))
+        return results
+
+    async def deliver(self, jobs, on_sent=None):
+        """jobs: [(chat_id, label, [메시지...]), ...]
+
+        같은 채팅방의 작업은 주어진 순서대로 하나의 태스크에서, 채팅방끼리는 동시에 실행한다.
+        on_sent(chat_id, label, index, Message) 를 주면 메시지 하나가 전송될 때마다 호출 (발송 기록용).
+        반환: [(chat_id, label, 오류 또는 None), ...] (작업이 실패해도 다음 작업은 계속 진행)
+        """
+        by_chat = {}
+        for chat_id, label, messages in jobs:
+            by_chat.setdefault(chat_id, []).append((label, messages))
+        chat_results = await asyncio.gather(
+            *(self._run_chat(chat_id, chat_jobs, on_sent) for chat_id, chat_jobs in by_chat.items())
+        )
+        return [result for results in chat_results for result in results]
+
+    async def _produce(self, items, queue, senders):
+        # 동기 이터러블은 스레드에서 PRODUCE_BATCH 개씩 꺼내고, 대기열이 차면 put 에서 기다림 (backpressure)
+        items = iter(items)
+        try:
+            while batch := await asyncio.to_thread(list, itertools.islice(items, PRODUCE_BATCH)):
+                for item in batch:
+                    await queue.put(item)
+        finally:
+            for _ in range(senders):
+                await queue.put(None)
+
+    async def deliver_pipeline(self, items, on_sent=None, senders=SENDER_TASKS, queue_size=QUEUE_SIZE):
+        """items: (chat_id, [(label, [메시지...]), ...]) 를 채팅방 단위로 내는 동기 이터러블.
+
+        items 는 스레드 풀에서 순회하므로 그 안의 DB 조회/렌더링이 이벤트 루프를 막지 않고,
+        만들어진 작업은 크기 제한이 있는 asyncio.Queue 를 거쳐 senders 개의 발송 태스크가 바로 가져가 보낸다.
+        (deliver 처럼 묶음 전체가 끝날 때까지 기다리지 않으므로 생산과 전송이 겹쳐 진행됨)
+        채팅방 하나의 작업은 한 발송 태스크가 순서대로 보내므로 같은 chat_id 는 한 번만 내야 한다.
+        반환: deliver 와 같은 [(chat_id, label, 오류 또는 None), ...]
+        """
+        queue = asyncio.Queue(maxsize=queue_size)
+        results = []
+
+        async def sender():
+            while (item := await queue.get()) is not None:
+                chat_id, chat_jobs = item
+                results.extend(await self._run_chat(chat_id, chat_jobs, on_sent))
+
+        producer = asyncio.create_task(self._produce(items, queue, senders))
+        try:
+            await asyncio.gather(*(sender() for _ in range(senders)))
+            await producer  # items 순회 중 난 오류는 여기서 전달
+        finally:
+            producer.cancel()
+        return results
+
+
+def create_request(pool_size=POOL_SIZE, proxy=None):
+    """크기를 정한 연결 풀 + 긴 keep-alive 를 쓰는 HTTPXRequest"""
+    limits = httpx.Limits(
+        max_connections=pool_size,
+        max_keepalive_connections=pool_size,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+    return HTTPXRequest(
+        connection_pool_size=pool_size,
+        pool_timeout=POOL_TIMEOUT,
+        proxy=proxy,
+        httpx_kwargs={'limits': limits},
+    )
+
+
+class DeliveryClient:
+    """Bot 하나와 연결 풀을 소유하는 비동기 컨텍스트 매니저.
+
+    async with DeliveryClient(token) as client:
+        await client.engine.send_sequence(chat_id, messages)
+
+    bot= 으로 이미 실행 중인 Bot(관리 봇의 context.bot 등)을 넘기면 그 Bot 을 감싸기만 하고
+    initialize/shutdown 은 하지 않는다 (수명은 원래 주인이 관리).
+    """
+
+    def __init__(self, token=None, proxy=None, bot=None, pool_size=POOL_SIZE, global_rate=GLOBAL_RATE):
+        self._owns_bot = bot is None
+        if bot is None:
+            bot = Bot(token=token, request=create_request(pool_size, proxy))
+        self.bot = bot
+        self.engine = DeliveryEngine(bot, global_rate=global_rate)
+
+    async def __aenter__(self):
+        if self._owns_bot:
+            await self.bot.initialize()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self._owns_bot:
+            await self.bot.shutdown()
@@ -0,0 +1,147 @@
+"""한 달치 발송 메시지 사전 렌더링 캐시 (main.py prerender).
+
+data/cache/messages_YYYY_MM.json.gz 에 {day: {lang: {'summary', 'messages', 'unpacked'}}} 를 저장한다.
+캐시 키 = 렌더 버전 + 템플릿 + 플랜 JSON 내용 해시 + 본문 조회 백엔드 이름과 그 원본 파일 내용 해시
+(sqlite/memory 는 bible.db, mmap 은 data/*.bin) 이므로, 입력 중 하나라도 바뀌면 다음 조회 때 자동으로 다시 렌더링한다.
+원본 해시가 바뀌면 열려 있던 조회기(연결/적재된 표/mmap)도 버리고 새 파일로 다시 연다.
+플랜 내용과 해시는 core.plan_store 색인에서 가져온다 (JSON 이 바뀌지 않았으면 파일을 다시 읽지 않음).
+발송 경로는 여기서 읽은 문자열을 그대로 보내기만 한다.
+"""
+import gzip
+import hashlib
+import json
+import os
+
+import core.bible_scripture_resolver as resolver
+from core.message_render import render_month, translations
+from core.plan_store import get_plan_store
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(BASE_DIR, 'data', 'cache')
+
+# 메시지 구성/분할 방식이 바뀌면 올려서 기존 캐시를 무효화
+RENDER_VERSION = 4
+
+# 상주 프로세스(데몬/관리 봇)용: 검증을 통과한 캐시를 메모리에 유지해 gzip/JSON 재해석을 생략
+_loaded = {}
+# 이 프로세스의 조회기가 마지막으로 본 원본 지문 (_db_fingerprint 결과)
+_seen_db = None
+
+
+def cache_file(year, month):
+    return os.path.join(CACHE_DIR, f"messages_{int(year):04d}_{int(month):02d}.json.gz")
+
+
+def _sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _db_fingerprint(previous=None):
+    """지금 쓰는 본문 조회 백엔드와 그 원본 파일들(resolver.source_files)의 내용 해시.
+    {'backend', 'files': {파일 이름: {'stat', 'hash'}}, 'hash'}. 원본 파일이 하나도 없으면 hash 는 None.
+    파일별로 크기/mtime 이 이전 캐시 기록과 같으면 이전 해시를 재사용 (매일 발송 때마다 전체를 다시 읽지 않기 위함)"""
+    source = resolver.get_resolver()
+    old_files = previous.get('files', {}) if previous and previous.get('backend') == source.backend else {}
+    files = {}
+    digest = hashlib.sha256(source.backend.encode())
+    for path in source.source_files():
+        name = os.path.basename(path)
+        if not os.path.exists(path):
+            files[name] = {'stat': None, 'hash': None}
+            continue
+        st = os.stat(path)
+        stat = [st.st_size, st.st_mtime_ns]
+        old = old_files.get(name)
+        files[name] = old if old and old.get('stat') == stat else {'stat': stat, 'hash': _sha256_file(path)}
+        digest.update(f"{name}:{files[name]['hash']}".encode())
+    found = any(entry['hash'] for entry in files.values())
+    return {'backend': source.backend, 'files': files, 'hash': digest.hexdigest() if found else None}
+
+
+def _sync_resolver(db):
+    """원본 파일 해시가 마지막으로 본 값과 다르면 공유 조회기를 닫고 버린다.
+    (예전 SQLite 연결/메모리 표/mmap 으로 새 캐시 키 아래 옛 본문을 렌더링하지 않기 위함)"""
+    global _seen_db
+    if _seen_db is not None and (_seen_db['backend'], _seen_db['hash']) != (db['backend'], db['hash']):
+        print("🔄 성경 본문 원본이 바뀌어 조회기를 다시 엽니다.")
+        resolver.reset_resolver()
+    _seen_db = db
+
+
+def refresh_resolver():
+    """상주 프로세스(데몬 워밍업/관리 봇 작업)용: 원본 파일이 바뀌었으면 조회기를 다시 연다"""
+    _sync_resolver(_db_fingerprint(_seen_db))
+
+
+def _cache_key(plan_sha256, backend, db_hash):
+    digest = hashlib.sha256()
+    digest.update(f"v{RENDER_VERSION}".encode())
+    digest.update(json.dumps(translations, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+    digest.update(bytes.fromhex(plan_sha256))
+    digest.update(backend.encode())
+    digest.update((db_hash or 'no-db').encode())
+    return digest.hexdigest()
+
+
+def _load(path):
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save(path, cache):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def build_month_cache(year, month, force=False):
+    """해당 월 캐시를 반환. 최신이면 디스크에서 읽고, 아니면(또는 force) 다시 렌더링해 저장.
+    플랜 JSON 이 없으면 None."""
+    plans = get_plan_store()
+    plan_sha256 = plans.month_digest(year, month)
+    if plan_sha256 is None:
+        return None
+
+    target = cache_file(year, month)
+    cached = None if force else (_loaded.get(target) or _load(target))
+    db = _db_fingerprint(cached.get('db') if cached else _seen_db)
+    _sync_resolver(db)
+    key = _cache_key(plan_sha256, db['backend'], db['hash'])
+    if cached and cached.get('key') == key:
+        _loaded[target] = cached
+        return cached
+
+    plan = plans.get_month(year, month)
+    cache = {
+        'key': key,
+        'db': db,
+        'year': int(year),
+        'month': int(month),
+        'days': render_month(plan, year, month),
+    }
+    _loaded[target] = cache
+    try:
+        _save(target, cache)
+    except OSError as e:
+        print(f"⚠️ 메시지 캐시 저장 실패 (렌더링 결과는 그대로 사용): {e}")
+    return cache
+
+
+def get_day_messages(kst_now):
+    """오늘 날짜의 {lang: {'summary', 'messages'}}. 플랜/날짜 데이터가 없으면 None"""
+    # 플랜에 오늘 줄이 없으면 (기본 키 조회 한 번) 한 달치 캐시를 확인/렌더링하지 않음
+    if get_plan_store().get_day(kst_now.year, kst_now.month, kst_now.day) is None:
+        return None
+    cache = build_month_cache(kst_now.year, kst_now.month)
+    if cache is None:
+        return None
+    return cache['days'].get(str(kst_now.day))
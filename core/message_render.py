@@ -0,0 +1,162 @@
+"""발송 메시지 렌더링: 언어별 템플릿, 요약 메시지, 하루치 메시지 목록.
+
+메시지 내용은 플랜 JSON 과 bible.db 에만 의존하므로, 여기서 만든 결과를
+core.message_cache 가 한 달 단위로 미리 렌더링해 디스크에 캐시한다.
+"""
+from core.bible_scripture_resolver import (
+    TELEGRAM_TEXT_LIMIT,
+    iter_telegram_chunks,
+    resolve_monthly_plan,
+    split_text_for_telegram,
+    translate_citation,
+    utf16_len,
+)
+from core.plan_format import as_plan_day
+
+LANGS = ['KO', 'EN', 'MN']
+
+# 한 메시지 안에서 요약/본문 블록 사이 구분
+BLOCK_SEPARATOR = "\n\n"
+
+# --- 언어별 메시지 템플릿 ---
+translations = {
+    'KO': {
+        'title': "🌟 오늘의 묵상 알림",
+        'qt_label': "📖 [오늘의 QT 본문]",
+        'rd_label': "📚 [성경 읽기 진도]",
+        'ot': "구약", 'nt': "신약", 'ps': "시편", 'pr': "잠언",
+        'unit_ps': "편", 'unit_pr': "장", 'none': "주일(개인독서)",
+        'slogan': "그리스도의 형상을 닮고 그의 형상을 닮게 하라"
+    },
+    'EN': {
+        'title': "🌟 Daily Meditation",
+        'qt_label': "📖 [Today's QT Passage]",
+        'rd_label': "📚 [Bible Reading Plan]",
+        'ot': "OT", 'nt': "NT", 'ps': "Psalms", 'pr': "Proverbs",
+        'unit_ps': "", 'unit_pr': "", 'none': "Sunday (Personal)",
+        'slogan': "Be Like Christ, Make Like Christ."
+    },
+    'MN': {
+        'title': "🌟 Өдрийн бясалгал",
+        'qt_label': "📖 [Өнөөдрийн QT]",
+        'rd_label': "📚 [Библи унших төлөвлөгөө]",
+        'ot': "Хуучин Гэрээ", 'nt': "Шинэ Гэрээ", 'ps': "Дуулал", 'pr': "Сургаалт үгс",
+        'unit_ps': "-р бүлэг", 'unit_pr': "-р бүлэг", 'none': "Ням гараг (Хувийн уншлага)",
+        'slogan': "Христ шиг байж, Христ шиг болгоцгооё." 
+    }
+}
+
+def format_summary(row, lang_code, date_str):
+    """요약 메시지를 깔끔한 문자열로 포맷팅 (줄바꿈 버그 수정 버전). row: PlanDay 또는 v1 목록"""
+    lang_pack = translations.get(lang_code, translations['KO'])
+    raw_nt, raw_ot, raw_ps, raw_pr, raw_qt = as_plan_day(row).row
+    
+    qt_display = translate_citation(raw_qt, lang_code)
+    ot_display = translate_citation(raw_ot, lang_code)
+    nt_display = translate_citation(raw_nt, lang_code)
+    ps_display = translate_citation(raw_ps, lang_code)
+    pr_display = translate_citation(raw_pr, lang_code)
+
+    summary_lines = [
+        f"{lang_pack['title']} ({date_str})\n",
+        f"{lang_pack['qt_label']}\n👉 {qt_display}\n",
+        f"{lang_pack['rd_label']}"
+    ]
+    summary_lines.append(f"▫️ {lang_pack['nt']}: {nt_display if raw_nt else lang_pack['none']}")
+    summary_lines.append(f"▫️ {lang_pack['ot']}: {ot_display if raw_ot else lang_pack['none']}")
+    summary_lines.append(f"▫️ {lang_pack['ps']}: {ps_display}{lang_pack['unit_ps']}")
+    summary_lines.append(f"▫️ {lang_pack['pr']}: {pr_display}{lang_pack['unit_pr']}\n")
+    summary_lines.append(f"━━━━━━━━━━━━━━━\n\"{lang_pack['slogan']}\"")
+    
+    return "\n".join(summary_lines)
+
+def _fill(text, room):
+    """text 앞부분을 room 이하가 되도록 줄 경계에서 잘라 (앞, 나머지) 반환"""
+    lines = text.split('\n')
+    size = -1
+    for i, line in enumerate(lines):
+        size += utf16_len(line) + 1
+        if size > room:
+            return '\n'.join(lines[:i]), '\n'.join(lines[i:])
+    return text, ''
+
+def pack_messages(blocks, limit=TELEGRAM_TEXT_LIMIT):
+    """블록(요약, 본문...)을 순서를 지키며 limit 이하 메시지로 최대한 합침.
+
+    - 현재 메시지의 남은 공간에 들어가면 빈 줄을 두고 이어 붙임
+    - 안 들어가지만 새 메시지 하나에 들어가면 새 메시지로 시작 (본문을 쪼개지 않음)
+    - limit 보다 긴 본문만 절(줄) 경계에서 나눠 남은 공간부터 채움
+    """
+    messages = []
+    current, size = [], 0
+    sep_len = utf16_len(BLOCK_SEPARATOR)
+
+    for block in blocks:
+        if not block: continue
+        block_len = utf16_len(block)
+        if not current:
+            needed = block_len
+        else:
+            needed = size + sep_len + block_len
+        if needed <= limit:
+            current.append(block)
+            size = needed
+            continue
+        if block_len <= limit:
+            messages.append(BLOCK_SEPARATOR.join(current))
+            current, size = [block], block_len
+            continue
+
+        # 긴 본문: 남은 공간을 줄 단위로 채운 뒤 나머지는 limit 단위 조각으로
+        rest = block
+        if current:
+            head, rest = _fill(block, limit - size - sep_len)
+            if head:
+                current.append(head)
+            messages.append(BLOCK_SEPARATOR.join(current))
+        pieces = list(iter_telegram_chunks(rest, limit))
+        if not pieces:
+            current, size = [], 0
+            continue
+        messages.extend(pieces[:-1])
+        current, size = [pieces[-1]], utf16_len(pieces[-1])
+
+    if current:
+        messages.append(BLOCK_SEPARATOR.join(current))
+    return messages
+
+def day_blocks(row, lang_code, date_str, passages):
+    """하루치 메시지 블록: 요약 → QT → 시편 → 잠언
+
+    passages: {'qt': 본문, 'ps': 본문, 'pr': 본문} (resolve_monthly_plan 결과의 한 언어분)
+    """
+    blocks = [format_summary(row, lang_code, date_str)]
+    for kind in ('qt', 'ps', 'pr'):
+        text = passages.get(kind)
+        if text:
+            blocks.append(text)
+    return blocks
+
+def unpacked_count(blocks):
+    """묶기 전 방식(요약 1개 + 본문별 split_text_for_telegram)의 메시지 수"""
+    return 1 + sum(len(split_text_for_telegram(text)) for text in blocks[1:])
+
+def render_day_messages(row, lang_code, date_str, passages):
+    """하루치 발송 메시지 목록 (요약과 본문을 길이 제한 안에서 최대한 한 메시지로 묶음)"""
+    return pack_messages(day_blocks(row, lang_code, date_str, passages))
+
+def render_month(plan, year, month, langs=LANGS):
+    """한 달 플랜 전체 렌더링: {day: {lang: {'summary': 요약, 'messages': [메시지...], 'unpacked': 묶기 전 메시지 수}}}"""
+    resolved = resolve_monthly_plan(plan, langs)
+    days = {}
+    for day, row in plan.items():
+        date_str = f"{int(year):04d}/{int(month):02d}/{int(day):02d}"
+        days[day] = {}
+        for lang in langs:
+            blocks = day_blocks(row, lang, date_str, resolved[day][lang])
+            days[day][lang] = {
+                'summary': blocks[0],
+                'messages': pack_messages(blocks),
+                'unpacked': unpacked_count(blocks),
+            }
+    return days
@@ -0,0 +1,127 @@
+"""발송 기록 (data/outbox.db, SQLite WAL).
+
+(발송일, 채팅방, 구분, 메시지 번호)마다 'queued'(보낼 예정) / 'acked'(텔레그램이 받음) 이벤트를
+지우거나 고치지 않고 덧붙이기만 한다.
+- 같은 채팅방의 메시지는 순서대로 보내므로 acked 는 항상 앞에서부터 이어진다
+  → 채팅방/구분별 "다음에 보낼 메시지 번호" = 마지막 acked 번호 + 1
+- 프로세스가 발송 도중 죽어도 다시 실행하면 그 번호부터 이어서 보내고,
+  이미 끝난 날을 다시 발송하면 보낼 것이 없어 아무것도 하지 않는다.
+- 강제 재발송(force)은 새 generation 을 시작해 이전 기록을 무시한다.
+- ack 는 발송 쪽(core.bible_sender)이 모아 두었다가 묶음으로 기록하므로, 기록하기 전에 죽으면
+  아직 기록하지 않은 묶음만큼(ACK_BATCH 건 또는 ACK_FLUSH_SECONDS 동안 보낸 것) 다시 보내질 수 있다.
+"""
+import os
+import sqlite3
+import threading
+from datetime import date, timedelta
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUTBOX_DB = os.path.join(BASE_DIR, 'data', 'outbox.db')
+
+# 이보다 오래된 날짜의 기록은 새 발송을 시작할 때 정리
+RETENTION_DAYS = 35
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox_events (
+    id         INTEGER PRIMARY KEY,
+    send_date  TEXT NOT NULL,
+    generation INTEGER NOT NULL,
+    chat_id    INTEGER NOT NULL,
+    label      TEXT NOT NULL,
+    msg_index  INTEGER NOT NULL,
+    event      TEXT NOT NULL CHECK (event IN ('queued', 'acked')),
+    message_id INTEGER,
+    at         TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_progress
+    ON outbox_events (send_date, generation, event, chat_id, label, msg_index);
+"""
+
+
+class Outbox:
+    def __init__(self, db_path=None):
+        self.db_path = db_path or OUTBOX_DB
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            # 샤드 발송 시 여러 프로세스가 같은 파일에 기록하므로 잠금 대기 시간을 넉넉히
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode = WAL")
+            # WAL + NORMAL: 커밋마다 fsync 하지 않아 ack 기록이 가볍고, 프로세스가 죽어도 커밋된 기록은 남음
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def begin(self, send_date, force=False):
+        """send_date 발송에 쓸 generation. 보통은 가장 최근 것을 이어서, force 면 새로 시작"""
+        with self._lock:
+            conn = self._connect()
+            cutoff = (date.fromisoformat(send_date) - timedelta(days=RETENTION_DAYS)).isoformat()
+            conn.execute("DELETE FROM outbox_events WHERE send_date < ?", (cutoff,))
+            conn.commit()
+            latest = conn.execute(
+                "SELECT MAX(generation) FROM outbox_events WHERE send_date = ?", (send_date,)
+            ).fetchone()[0]
+        if latest is None:
+            return 1
+        return latest + 1 if force else latest
+
+    def progress(self, send_date, generation, chat_ids):
+        """{(chat_id, label): 다음에 보낼 메시지 번호} — chat_ids 중 ack 기록이 있는 것만"""
+        chat_ids = list(chat_ids)
+        if not chat_ids:
+            return {}
+        placeholders = ",".join("?" * len(chat_ids))
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT chat_id, label, MAX(msg_index) + 1 FROM outbox_events "
+                "WHERE send_date = ? AND generation = ? AND event = 'acked' "
+                f"AND chat_id IN ({placeholders}) GROUP BY chat_id, label",
+                (send_date, generation, *chat_ids),
+            ).fetchall()
+        return {(chat_id, label): next_index for chat_id, label, next_index in rows}
+
+    def queued(self, send_date, generation, entries):
+        """entries: [(chat_id, label, msg_index), ...] 를 한 트랜잭션으로 기록"""
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT INTO outbox_events (send_date, generation, chat_id, label, msg_index, event) "
+                "VALUES (?, ?, ?, ?, ?, 'queued')",
+                [(send_date, generation, chat_id, label, index) for chat_id, label, index in entries],
+            )
+            conn.commit()
+
+    def acked(self, send_date, generation, chat_id, label, msg_index, message_id=None):
+        self.acked_many(send_date, generation, [(chat_id, label, msg_index, message_id)])
+
+    def acked_many(self, send_date, generation, entries):
+        """entries: [(chat_id, label, msg_index, message_id), ...] 를 한 트랜잭션으로 기록"""
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT INTO outbox_events "
+                "(send_date, generation, chat_id, label, msg_index, event, message_id) "
+                "VALUES (?, ?, ?, ?, ?, 'acked', ?)",
+                [(send_date, generation, *entry) for entry in entries],
+            )
+            conn.commit()
+
+
+_outbox = None
+
+def get_outbox():
+    """프로세스 전체에서 공유하는 발송 기록"""
+    global _outbox
+    if _outbox is None:
+        _outbox = Outbox()
+    return _outbox
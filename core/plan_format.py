@@ -0,0 +1,168 @@
+"""플랜 JSON 형식 (v1 / v2) 읽기·쓰기.
+
+v1 (이전 형식): {"1": [nt, ot, ps, pr, qt], ...}  — 위치로만 구분되는 문자열 5칸 (4칸인 달도 있음)
+v2            : {"version": 2, "days": {"1": {"nt": ..., "ot": ..., "ps": ..., "pr": ..., "qt": ...,
+                                              "spans": {"qt": [책 번호, 장, 절, 끝 책 번호, 장, 절], "ps": ..., "pr": ...}}}}
+                spans 는 발송 본문 대상(qt/ps/pr)의 인용을 미리 풀어 둔 것 (절이 없으면 null, 해석할 수 없는 칸은 빠짐)
+
+load_plan/parse_plan 은 두 형식 모두 {day: PlanDay} 로 읽는다. v2 는 spans 를 그대로 쓰므로 인용 문자열을
+다시 파싱하지 않는다. 새로 저장할 때는 항상 v2 (dump_plan). 기존 파일 변환: tools/migrate_plans_v2.py
+"""
+import json
+import os
+
+from core.citation import BOOK_IDS, BOOKS_BY_ID, Citation, chapter_citation, parse_citation
+
+PLAN_VERSION = 2
+FIELDS = ('nt', 'ot', 'ps', 'pr', 'qt')
+CITED = ('qt', 'ps', 'pr')
+# 시/잠 칸의 구간은 항상 이 책이어야 함 (다른 책이 적힌 칸은 구간 없이 보관)
+COLUMN_BOOK_IDS = {'ps': BOOK_IDS['시'], 'pr': BOOK_IDS['잠']}
+
+
+def _row_citations(nt, ot, ps, pr, qt):
+    """문자열 칸에서 발송 본문 대상 인용 {'qt', 'ps', 'pr'} (빈 칸 제외).
+
+    QT 칸이 책 이름 없이 숫자로 시작하면 마태복음으로 본다 (발송 로직과 동일).
+    시편/잠언 칸('시 1-3', '1-3', '119-65-88')은 시편/잠언 책의 인용으로 읽고,
+    다른 책 이름이 적힌 칸은 해석 불가로 둔다 (core.citation.chapter_citation).
+    """
+    cites = {}
+    cite = parse_citation(qt)
+    if cite:
+        cites['qt'] = cite.with_book('마') if cite.is_bare else cite
+    if ps:
+        cites['ps'] = chapter_citation('시', ps)
+    if pr:
+        cites['pr'] = chapter_citation('잠', pr)
+    return cites
+
+
+def _span(cite):
+    return [cite.book_id, cite.start_chapter, cite.start_verse,
+            cite.end_book_id, cite.end_chapter, cite.end_verse]
+
+
+def _from_span(raw, span):
+    """저장된 spans 값으로 Citation 생성 (정규식 파싱 없음)"""
+    book_id, c1, v1, end_book_id, c2, v2 = span
+    book = BOOKS_BY_ID[book_id]
+    rest = raw[len(book):].strip() if raw.startswith(book) else raw
+    return Citation(raw, book, rest, c1, v1, BOOKS_BY_ID[end_book_id], c2, v2)
+
+
+def _column_span_ok(kind, raw, span):
+    """시/잠 칸 구간이 그 칸의 책이고, 칸 문자열이 숫자로 시작하거나 그 책 이름으로 시작하는지"""
+    book_id = COLUMN_BOOK_IDS[kind]
+    return span[0] == book_id and (raw[:1].isdigit() or raw.startswith(BOOKS_BY_ID[book_id]))
+
+
+class PlanDay:
+    """플랜 하루치. 칸 이름으로 접근 (row 는 v1 순서의 5칸 목록)"""
+    __slots__ = FIELDS + ('spans',)
+
+    def __init__(self, nt="", ot="", ps="", pr="", qt="", spans=None):
+        self.nt = nt or ""
+        self.ot = ot or ""
+        self.ps = ps or ""
+        self.pr = pr or ""
+        self.qt = qt or ""
+        # {'qt'|'ps'|'pr': (책 번호, 장, 절, 끝 책 번호, 장, 절)}. None 이면 아직 풀지 않음
+        self.spans = spans
+
+    def __repr__(self):
+        return f"PlanDay({', '.join(f'{f}={getattr(self, f)!r}' for f in FIELDS)})"
+
+    @classmethod
+    def from_row(cls, row):
+        """v1 한 줄 [nt, ot, ps, pr, qt] (칸이 모자라면 빈 칸)"""
+        return cls(*(list(row) + [""] * 5)[:5])
+
+    @classmethod
+    def from_json(cls, entry):
+        """v2 한 줄"""
+        spans = {kind: tuple(span) for kind, span in (entry.get('spans') or {}).items()}
+        return cls(*(entry.get(field, "") for field in FIELDS), spans=spans)
+
+    @property
+    def row(self):
+        return [self.nt, self.ot, self.ps, self.pr, self.qt]
+
+    def citations(self):
+        """발송 본문 대상 인용 {'qt', 'ps', 'pr'} (빈 칸 제외). spans 가 있으면 파싱하지 않음"""
+        if self.spans is None:
+            return _row_citations(*self.row)
+        cites = {}
+        for kind in CITED:
+            raw = getattr(self, kind)
+            if not raw:
+                continue
+            span = self.spans.get(kind)
+            if span is not None and kind in COLUMN_BOOK_IDS and not _column_span_ok(kind, raw, span):
+                # 이전 파서가 다른 책 칸을 시/잠으로 풀어 저장한 구간은 쓰지 않음
+                span = None
+            if span is None:
+                # 해석할 수 없던 칸은 문자열 그대로 파싱 (본문 없음으로 처리됨)
+                cites[kind] = _row_citations(**{f: (raw if f == kind else "") for f in FIELDS})[kind]
+            else:
+                cites[kind] = _from_span(raw, span)
+        return cites
+
+    def decode_spans(self):
+        """인용을 풀어 spans 를 채움 (v1 → v2 변환용)"""
+        self.spans = {
+            kind: tuple(_span(cite))
+            for kind, cite in _row_citations(*self.row).items() if cite.is_resolvable
+        }
+        return self
+
+    def to_json(self):
+        if self.spans is None:
+            self.decode_spans()
+        entry = {field: getattr(self, field) for field in FIELDS}
+        entry['spans'] = {kind: list(span) for kind, span in self.spans.items()}
+        return entry
+
+
+def as_plan_day(row):
+    """PlanDay 또는 v1 목록 → PlanDay"""
+    return row if isinstance(row, PlanDay) else PlanDay.from_row(row)
+
+
+def plan_version(data):
+    return data.get('version', 1) if isinstance(data.get('version'), int) else 1
+
+
+def parse_plan(data):
+    """json 으로 읽은 플랜 (v1/v2) → {day: PlanDay}"""
+    if plan_version(data) >= 2:
+        return {day: PlanDay.from_json(entry) for day, entry in data['days'].items()}
+    return {day: PlanDay.from_row(row) for day, row in data.items()}
+
+
+def load_plan(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_plan(json.load(f))
+
+
+def plan_to_json(plan):
+    """{day: PlanDay 또는 v1 목록} → v2 JSON 객체 (날짜순)"""
+    days = sorted(plan.items(), key=lambda item: int(item[0]))
+    return {
+        'version': PLAN_VERSION,
+        'days': {str(int(day)): as_plan_day(row).to_json() for day, row in days},
+    }
+
+
+def dump_plan(plan, path):
+    """v2 로 저장 (하루 한 줄, 임시 파일에 쓴 뒤 교체)"""
+    data = plan_to_json(plan)
+    days = ",\n".join(
+        f"    {json.dumps(day)}: {json.dumps(entry, ensure_ascii=False)}"
+        for day, entry in data['days'].items()
+    )
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(f'{{\n  "version": {data["version"]},\n  "days": {{\n{days}\n  }}\n}}\n')
+    os.replace(tmp_path, path)
@@ -0,0 +1,201 @@
+"""날짜로 바로 찾는 플랜 색인 (data/plans.db).
+
+편집 원본은 계속 data/plans/YYYY_MM.json (v1/v2, core.plan_format) 이고, 이 모듈은 그 파일들을 날짜가 기본 키인 테이블 하나로 옮겨 둔다.
+- plan_files : 월별 원본 JSON 의 크기/mtime/내용 해시 (파일이 바뀌었는지 판단)
+- plan_days  : 날짜('YYYY-MM-DD')가 기본 키인 WITHOUT ROWID 테이블. 원문 5칸 + 발송 본문 대상(qt/ps/pr)의
+               파싱된 인용 (책 번호, 시작 장/절, 끝 책 번호, 끝 장/절)
+"오늘 줄"은 기본 키 조회 한 번이고, 월 단위 결과는 프로세스 안에 보관한다.
+조회할 때마다 해당 월 JSON 의 크기/mtime 만 확인해서 바뀌었으면(또는 새로 생겼거나 지워졌으면) 그 달만 다시 옮긴다.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+
+from core.plan_format import CITED, FIELDS, PlanDay, parse_plan
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PLANS_DIR = os.path.join(BASE_DIR, 'data', 'plans')
+PLAN_DB = os.path.join(BASE_DIR, 'data', 'plans.db')
+
+SPAN_COLUMNS = ('book_id', 'start_chapter', 'start_verse', 'end_book_id', 'end_chapter', 'end_verse')
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS plan_files (
+    month    TEXT PRIMARY KEY,
+    size     INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256   TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS plan_days (
+    date  TEXT PRIMARY KEY,
+    month TEXT NOT NULL,
+    {', '.join(f'{field} TEXT NOT NULL' for field in FIELDS)},
+    {', '.join(f'{kind}_{column} INTEGER' for kind in CITED for column in SPAN_COLUMNS)}
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_plan_days_month ON plan_days (month);
+"""
+
+
+def month_key(year, month):
+    return f"{int(year):04d}_{int(month):02d}"
+
+
+def plan_file(year, month):
+    return os.path.join(PLANS_DIR, f"{month_key(year, month)}.json")
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _span(cite):
+    if cite is None or not cite.is_resolvable:
+        return (None,) * len(SPAN_COLUMNS)
+    return (cite.book_id, cite.start_chapter, cite.start_verse,
+            cite.end_book_id, cite.end_chapter, cite.end_verse)
+
+
+_DAY_COLUMNS = ", ".join(FIELDS + tuple(f'{kind}_{column}' for kind in CITED for column in SPAN_COLUMNS))
+
+
+def _plan_day(values):
+    """plan_days 한 행 (FIELDS + 인용 구간 컬럼) → PlanDay"""
+    width = len(SPAN_COLUMNS)
+    spans = {}
+    for i, kind in enumerate(CITED):
+        start = len(FIELDS) + i * width
+        span = tuple(values[start:start + width])
+        if span[0] is not None:
+            spans[kind] = span
+    return PlanDay(*values[:len(FIELDS)], spans=spans)
+
+
+class PlanStore:
+    def __init__(self, db_path=None, plans_dir=None):
+        self.db_path = db_path or PLAN_DB
+        self.plans_dir = plans_dir or PLANS_DIR
+        self._conn = None
+        self._lock = threading.RLock()
+        # month -> {'stat': (size, mtime_ns), 'sha256': ..., 'rows': {day: PlanDay}} (없는 달은 {'stat': None})
+        self._months = {}
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            # 샤드 워커 여러 개가 동시에 같은 달을 옮길 수 있으므로 잠금 대기
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._months.clear()
+
+    def _compile(self, key, path, stat):
+        """JSON 한 달치를 plan_days 로 옮기고 plan_files 갱신"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        rows = []
+        for day, entry in parse_plan(json.loads(data)).items():
+            # v2 는 저장된 spans 를 그대로, v1 은 여기서 한 번 파싱
+            cites = entry.citations()
+            spans = [value for kind in CITED for value in _span(cites.get(kind))]
+            rows.append((f"{key[:4]}-{key[5:]}-{int(day):02d}", key, *entry.row, *spans))
+        sha256 = hashlib.sha256(data).hexdigest()
+
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM plan_days WHERE month = ?", (key,))
+            conn.executemany(
+                f"INSERT INTO plan_days VALUES ({', '.join('?' * (2 + len(FIELDS) + len(CITED) * len(SPAN_COLUMNS)))})",
+                rows,
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO plan_files (month, size, mtime_ns, sha256) VALUES (?, ?, ?, ?)",
+                (key, *stat, sha256),
+            )
+        return sha256
+
+    def _month(self, year, month):
+        """해당 월 정보 (원본 JSON 이 없으면 None). 원본이 바뀌었으면 그 달만 다시 옮김"""
+        key = month_key(year, month)
+        path = os.path.join(self.plans_dir, f"{key}.json")
+        stat = _stat(path)
+        with self._lock:
+            cached = self._months.get(key)
+            if cached is not None and cached['stat'] == stat:
+                return cached if stat is not None else None
+
+            conn = self._connect()
+            known = conn.execute(
+                "SELECT size, mtime_ns, sha256 FROM plan_files WHERE month = ?", (key,)
+            ).fetchone()
+            if stat is None:
+                # 원본이 지워졌으면 색인에서도 제거 (없는 달도 기억해 두어 매번 확인하지 않음)
+                if known is not None:
+                    with conn:
+                        conn.execute("DELETE FROM plan_days WHERE month = ?", (key,))
+                        conn.execute("DELETE FROM plan_files WHERE month = ?", (key,))
+                self._months[key] = {'stat': None}
+                return None
+            if known is not None and tuple(known[:2]) == stat:
+                sha256 = known[2]
+            else:
+                sha256 = self._compile(key, path, stat)
+            info = {'stat': stat, 'sha256': sha256, 'rows': None}
+            self._months[key] = info
+            return info
+
+    def has_month(self, year, month):
+        return self._month(year, month) is not None
+
+    def month_digest(self, year, month):
+        """원본 JSON 내용의 sha256 (hex). 없으면 None — 파일을 다시 읽지 않고 저장된 값을 씀"""
+        info = self._month(year, month)
+        return info['sha256'] if info else None
+
+    def get_month(self, year, month):
+        """{'1': PlanDay, ...} (인용 구간 포함). 없으면 None"""
+        info = self._month(year, month)
+        if info is None:
+            return None
+        with self._lock:
+            if info['rows'] is None:
+                rows = self._connect().execute(
+                    f"SELECT date, {_DAY_COLUMNS} FROM plan_days WHERE month = ? ORDER BY date",
+                    (month_key(year, month),),
+                ).fetchall()
+                info['rows'] = {str(int(date[8:])): _plan_day(values) for date, *values in rows}
+            return info['rows']
+
+    def get_day(self, year, month, day):
+        """그날 한 줄 PlanDay (기본 키 조회 한 번). 없으면 None"""
+        if self._month(year, month) is None:
+            return None
+        date = f"{int(year):04d}-{int(month):02d}-{int(day):02d}"
+        with self._lock:
+            row = self._connect().execute(
+                f"SELECT {_DAY_COLUMNS} FROM plan_days WHERE date = ?", (date,)
+            ).fetchone()
+        return _plan_day(row) if row is not None else None
+
+
+_store = None
+
+def get_plan_store():
+    """프로세스 전체에서 공유하는 플랜 색인"""
+    global _store
+    if _store is None:
+        _store = PlanStore()
+    return _store
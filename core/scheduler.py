@@ -0,0 +1,81 @@
+"""상주 데몬(main.py daemon)용 일일 스케줄러.
+
+매일 KST 기준 발송 시각(DAILY_SEND_TIME, 기본 06:00)에 작업을 실행한다.
+- 발송 WARMUP_LEAD 초 전: 워밍업(플랜/메시지 캐시/DB/봇 연결 준비)
+- 발송 PRIME_LEAD 초 전: 가벼운 요청으로 HTTP keep-alive 연결을 새로 열어 둠
+- 발송 시각: 작업 실행
+
+긴 대기는 MAX_SLEEP_CHUNK 단위로 끊어 벽시계(NTP 보정 등)에 다시 맞추고,
+마지막 구간은 time.monotonic() 기준 마감 시각까지 asyncio.sleep 으로 기다린다.
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta
+from datetime import time as dtime
+from zoneinfo import ZoneInfo
+
+KST = ZoneInfo("Asia/Seoul")
+DEFAULT_SEND_TIME = "06:00"
+WARMUP_LEAD = 60.0
+PRIME_LEAD = 2.0
+MAX_SLEEP_CHUNK = 300.0
+
+
+def parse_send_time(value):
+    """'HH:MM' 또는 'HH:MM:SS' → datetime.time"""
+    try:
+        parts = [int(p) for p in value.strip().split(':')]
+        return dtime(*parts)
+    except (TypeError, ValueError):
+        raise ValueError(f"발송 시각 형식이 잘못되었습니다 (HH:MM): {value!r}")
+
+
+def next_run_at(now, send_time):
+    """now(KST) 이후 가장 가까운 발송 시각. 오늘 시각이 이미 지났으면 내일"""
+    target = now.replace(hour=send_time.hour, minute=send_time.minute,
+                         second=send_time.second, microsecond=0)
+    if target <= now:
+        target += timedelta(days=1)
+    return target
+
+
+async def sleep_until(target):
+    """벽시계 기준 target(KST) 까지 대기. 마지막 구간은 monotonic 마감 시각으로 정밀하게"""
+    while True:
+        remaining = (target - datetime.now(KST)).total_seconds()
+        deadline = time.monotonic() + remaining
+        if remaining <= MAX_SLEEP_CHUNK:
+            break
+        await asyncio.sleep(remaining - MAX_SLEEP_CHUNK)
+    while (left := deadline - time.monotonic()) > 0:
+        await asyncio.sleep(left)
+
+
+async def _run_step(label, fn, target):
+    try:
+        await fn(target)
+    except Exception as e:
+        print(f"⚠️ {label} 실패: {e}")
+
+
+async def run_daily(job, send_time, warmup=None, prime=None):
+    """매일 send_time(KST)에 job(target) 실행. warmup/prime 은 발송 직전 준비 단계 (모두 async, 인자 target)"""
+    while True:
+        target = next_run_at(datetime.now(KST), send_time)
+        print(f"⏰ 다음 발송: {target:%Y-%m-%d %H:%M:%S} KST")
+
+        if warmup:
+            await sleep_until(target - timedelta(seconds=WARMUP_LEAD))
+            started = time.monotonic()
+            await _run_step("워밍업", warmup, target)
+            print(f"🔥 워밍업 완료 ({(time.monotonic() - started) * 1000:.0f} ms)")
+        if prime:
+            await sleep_until(target - timedelta(seconds=PRIME_LEAD))
+            await _run_step("연결 준비", prime, target)
+
+        await sleep_until(target)
+        started = time.monotonic()
+        late_ms = (datetime.now(KST) - target).total_seconds() * 1000
+        print(f"🎯 발송 시작 (목표 시각 대비 {late_ms:+.1f} ms)")
+        await _run_step("발송", job, target)
+        print(f"🏁 일일 작업 종료 ({time.monotonic() - started:.1f}초)")
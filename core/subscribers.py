@@ -0,0 +1,171 @@
+"""발송 대상 채팅방 목록 (data/subscribers.db).
+
+채팅방마다 언어(하나 이상), 발송 방식, 활성 여부를 저장한다.
+- subscribers      : chat_id, 이름, 발송 방식('full' = 요약+본문, 'summary' = 요약만), 활성 여부
+- subscriber_langs : (lang, chat_id) 가 기본 키인 WITHOUT ROWID 테이블 (언어별 집계), chat_id 인덱스로 채팅방별 조회
+
+발송 시에는 iter_pages() 로 chat_id 기준 keyset 페이지 단위로 읽으므로
+수천 개 채팅방이어도 전체 목록을 메모리에 올리지 않는다.
+subscribers 테이블이 비어 있으면 환경변수(KO_CHAT_ID/EN_CHAT_ID/MN_CHAT_ID)의 채팅방으로 채운다.
+(샤드 발송 워커처럼 여러 프로세스가 동시에 여는 경우에는 조정 프로세스가 한 번만 채우고 워커는 seed=False)
+관리: python tools/manage_subscribers.py
+"""
+import os
+import sqlite3
+import threading
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SUBSCRIBERS_DB = os.path.join(BASE_DIR, 'data', 'subscribers.db')
+
+DELIVERY_MODES = ('full', 'summary')
+PAGE_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS subscribers (
+    chat_id    INTEGER PRIMARY KEY,
+    title      TEXT,
+    delivery   TEXT NOT NULL DEFAULT 'full' CHECK (delivery IN ('full', 'summary')),
+    active     INTEGER NOT NULL DEFAULT 1,
+    created_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+CREATE TABLE IF NOT EXISTS subscriber_langs (
+    lang    TEXT NOT NULL,
+    chat_id INTEGER NOT NULL REFERENCES subscribers(chat_id) ON DELETE CASCADE,
+    PRIMARY KEY (lang, chat_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_subscriber_langs_chat ON subscriber_langs (chat_id);
+"""
+
+
+def env_recipients():
+    """환경변수에 설정된 기존 3개 채팅방 {chat_id: [lang]}"""
+    recipients = {}
+    for lang in ('KO', 'EN', 'MN'):
+        chat_id = os.getenv(f'{lang}_CHAT_ID')
+        if chat_id:
+            recipients.setdefault(int(chat_id), []).append(lang)
+    return recipients
+
+
+class SubscriberStore:
+    def __init__(self, db_path=None, seed=True):
+        self.db_path = db_path or SUBSCRIBERS_DB
+        self.seed = seed
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA foreign_keys = ON")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+            # 파일이 이미 있어도(빈 DB 가 먼저 만들어진 경우 등) 채팅방이 하나도 없으면 환경변수로 채움
+            recipients = env_recipients() if self.seed else None
+            if recipients and conn.execute("SELECT 1 FROM subscribers LIMIT 1").fetchone() is None:
+                seeded = self._seed(recipients)
+                print(f"📇 구독자 DB 가 비어 있어 환경변수 채팅방 {seeded}개 등록 ({self.db_path})")
+        return self._conn
+
+    def open(self):
+        """연결만 미리 해 둠 (비어 있으면 이때 환경변수로 채움)"""
+        with self._lock:
+            self._connect()
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _seed(self, recipients):
+        for chat_id, langs in recipients.items():
+            self._upsert(chat_id, langs)
+        self._conn.commit()
+        return len(recipients)
+
+    def _upsert(self, chat_id, langs, delivery='full', title=None):
+        conn = self._conn
+        conn.execute(
+            "INSERT INTO subscribers (chat_id, title, delivery) VALUES (?, ?, ?) "
+            "ON CONFLICT(chat_id) DO UPDATE SET "
+            "title = COALESCE(excluded.title, title), delivery = excluded.delivery, active = 1",
+            (chat_id, title, delivery),
+        )
+        conn.execute("DELETE FROM subscriber_langs WHERE chat_id = ?", (chat_id,))
+        conn.executemany(
+            "INSERT INTO subscriber_langs (lang, chat_id) VALUES (?, ?)",
+            [(lang, chat_id) for lang in dict.fromkeys(langs)],
+        )
+
+    def add(self, chat_id, langs, delivery='full', title=None):
+        """채팅방 등록/갱신 (언어 목록은 통째로 교체, 비활성 상태였다면 다시 활성화)"""
+        if delivery not in DELIVERY_MODES:
+            raise ValueError(f"발송 방식은 {DELIVERY_MODES} 중 하나여야 합니다: {delivery!r}")
+        if not langs:
+            raise ValueError("언어를 하나 이상 지정해야 합니다.")
+        with self._lock:
+            self._connect()
+            self._upsert(int(chat_id), langs, delivery, title)
+            self._conn.commit()
+
+    def remove(self, chat_id):
+        with self._lock:
+            cur = self._connect().execute("DELETE FROM subscribers WHERE chat_id = ?", (int(chat_id),))
+            self._conn.commit()
+            return cur.rowcount > 0
+
+    def set_active(self, chat_id, active):
+        with self._lock:
+            cur = self._connect().execute(
+                "UPDATE subscribers SET active = ? WHERE chat_id = ?", (1 if active else 0, int(chat_id))
+            )
+            self._conn.commit()
+            return cur.rowcount > 0
+
+    def iter_pages(self, page_size=PAGE_SIZE):
+        """활성 채팅방을 chat_id 순 페이지 단위로: [(chat_id, delivery, [lang, ...]), ...]"""
+        last = -(1 << 63)  # chat_id 최솟값 (그룹/채널 id 는 음수)
+        while True:
+            with self._lock:
+                rows = self._connect().execute(
+                    "SELECT s.chat_id, s.delivery, "
+                    "(SELECT group_concat(lang, ',') FROM subscriber_langs l WHERE l.chat_id = s.chat_id) "
+                    "FROM subscribers s WHERE s.chat_id > ? AND s.active = 1 "
+                    "ORDER BY s.chat_id LIMIT ?",
+                    (last, page_size),
+                ).fetchall()
+            if not rows:
+                return
+            yield [(chat_id, delivery, langs.split(',') if langs else []) for chat_id, delivery, langs in rows]
+            if len(rows) < page_size:
+                return
+            last = rows[-1][0]
+
+    def list_all(self):
+        """관리용 전체 목록: [(chat_id, title, delivery, active, 'KO,EN'), ...]"""
+        with self._lock:
+            return self._connect().execute(
+                "SELECT s.chat_id, s.title, s.delivery, s.active, "
+                "(SELECT group_concat(lang, ',') FROM subscriber_langs l WHERE l.chat_id = s.chat_id) "
+                "FROM subscribers s ORDER BY s.chat_id"
+            ).fetchall()
+
+    def count_by_lang(self):
+        """{lang: 활성 채팅방 수}"""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT l.lang, COUNT(*) FROM subscriber_langs l "
+                "JOIN subscribers s ON s.chat_id = l.chat_id WHERE s.active = 1 GROUP BY l.lang"
+            ).fetchall()
+        return dict(rows)
+
+
+_store = None
+
+def get_store(seed=True):
+    """프로세스 전체에서 공유하는 구독자 저장소. seed 는 처음 만들 때만 적용"""
+    global _store
+    if _store is None:
+        _store = SubscriberStore(seed=seed)
+    return _store
@@ -0,0 +1,147 @@
+"""bible.db 번역본 테이블을 메모리에 한 번만 올려두고 SQL 없이 본문을 잘라 쓰는 백엔드.
+
+상주형 발송기/봇에서 BIBLE_RESOLVER_BACKEND=memory 로 켠다.
+언어별로 처음 요청될 때만 적재하므로 MN 을 쓰지 않으면 MN 테이블은 읽지 않는다.
+
+IndexedVerseResolver 는 절 배열 기반 백엔드(메모리, core.bible_binary 의 mmap)의 공통 조회 부분이다.
+백엔드는 번역본 하나를 적재하는 _load_table 만 구현하고, 적재된 객체가
+chapter_bounds(book, chapter) / verses[i] / verse_text(i) 를 제공하면 된다.
+
+언어 하나의 구조 (_TableIndex):
+- text     : 모든 절 본문을 이어 붙인 하나의 문자열
+- offsets  : array('I') 절 i 의 본문 = text[offsets[i]:offsets[i+1]]
+- verses   : array('H') 절 i 의 절 번호
+- chapters : book -> array('I') 장 c 의 절 범위 = [starts[c-1], starts[c])  (마지막 원소는 끝 표시)
+"""
+import threading
+from array import array
+
+from core.bible_scripture_resolver import ScriptureResolver, TABLE_MAP
+
+
+class _TableIndex:
+    __slots__ = ('text', 'offsets', 'verses', 'chapters')
+
+    def __init__(self, rows):
+        parts = []
+        offsets = array('I', [0])
+        verses = array('H')
+        chapters = {}
+        pos = 0
+        book_starts = None
+        last_book = last_chap = None
+
+        # rows: (book, chapter, verse, content) — 원본 입력 순서(rowid) 그대로
+        for book, chap, verse, content in rows:
+            if book != last_book:
+                book_starts = chapters.setdefault(book, array('I'))
+                last_book, last_chap = book, None
+            if chap != last_chap:
+                # 빠진 장이 있으면 빈 범위로 채워 장 번호 = 배열 위치가 되도록 유지
+                while len(book_starts) < chap:
+                    book_starts.append(len(verses))
+                last_chap = chap
+            parts.append(content)
+            pos += len(content)
+            offsets.append(pos)
+            verses.append(verse)
+
+        # 각 책의 마지막 장 끝 표시: 다음 책 첫 절 위치
+        ends = {}
+        boundary = len(verses)
+        for book in reversed(list(chapters)):
+            ends[book] = boundary
+            if chapters[book]:
+                boundary = chapters[book][0]
+        for book, starts in chapters.items():
+            starts.append(ends[book])
+
+        self.text = ''.join(parts)
+        self.offsets = offsets
+        self.verses = verses
+        self.chapters = chapters
+
+    def chapter_bounds(self, book, chapter):
+        """장의 절 인덱스 범위 [lo, hi). 없으면 None"""
+        starts = self.chapters.get(book)
+        if starts is None or chapter < 1 or chapter >= len(starts):
+            return None
+        return starts[chapter - 1], starts[chapter]
+
+    def verse_text(self, i):
+        return self.text[self.offsets[i]:self.offsets[i + 1]]
+
+
+class IndexedVerseResolver(ScriptureResolver):
+    """절 배열 인덱스로 ScriptureResolver 와 같은 조회 API 를 제공하는 백엔드의 공통 부분 (SQL 미사용)"""
+
+    def __init__(self, db_path=None):
+        super().__init__(db_path)
+        self._tables = {}
+        self._load_lock = threading.Lock()
+
+    def close(self):
+        # 적재된 표/mmap 참조도 버려서 다음 조회 때 원본을 다시 읽게 함
+        super().close()
+        with self._load_lock:
+            self._tables = {}
+
+    def _load_table(self, table):
+        """번역본 테이블 하나의 인덱스 (chapter_bounds/verses/verse_text 제공). 원본이 없으면 None"""
+        raise NotImplementedError
+
+    def _table(self, lang_code):
+        table = TABLE_MAP.get(lang_code, TABLE_MAP['KO'])
+        index = self._tables.get(table)
+        if index is not None:
+            return index
+        with self._load_lock:
+            index = self._tables.get(table)
+            if index is None:
+                index = self._load_table(table)
+                if index is None: return None
+                self._tables[table] = index
+        return index
+
+    def _supports_ordinal(self, table):
+        # SQL 범위 쿼리 대신 fetch_chapters 를 책 단위로 이어 붙이는 경로 사용
+        return False
+
+    def fetch_chapters(self, lang_code, book, start_c, end_c):
+        index = self._table(lang_code)
+        if index is None: return None
+        rows = []
+        for c in range(start_c, end_c + 1):
+            bounds = index.chapter_bounds(book, c)
+            if bounds is None: continue
+            for i in range(*bounds):
+                rows.append((c, index.verses[i], index.verse_text(i)))
+        return rows
+
+    def fetch_verses(self, lang_code, book, chapter, start_v=None, end_v=None):
+        index = self._table(lang_code)
+        if index is None: return None
+        bounds = index.chapter_bounds(book, chapter)
+        if bounds is None: return []
+        if start_v and not end_v:
+            end_v = start_v
+        rows = []
+        for i in range(*bounds):
+            v = index.verses[i]
+            if start_v and not (start_v <= v <= end_v): continue
+            rows.append((v, index.verse_text(i)))
+        return rows
+
+
+class MemoryVerseIndex(IndexedVerseResolver):
+    """ScriptureResolver 와 같은 조회 API 를 SQL 없이 메모리 슬라이싱으로 제공"""
+    backend = 'memory'
+
+    def _load_table(self, table):
+        conn = self._connect()
+        if conn is None: return None
+        with self._lock:
+            rows = conn.execute(
+                f"SELECT book, chapter, verse, content FROM {table} ORDER BY rowid"
+            ).fetchall()
+        return _TableIndex(rows)
@@ -2,6 +2,7 @@ import os
 import sys
 import argparse
 import asyncio
+import importlib
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from pathlib import Path
@@ -26,38 +27,118 @@ def load_env_centralized():
 # 실행 전 환경 변수 로드
 load_env_centralized()
 
-# 신규 구조에 맞춘 임포트
-try:
-    from tools.plan_parser import generate_monthly_plan
-    from core.bible_sender import broadcast_messages, send_only_summaries
-except ImportError as e:
-    print(f"❌ 모듈 임포트 실패: {e}")
-    sys.exit(1)
+# 서브커맨드별로 필요한 모듈만 실행 직전에 import (load_command).
+# 예: send/summary 는 AI 파서(PIL, ai.provider, hwpx 파서)를 불러오지 않음.
+# tools/bench_startup.py 가 이 표를 기준으로 명령별 import 시간을 측정한다.
+COMMAND_MODULES = {
+    "run":       ["core.bible_sender"],  # 플랜이 없을 때만 tools.plan_parser 추가 로드
+    "parse":     ["tools.plan_parser"],
+    "send":      ["core.bible_sender"],
+    "prerender": ["core.message_cache"],
+    "summary":   ["core.bible_sender"],
+    "daemon":    ["core.bible_sender", "core.message_cache", "core.scheduler"],
+    "check":     ["tools.check_chat_ids"],
+}
+
+def load_command(name):
+    """명령에 필요한 모듈을 import (이미 로드된 모듈은 재사용)"""
+    try:
+        for module in COMMAND_MODULES[name]:
+            importlib.import_module(module)
+    except ImportError as e:
+        print(f"❌ 모듈 임포트 실패: {e}")
+        sys.exit(1)
+
+# 개인 요약본 수신 대화방 (Mydailybot)
+SUMMARY_CHAT_ID = "5929322817"
 
 def check_plan_exists(year, month):
-    plan_path = os.path.join(BASE_DIR, 'data', 'plans', f"{int(year):04d}_{int(month):02d}.json")
-    return os.path.exists(plan_path)
+    from core.plan_store import get_plan_store
+    return get_plan_store().has_month(year, month)
+
+def prerender_month(year, month):
+    """플랜 JSON + bible.db 로 한 달치 메시지를 모두 렌더링해 캐시에 저장"""
+    from core.message_cache import build_month_cache, cache_file
+    cache = build_month_cache(year, month, force=True)
+    if cache is None:
+        print(f"❌ {year}년 {month}월 플랜(JSON)이 없습니다. 먼저 parse 를 실행하세요.")
+        return False
+    days = cache['days']
+    entries = [langs[lang] for langs in days.values() for lang in langs]
+    count = sum(len(entry['messages']) for entry in entries)
+    unpacked = sum(entry['unpacked'] for entry in entries)
+    print(f"✅ {year}년 {month}월 {len(days)}일치 메시지 {count}개 렌더링 완료 → {os.path.relpath(cache_file(year, month), BASE_DIR)}")
+    print(f"   📦 메시지 묶음: {unpacked}개 → {count}개 (API 호출 {unpacked - count}회 절감)")
+    return True
+
+async def send_day_with_summary(kst_now, client, force=False):
+    """단체방 발송 후, 성공했을 때만 개인 요약본 발송 (같은 발송 클라이언트 사용)"""
+    from core.bible_sender import broadcast_messages, send_only_summaries
+
+    success = await broadcast_messages(kst_now, client=client, force=force)
 
-async def run_smart_mode(year, month, kst_now):
-    """데이터가 없으면 자동 생성 후 발송하는 스마트 모드"""
+    # [수정] 단체방 발송이 성공(True)했을 때만 개인 요약본 발송
+    if success:
+        print(f"💌 개인방(Mydailybot)으로 3개 국어 요약본을 발송합니다...")
+        await send_only_summaries(SUMMARY_CHAT_ID, kst_now, client=client, force=force)
+    else:
+        print(f"⚠️ 단체방 발송이 취소/실패하여 개인 요약본도 발송하지 않습니다.")
+    return success
+
+async def run_smart_mode(year, month, kst_now, client=None, force=False):
+    """데이터가 없으면 자동 생성 후 발송하는 스마트 모드.
+    client 를 넘기면 그 발송 클라이언트를, 아니면 이번 실행 동안 하나를 열어 단체방/요약본 발송에 함께 씀.
+    오늘 이미 전송된 메시지는 보내지 않음 (force 면 다시 발송)"""
     if not check_plan_exists(year, month):
+        from tools.plan_parser import generate_monthly_plan
         print(f"ℹ️ {month}월 데이터가 없습니다. AI 파싱을 먼저 시도합니다...")
-        generate_monthly_plan(year, month)
+        # 관리 봇/데몬의 이벤트 루프를 막지 않도록 별도 스레드에서 파싱
+        await asyncio.to_thread(generate_monthly_plan, year, month)
     
     if check_plan_exists(year, month):
         print(f"🚀 {year}년 {month}월 본문 발송을 시작합니다...")
-        # 단체방 발송 시도
-        success = await broadcast_messages(kst_now)
-        
-        # [수정] 단체방 발송이 성공(True)했을 때만 개인 요약본 발송
-        if success:
-            print(f"💌 개인방(Mydailybot)으로 3개 국어 요약본을 발송합니다...")
-            await send_only_summaries("5929322817", kst_now)
-        else:
-            print(f"⚠️ 단체방 발송이 취소/실패하여 개인 요약본도 발송하지 않습니다.")
+        if client is not None:
+            return await send_day_with_summary(kst_now, client, force=force)
+        from core.bible_sender import create_client
+        try:
+            async with create_client() as client:
+                return await send_day_with_summary(kst_now, client, force=force)
+        except Exception as e:
+            print(f"❌ 텔레그램 연결 실패: {e}")
+            return False
     else:
         print(f"❌ 데이터를 찾거나 생성할 수 없습니다. assets/ 폴더의 파일명을 확인해주세요.")
 
+async def run_daemon():
+    """상주 모드: 매일 DAILY_SEND_TIME(KST)에 스마트 모드 실행. Bot/DB/메시지 캐시는 프로세스 안에서 유지"""
+    from core.bible_sender import create_client
+    from core.message_cache import get_day_messages, refresh_resolver
+    from core.scheduler import DEFAULT_SEND_TIME, parse_send_time, run_daily
+
+    send_time = parse_send_time(os.getenv('DAILY_SEND_TIME', DEFAULT_SEND_TIME))
+
+    async def warm_up(target):
+        # 발송 때 할 일을 미리: 플랜 생성(필요 시) → 메시지 캐시/DB → 봇 연결 확인(getMe)
+        # bible.db / .bin 이 그사이 다시 빌드됐으면 예전 연결/적재본을 버리고 새로 연다
+        await asyncio.to_thread(refresh_resolver)
+        if not check_plan_exists(target.year, target.month):
+            from tools.plan_parser import generate_monthly_plan
+            print(f"ℹ️ {target.month}월 데이터가 없습니다. 워밍업 중 AI 파싱을 먼저 시도합니다...")
+            await asyncio.to_thread(generate_monthly_plan, target.year, target.month)
+        await asyncio.to_thread(get_day_messages, target)
+        await client.bot.get_me()
+
+    async def prime(target):
+        # HTTP keep-alive 연결이 만료되지 않도록 발송 직전에 한 번 더 요청
+        await client.bot.get_me()
+
+    async def job(target):
+        await run_smart_mode(target.year, target.month, target, client=client)
+
+    print(f"🛰️ 데몬 모드 시작 (매일 {send_time:%H:%M:%S} KST 발송)")
+    async with create_client() as client:
+        await run_daily(job, send_time, warmup=warm_up, prime=prime)
+
 async def start():
     parser = argparse.ArgumentParser(description="📖 성경 알림 봇 통합 관리자")
     subparsers = parser.add_subparsers(dest="command", help="명령어 목록")
@@ -66,18 +147,33 @@ async def start():
     run_p = subparsers.add_parser("run", help="스마트 실행 (데이터 없으면 생성 후 발송)")
     run_p.add_argument("--year", type=int, help="연도 (기본: 올해)")
     run_p.add_argument("--month", type=int, help="월 (기본: 이번 달)")
+    run_p.add_argument("--force", action="store_true", help="오늘 이미 발송했어도 처음부터 다시 발송")
     
     # parse: 데이터 생성만
     parse_p = subparsers.add_parser("parse", help="데이터(JSON)만 생성")
     parse_p.add_argument("year", type=int, nargs='?', help="연도 (생략 시 다음 달)")
     parse_p.add_argument("month", type=int, nargs='?', help="월 (생략 시 다음 달)")
+    parse_p.add_argument("--no-cache", action="store_true", help="같은 이미지라도 AI 응답 캐시를 쓰지 않고 새로 요청")
+    parse_p.add_argument("--tiled", action="store_true", help="이미지를 표/주 단위 타일로 나눠 병렬 요청 (AI_TILED=1 과 같음)")
     
     # send: 발송만
     send_p = subparsers.add_parser("send", help="메시지만 발송")
+    send_p.add_argument("--shards", type=int, default=1, help="구독자를 chat_id 해시로 나눠 N개 프로세스로 발송 (기본: 1)")
+    send_p.add_argument("--shard", type=int, help="K번 샤드(0 ~ N-1)만 이 프로세스에서 발송")
+    send_p.add_argument("--force", action="store_true", help="오늘 이미 발송했어도 처음부터 다시 발송")
+
+    # prerender: 한 달치 메시지 사전 렌더링
+    prerender_p = subparsers.add_parser("prerender", help="한 달치 발송 메시지를 미리 렌더링해 캐시 (기본: 이번 달)")
+    prerender_p.add_argument("year", type=int, nargs='?', help="연도 (생략 시 이번 달)")
+    prerender_p.add_argument("month", type=int, nargs='?', help="월 (생략 시 이번 달)")
 
     # summary: 개인톡 요약본 발송
     summary_p = subparsers.add_parser("summary", help="개인 대화방으로 3개 국어 요약본만 발송")
+    summary_p.add_argument("--force", action="store_true", help="오늘 이미 발송했어도 다시 발송")
     
+    # daemon: 상주하며 매일 정해진 시각에 발송
+    daemon_p = subparsers.add_parser("daemon", help="상주 모드 (매일 DAILY_SEND_TIME KST 에 스마트 모드 실행, 기본 06:00)")
+
     # check: 채팅방 ID 확인
     check_p = subparsers.add_parser("check", help="최근 도착한 메시지의 채팅방 ID 확인")
     
@@ -88,27 +184,58 @@ async def start():
     
     # [중요] 모든 작업의 기준이 되는 한국 시간 (KST) 고정
     kst_now = datetime.now(ZoneInfo("Asia/Seoul"))
-    
-    if args.command == "parse":
-        if args.year and args.month:
-            generate_monthly_plan(args.year, args.month)
-        else:
-            from tools.plan_parser import get_next_month
-            nxt_y, nxt_m = get_next_month()
-            print(f"📅 연/월 생략됨. 자동으로 다음 달({nxt_y}년 {nxt_m}월) 데이터를 생성합니다.")
-            generate_monthly_plan(nxt_y, nxt_m)
-    elif args.command == "send":
-        await broadcast_messages(kst_now)
-    elif args.command == "summary":
-        # 사용자 개인 ID (5929322817)로 발송
-        await send_only_summaries("5929322817", kst_now)
-    elif args.command == "check":
-        from tools.check_chat_ids import check_telegram_ids
-        check_telegram_ids()
-    elif args.command == "run":
-        year = args.year if args.year else kst_now.year
-        month = args.month if args.month else kst_now.month
-        await run_smart_mode(year, month, kst_now)
+
+    load_command(args.command)
+    await COMMANDS[args.command](args, kst_now)
+
+# --- 서브커맨드 실행부 (필요한 모듈은 load_command 로 이미 로드됨) ---
+async def cmd_parse(args, kst_now):
+    from tools.plan_parser import generate_monthly_plan, get_next_month
+    if args.year and args.month:
+        generate_monthly_plan(args.year, args.month, no_cache=args.no_cache, tiled=args.tiled)
+    else:
+        nxt_y, nxt_m = get_next_month()
+        print(f"📅 연/월 생략됨. 자동으로 다음 달({nxt_y}년 {nxt_m}월) 데이터를 생성합니다.")
+        generate_monthly_plan(nxt_y, nxt_m, no_cache=args.no_cache, tiled=args.tiled)
+
+async def cmd_send(args, kst_now):
+    from core.bible_sender import broadcast_messages, broadcast_sharded
+    if args.shards > 1 or args.shard is not None:
+        await broadcast_sharded(kst_now, args.shards, only_shard=args.shard, force=args.force)
+    else:
+        await broadcast_messages(kst_now, force=args.force)
+
+async def cmd_prerender(args, kst_now):
+    year = args.year if args.year else kst_now.year
+    month = args.month if args.month else kst_now.month
+    prerender_month(year, month)
+
+async def cmd_summary(args, kst_now):
+    from core.bible_sender import send_only_summaries
+    # 사용자 개인 ID (SUMMARY_CHAT_ID)로 발송
+    await send_only_summaries(SUMMARY_CHAT_ID, kst_now, force=args.force)
+
+async def cmd_daemon(args, kst_now):
+    await run_daemon()
+
+async def cmd_check(args, kst_now):
+    from tools.check_chat_ids import check_telegram_ids
+    check_telegram_ids()
+
+async def cmd_run(args, kst_now):
+    year = args.year if args.year else kst_now.year
+    month = args.month if args.month else kst_now.month
+    await run_smart_mode(year, month, kst_now, force=args.force)
+
+COMMANDS = {
+    "run": cmd_run,
+    "parse": cmd_parse,
+    "send": cmd_send,
+    "prerender": cmd_prerender,
+    "summary": cmd_summary,
+    "daemon": cmd_daemon,
+    "check": cmd_check,
+}
 
 if __name__ == "__main__":
     try:
@@ -3,12 +3,19 @@ Bible Notice Bot — 자체 관리 봇
 TELEGRAM_TOKEN으로 상시 실행, 자기 채팅방 직접 관리.
 - /start, /manage : 인라인 키보드
 - /send, /summary, /run : 직접 트리거
+- /send_force, /summary_force, /run_force : 오늘 이미 보낸 것도 처음부터 다시 발송 (발송 기록 무시)
+- /jobs : 실행 중인 작업과 대기열 확인
+- 트리거된 작업은 main.py 를 새로 띄우지 않고 이 봇의 이벤트 루프에서 asyncio 태스크로 실행
+  (이 봇의 Bot/연결 풀 재사용), 끝나면 관리자 대화방으로 결과와 소요 시간을 보고
 - 매일 자동 발송은 mh_bot systemd timer(bible-daily-send.timer)가 담당
 """
 import asyncio
 import logging
 import os
-import subprocess
+import time
+from collections import deque
+from datetime import datetime
+from zoneinfo import ZoneInfo
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, ReplyKeyboardMarkup, KeyboardButton
 from telegram.ext import CommandHandler, CallbackQueryHandler, ContextTypes, MessageHandler, filters
 from bot_common import load_secrets, require_env, run_bot
@@ -17,19 +24,131 @@ load_secrets()
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 TOKEN    = require_env("TELEGRAM_TOKEN")
 ADMIN_ID = int(os.getenv("ATTENDANCE_TELEGRAM_CHAT_ID", "5929322817"))
-VENV_PY  = os.path.join(os.path.dirname(BASE_DIR), "unified_venv", "bin", "python")
-MAIN_PY  = os.path.join(BASE_DIR, "main.py")
 
 logging.basicConfig(format="%(asctime)s [%(levelname)s] %(message)s", level=logging.INFO)
 log = logging.getLogger(__name__)
 
-
-def _trigger(cmd: str):
-    subprocess.Popen(
-        [VENV_PY, MAIN_PY, cmd],
-        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-    )
-    return f"`{cmd}` 실행 시작됨"
+# main.py 의 루틴을 직접 호출 (import 시 .env 로드 포함)
+from main import SUMMARY_CHAT_ID, run_smart_mode
+from core.bible_sender import SendResult, broadcast_messages, create_client, send_only_summaries
+from core.message_cache import refresh_resolver
+
+# client: 이 봇의 Bot 을 감싼 발송 클라이언트 (연결 풀은 봇 Application 이 소유)
+JOBS = {
+    "send":    lambda now, client: broadcast_messages(now, client=client),
+    "summary": lambda now, client: send_only_summaries(SUMMARY_CHAT_ID, now, client=client),
+    "run":     lambda now, client: run_smart_mode(now.year, now.month, now, client=client),
+    # 발송 기록(core.outbox)의 새 generation 으로 다시 발송
+    "send_force":    lambda now, client: broadcast_messages(now, client=client, force=True),
+    "summary_force": lambda now, client: send_only_summaries(SUMMARY_CHAT_ID, now, client=client, force=True),
+    "run_force":     lambda now, client: run_smart_mode(now.year, now.month, now, client=client, force=True),
+}
+
+
+def _describe_result(cmd, result, elapsed):
+    """작업 반환값 → 관리자 보고 한 줄 (발송 작업은 전송/건너뜀/실패 건수 포함)"""
+    if isinstance(result, SendResult):
+        if result.all_skipped:
+            return (f"⏭️ {cmd}: 오늘 이미 전송되어 보낸 것 없음 — {result.describe()} ({elapsed:.1f}초)\n"
+                    f"다시 보내려면 /{cmd.removesuffix('_force')}_force")
+        if not result:
+            return f"⚠️ {cmd} 종료 — 성공한 전송 없음: {result.describe()} ({elapsed:.1f}초)"
+        return f"✅ {cmd} 완료 — {result.describe()} ({elapsed:.1f}초)"
+    if not result:
+        return f"⚠️ {cmd} 종료 — 성공한 전송 없음 ({elapsed:.1f}초)"
+    return f"✅ {cmd} 완료 ({elapsed:.1f}초)"
+
+
+async def _run_job(cmd: str, bot):
+    """작업 실행 후 관리자에게 결과/소요 시간 보고"""
+    started = time.monotonic()
+    try:
+        # bible.db / .bin 이 다시 빌드됐으면 예전 연결/적재본을 버리고 새로 연다 (데몬 워밍업과 같은 경로)
+        await asyncio.to_thread(refresh_resolver)
+        result = await JOBS[cmd](datetime.now(ZoneInfo("Asia/Seoul")), create_client(bot))
+        report = _describe_result(cmd, result, time.monotonic() - started)
+    except Exception as e:
+        elapsed = time.monotonic() - started
+        log.exception("작업 실패: %s", cmd)
+        report = f"❌ {cmd} 실패 ({elapsed:.1f}초): {e}"
+    log.info(report)
+    try:
+        await bot.send_message(chat_id=ADMIN_ID, text=f"📖 Bible Notice Bot\n{report}")
+    except Exception:
+        log.exception("결과 보고 실패")
+
+
+class JobRegistry:
+    """작업을 한 번에 하나씩 실행하는 대기열 (single-flight).
+
+    모든 작업이 같은 텔레그램 발송 한도를 쓰고 run 은 send/summary 를 포함하므로 서로 겹쳐 돌리지 않는다.
+    - 같은 명령이 이미 실행 중이거나 대기 중이면 새 요청은 무시 (버튼 두 번, 버튼 + /send 등)
+    - 다른 명령은 대기열 뒤에 붙여 앞 작업이 끝난 뒤 실행
+    """
+
+    def __init__(self, runner):
+        self._runner = runner
+        self._queue = deque()
+        self._worker = None  # 실행 태스크 참조 유지 (GC 방지)
+        self.running = None
+        self.running_since = None
+
+    @property
+    def waiting(self):
+        return [cmd for cmd, _ in self._queue]
+
+    def submit(self, cmd, bot):
+        """'started' | 'queued' | 'running' | 'waiting' (뒤의 둘은 중복 요청)"""
+        if cmd == self.running:
+            return 'running'
+        if cmd in self.waiting:
+            return 'waiting'
+        if self.running is None:
+            self._start(cmd)
+            self._worker = asyncio.create_task(self._drain(cmd, bot))
+            return 'started'
+        self._queue.append((cmd, bot))
+        return 'queued'
+
+    def _start(self, cmd):
+        self.running, self.running_since = cmd, time.monotonic()
+
+    async def _drain(self, cmd, bot):
+        while True:
+            try:
+                await self._runner(cmd, bot)
+            finally:
+                self.running = self.running_since = None
+            if not self._queue:
+                return
+            cmd, bot = self._queue.popleft()
+            self._start(cmd)
+
+    def describe(self):
+        lines = []
+        if self.running:
+            lines.append(f"🏃 실행 중: {self.running} ({time.monotonic() - self.running_since:.0f}초째)")
+        else:
+            lines.append("🏃 실행 중인 작업 없음")
+        waiting = self.waiting
+        lines.append(f"⏳ 대기열 {len(waiting)}개" + (f": {', '.join(waiting)}" if waiting else ""))
+        return "\n".join(lines)
+
+
+_jobs = JobRegistry(_run_job)
+
+
+def _trigger(cmd: str, bot):
+    if cmd not in JOBS:
+        return f"알 수 없는 명령: `{cmd}`"
+    status = _jobs.submit(cmd, bot)
+    if status == 'started':
+        return f"`{cmd}` 실행 시작됨 (완료되면 결과를 알려드립니다)"
+    if status == 'queued':
+        return f"`{cmd}` 대기열에 추가됨 (실행 중: `{_jobs.running}`, 대기 {len(_jobs.waiting)}개)"
+    if status == 'running':
+        return f"`{cmd}` 이미 실행 중입니다 — 중복 요청은 무시합니다"
+    return f"`{cmd}` 이미 대기열에 있습니다 — 중복 요청은 무시합니다"
 
 
 def _menu_inline():
@@ -37,6 +156,7 @@ def _menu_inline():
         [InlineKeyboardButton("📤 오늘 말씀 발송 (send)",   callback_data="bible:send")],
         [InlineKeyboardButton("📋 요약만 발송 (summary)",   callback_data="bible:summary")],
         [InlineKeyboardButton("🔄 스마트 모드 (run)",       callback_data="bible:run")],
+        [InlineKeyboardButton("♻️ 강제 재발송 (send_force)", callback_data="bible:send_force")],
     ])
 
 def _menu_reply():
@@ -58,33 +178,45 @@ async def cmd_manage(update: Update, context: ContextTypes.DEFAULT_TYPE):
     )
 
 async def cmd_send(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    await update.message.reply_text(await asyncio.to_thread(_trigger, "send"))
+    await update.message.reply_text(_trigger("send", context.bot))
 
 async def cmd_summary(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    await update.message.reply_text(await asyncio.to_thread(_trigger, "summary"))
+    await update.message.reply_text(_trigger("summary", context.bot))
 
 async def cmd_run(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    await update.message.reply_text(await asyncio.to_thread(_trigger, "run"))
+    await update.message.reply_text(_trigger("run", context.bot))
+
+async def cmd_send_force(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    await update.message.reply_text(_trigger("send_force", context.bot))
+
+async def cmd_summary_force(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    await update.message.reply_text(_trigger("summary_force", context.bot))
+
+async def cmd_run_force(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    await update.message.reply_text(_trigger("run_force", context.bot))
+
+async def cmd_jobs(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    await update.message.reply_text(_jobs.describe())
 
 async def handle_text_menu(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """하단 상주 메뉴 버튼 클릭 처리"""
     text = update.message.text
 
     if text == "📤 말씀 발송":
-        msg = await asyncio.to_thread(_trigger, "send")
+        msg = _trigger("send", context.bot)
         await update.message.reply_text(f"📖 *Bible Notice Bot*\n{msg}", parse_mode="Markdown")
     elif text == "📋 요약만 발송":
-        msg = await asyncio.to_thread(_trigger, "summary")
+        msg = _trigger("summary", context.bot)
         await update.message.reply_text(f"📖 *Bible Notice Bot*\n{msg}", parse_mode="Markdown")
     elif text == "🔄 스마트 모드":
-        msg = await asyncio.to_thread(_trigger, "run")
+        msg = _trigger("run", context.bot)
         await update.message.reply_text(f"📖 *Bible Notice Bot*\n{msg}", parse_mode="Markdown")
 
 async def handle_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
     await query.answer()
     cmd = query.data.split(":")[-1]
-    msg = await asyncio.to_thread(_trigger, cmd)
+    msg = _trigger(cmd, context.bot)
     await query.edit_message_text(
         f"📖 *Bible Notice Bot*\n{msg}",
         parse_mode="Markdown", reply_markup=_menu_inline()
@@ -98,6 +230,10 @@ def main():
         CommandHandler("send",    cmd_send),
         CommandHandler("summary", cmd_summary),
         CommandHandler("run",     cmd_run),
+        CommandHandler("send_force",    cmd_send_force),
+        CommandHandler("summary_force", cmd_summary_force),
+        CommandHandler("run_force",     cmd_run_force),
+        CommandHandler("jobs",    cmd_jobs),
         CallbackQueryHandler(handle_callback),
         MessageHandler(filters.TEXT & ~filters.COMMAND, handle_text_menu),
     ]
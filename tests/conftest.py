@@ -0,0 +1,7 @@
+import os
+import sys
+
+# 저장소 루트(core/ai/tools 패키지)를 import 경로에 추가
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
@@ -0,0 +1,70 @@
+import pytest
+
+from core.bible_scripture_resolver import (
+    TELEGRAM_TEXT_LIMIT,
+    iter_telegram_chunks,
+    split_text_for_telegram,
+    utf16_len,
+)
+from core.message_render import BLOCK_SEPARATOR, pack_messages
+
+
+def _passage(verses, body="말씀 🙏 " * 6):
+    return "(시 119 / 개역한글)\n" + "\n".join(f"{v}. {body}{v}" for v in range(1, verses + 1))
+
+
+def test_utf16_len_counts_astral_characters_twice():
+    assert utf16_len("가a") == 2
+    assert utf16_len("🙏") == 2
+    assert utf16_len("📖 말씀") == 5
+
+
+@pytest.mark.parametrize("limit", [50, 120, 4096])
+def test_chunks_respect_utf16_limit_and_keep_verses_whole(limit):
+    text = _passage(200)
+    chunks = list(iter_telegram_chunks(text, limit))
+    assert all(utf16_len(chunk) <= limit for chunk in chunks)
+    # 절 경계에서만 잘렸으므로 다시 이으면 원문
+    assert "\n".join(chunks) == text
+    # 문자 수만 보면 limit 이하지만 UTF-16 으로는 넘는 조각이 없어야 함
+    assert max(len(chunk) for chunk in chunks) < limit or limit == 4096
+
+
+def test_long_verse_is_hard_split_without_blank_chunks():
+    verse = "1. " + "태초에 🙏" * 40 + " " * 30 + "\t" * 30 + " 끝"
+    chunks = list(iter_telegram_chunks("\n \n" + verse + "\n\n   \n", 60))
+    assert chunks and all(chunk.strip() for chunk in chunks)
+    assert all(utf16_len(chunk) <= 60 for chunk in chunks)
+    assert chunks[-1].endswith("끝")
+
+
+def test_blank_text_yields_nothing():
+    assert list(iter_telegram_chunks("", 10)) == []
+    assert list(iter_telegram_chunks(" \n\t\n   ", 10)) == []
+
+
+def test_split_text_uses_the_shared_limit():
+    text = _passage(400)
+    assert split_text_for_telegram(text) == list(iter_telegram_chunks(text, TELEGRAM_TEXT_LIMIT))
+    assert all(utf16_len(chunk) <= TELEGRAM_TEXT_LIMIT for chunk in split_text_for_telegram(text))
+
+
+def test_packer_joins_small_blocks_in_order():
+    blocks = ["요약", "QT 본문", "", "시편 본문"]
+    assert pack_messages(blocks, limit=100) == [BLOCK_SEPARATOR.join(["요약", "QT 본문", "시편 본문"])]
+
+
+def test_packer_starts_new_message_instead_of_splitting_a_block_that_fits():
+    summary, qt, ps = "요약 " * 10, "가" * 70, "나" * 20
+    messages = pack_messages([summary, qt, ps], limit=100)
+    assert messages == [summary, BLOCK_SEPARATOR.join([qt, ps])]
+
+
+def test_packer_splits_only_long_blocks_and_fills_remaining_room():
+    summary, long_block = "📖 요약", _passage(30)
+    messages = pack_messages([summary, long_block], limit=120)
+    assert messages[0].startswith(summary + BLOCK_SEPARATOR)
+    assert all(utf16_len(message) <= 120 for message in messages)
+    assert all(message.strip() for message in messages)
+    # 줄 단위로만 나눴으므로 합치면 원래 블록들
+    assert "\n".join(messages) == summary + BLOCK_SEPARATOR + long_block
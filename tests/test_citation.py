@@ -0,0 +1,84 @@
+import glob
+import json
+import os
+
+import pytest
+
+from core.citation import BOOK_IDS, chapter_citation, parse_citation
+from core.plan_format import parse_plan
+
+PLANS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'plans')
+COLUMN_BOOK = {'ps': '시', 'pr': '잠'}
+
+
+def _span(cite):
+    return (cite.book_id, cite.start_chapter, cite.start_verse,
+            cite.end_book_id, cite.end_chapter, cite.end_verse)
+
+
+@pytest.mark.parametrize("text, span", [
+    ("삼상 17:22-40", (9, 17, 22, 9, 17, 40)),
+    ("시 1-3", (19, 1, None, 19, 3, None)),
+    ("행26-롬2", (44, 26, None, 45, 2, None)),
+    ("시 119-65-88", (19, 119, 65, 19, 119, 88)),
+    ("욥 1:35-2:5", (18, 1, 35, 18, 2, 5)),
+    ("잠23장", (20, 23, None, 20, 23, None)),
+    ("마 5", (40, 5, None, 40, 5, None)),
+])
+def test_parse_citation_spans(text, span):
+    assert _span(parse_citation(text)) == span
+
+
+def test_bare_citation_and_memoization():
+    cite = parse_citation("1: 18-25")
+    assert cite.book is None and cite.is_bare
+    assert _span(cite.with_book('마')) == (40, 1, 18, 40, 1, 25)
+    assert parse_citation("마 1-5") is parse_citation("마 1-5")
+    assert parse_citation("") is None
+
+
+def test_display_translates_book_only():
+    assert parse_citation("마1-4").display('EN') == "Matt 1-4"
+    assert parse_citation("마1-4").display('KO') == "마1-4"
+
+
+@pytest.mark.parametrize("book, cell, span", [
+    ('시', "1-3", (19, 1, None, 19, 3, None)),
+    ('시', "시 119-65-88", (19, 119, 65, 19, 119, 88)),
+    ('잠', "14", (20, 14, None, 20, 14, None)),
+    ('잠', "잠 3:1-12", (20, 3, 1, 20, 3, 12)),
+])
+def test_chapter_citation_same_book(book, cell, span):
+    assert _span(chapter_citation(book, cell)) == span
+
+
+@pytest.mark.parametrize("book, cell", [
+    ('잠', "삼상 10:1-27"),
+    ('잠', "딤전 6:11-21"),
+    ('잠', "시28편"),
+    ('시', "잠 3"),
+])
+def test_chapter_citation_foreign_book_is_unresolvable(book, cell):
+    # 다른 책이 적힌 칸을 시/잠 책의 장·절로 바꿔 읽지 않는다
+    cite = chapter_citation(book, cell)
+    assert not cite.is_resolvable
+    assert cite.raw == cell
+
+
+@pytest.mark.parametrize("path", sorted(glob.glob(os.path.join(PLANS_DIR, '*.json'))),
+                         ids=os.path.basename)
+def test_plan_cells_never_resolve_to_another_book(path):
+    """data/plans 의 시/잠 칸: 해석된 인용은 항상 그 칸에 적힌 책(없으면 칸의 책)을 가리킨다"""
+    with open(path, 'r', encoding='utf-8') as f:
+        plan = parse_plan(json.load(f))
+    for day, entry in plan.items():
+        for kind, book in COLUMN_BOOK.items():
+            raw = getattr(entry, kind)
+            if not raw:
+                continue
+            written = parse_citation(raw).book
+            cite = chapter_citation(book, raw)
+            if written not in (None, book):
+                assert not cite.is_resolvable, f"{day}일 {kind} {raw!r}"
+            elif cite.is_resolvable:
+                assert cite.book_id == BOOK_IDS[book], f"{day}일 {kind} {raw!r}"
@@ -0,0 +1,33 @@
+import re
+import sys
+import types
+
+import pytest
+
+pytest.importorskip("telegram")
+
+from core.bible_sender import SendResult
+
+
+@pytest.fixture(scope="module")
+def manager_bot():
+    # bot_common 은 배포 환경(상위 폴더)에서 제공되는 부트스트랩 모듈 → 테스트용 대역으로 대체
+    env = pytest.MonkeyPatch()
+    env.setenv("TELEGRAM_TOKEN", "test-token")
+    env.setitem(sys.modules, "bot_common", types.SimpleNamespace(
+        load_secrets=lambda: None,
+        require_env=lambda key: "test-token",
+        run_bot=lambda *args, **kwargs: None,
+    ))
+    import manager_bot
+    yield manager_bot
+    env.undo()
+
+
+def test_skip_hint_names_a_registered_command(manager_bot):
+    skipped = SendResult(ok=True, skipped=3)
+    assert skipped.all_skipped
+    for cmd in manager_bot.JOBS:
+        report = manager_bot._describe_result(cmd, skipped, 0.1)
+        hinted = re.findall(r"/(\w+)", report)
+        assert hinted and all(name in manager_bot.JOBS for name in hinted), (cmd, report)
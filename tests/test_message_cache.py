@@ -0,0 +1,84 @@
+import os
+import sqlite3
+
+import pytest
+
+import core.bible_scripture_resolver as resolver
+from core import bible_binary, message_cache
+from core.bible_binary import MmapVerseIndex, bin_path, write_bible_binary
+from core.bible_scripture_resolver import TABLE_MAP, ScriptureResolver
+
+
+def _fingerprint(monkeypatch, source, previous=None):
+    monkeypatch.setattr(resolver, '_resolver', source)
+    return message_cache._db_fingerprint(previous)
+
+
+def test_mmap_fingerprint_follows_bin_files(tmp_path, monkeypatch):
+    for table in TABLE_MAP.values():
+        write_bible_binary(bin_path(table, str(tmp_path)), [('창', 1, 1, '태초에')])
+    mmap = MmapVerseIndex(str(tmp_path))
+    first = _fingerprint(monkeypatch, mmap)
+    assert first['backend'] == 'mmap' and first['hash']
+    assert set(first['files']) == {f"{table}.bin" for table in TABLE_MAP.values()}
+    assert _fingerprint(monkeypatch, mmap, first) == first
+
+    write_bible_binary(bin_path(TABLE_MAP['EN'], str(tmp_path)), [('Gen', 1, 1, 'In the beginning')])
+    changed = _fingerprint(monkeypatch, mmap, first)
+    assert changed['hash'] != first['hash']
+    assert changed['files'][f"{TABLE_MAP['KO']}.bin"] == first['files'][f"{TABLE_MAP['KO']}.bin"]
+
+
+def test_backend_name_is_part_of_cache_key(tmp_path, monkeypatch):
+    missing = _fingerprint(monkeypatch, ScriptureResolver(str(tmp_path / "bible.db")))
+    assert missing == {'backend': 'sqlite', 'files': {'bible.db': {'stat': None, 'hash': None}}, 'hash': None}
+    plan = "00" * 32
+    assert message_cache._cache_key(plan, 'sqlite', None) != message_cache._cache_key(plan, 'mmap', None)
+
+
+class _FakePlans:
+    def month_digest(self, year, month):
+        return "11" * 32
+
+    def get_month(self, year, month):
+        return {}
+
+
+def _write_source(tmp_path, backend, text):
+    """원본을 새로 빌드해 원자적으로 교체 (임시 파일 → os.replace)"""
+    rows = [('창', 1, 1, text)]
+    for table in TABLE_MAP.values():
+        if backend == 'mmap':
+            write_bible_binary(str(tmp_path / f"{table}.tmp"), rows)
+            os.replace(tmp_path / f"{table}.tmp", bin_path(table, str(tmp_path)))
+    if backend != 'mmap':
+        conn = sqlite3.connect(tmp_path / "bible.tmp")
+        for table in TABLE_MAP.values():
+            conn.execute(f"CREATE TABLE {table} (book TEXT, chapter INTEGER, verse INTEGER, content TEXT)")
+            conn.executemany(f"INSERT INTO {table} VALUES (?,?,?,?)", rows)
+        conn.commit()
+        conn.close()
+        os.replace(tmp_path / "bible.tmp", tmp_path / "bible.db")
+
+
+@pytest.mark.parametrize("backend", ['sqlite', 'memory', 'mmap'])
+def test_rebuilt_source_is_rendered_again(tmp_path, monkeypatch, backend):
+    monkeypatch.setenv('BIBLE_RESOLVER_BACKEND', backend)
+    monkeypatch.setattr(resolver, 'DB_FILE', str(tmp_path / "bible.db"))
+    monkeypatch.setattr(bible_binary, 'BIN_DIR', str(tmp_path))
+    monkeypatch.setattr(resolver, '_resolver', None)
+    monkeypatch.setattr(message_cache, '_seen_db', None)
+    monkeypatch.setattr(message_cache, '_loaded', {})
+    monkeypatch.setattr(message_cache, 'CACHE_DIR', str(tmp_path / "cache"))
+    monkeypatch.setattr(message_cache, 'get_plan_store', _FakePlans)
+    monkeypatch.setattr(message_cache, 'render_month',
+                        lambda plan, year, month: {'1': resolver.get_qt_text('창 1:1')})
+    try:
+        _write_source(tmp_path, backend, '옛 본문')
+        assert '옛 본문' in message_cache.build_month_cache(2026, 7)['days']['1']
+
+        _write_source(tmp_path, backend, '새로 빌드한 본문')
+        rebuilt = message_cache.build_month_cache(2026, 7)['days']['1']
+        assert '새로 빌드한 본문' in rebuilt and '옛 본문' not in rebuilt
+    finally:
+        resolver.reset_resolver()
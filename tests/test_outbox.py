@@ -0,0 +1,70 @@
+import asyncio
+import types
+
+from core import bible_sender
+from core.bible_sender import SendResult
+from core.outbox import Outbox
+
+DAY = "2026-07-01"
+
+
+def test_resume_from_first_unacked_message(tmp_path):
+    outbox = Outbox(str(tmp_path / "outbox.db"))
+    generation = outbox.begin(DAY)
+    assert generation == 1
+    outbox.queued(DAY, generation, [(-100, 'KO', i) for i in range(4)])
+    outbox.acked(DAY, generation, -100, 'KO', 0, 11)
+    outbox.acked(DAY, generation, -100, 'KO', 1, 12)
+    # 중단 후 다시 실행: 같은 generation, 2번 메시지부터
+    assert outbox.begin(DAY) == generation
+    assert outbox.progress(DAY, generation, [-100, -200]) == {(-100, 'KO'): 2}
+    outbox.close()
+
+
+def test_finished_day_is_skipped_until_forced(tmp_path):
+    path = str(tmp_path / "outbox.db")
+    outbox = Outbox(path)
+    generation = outbox.begin(DAY)
+    for i in range(2):
+        outbox.acked(DAY, generation, -100, 'EN', i)
+    outbox.close()
+
+    # 다른 프로세스에서 다시 열어도 같은 기록
+    outbox = Outbox(path)
+    assert outbox.progress(DAY, outbox.begin(DAY), [-100]) == {(-100, 'EN'): 2}
+    forced = outbox.begin(DAY, force=True)
+    assert forced == generation + 1
+    assert outbox.progress(DAY, forced, [-100]) == {}
+    # 다른 날짜는 독립
+    assert outbox.begin("2026-07-02") == 1
+    outbox.close()
+
+
+def test_acks_are_buffered_and_written_in_batches(tmp_path, monkeypatch):
+    outbox = Outbox(str(tmp_path / "outbox.db"))
+    monkeypatch.setattr(bible_sender, 'get_outbox', lambda: outbox)
+    monkeypatch.setattr(bible_sender, 'ACK_BATCH', 3)
+    generation = outbox.begin(DAY)
+    starts = {(-100, 'KO'): 2, (-200, 'EN'): 0}
+
+    async def send():
+        acks = bible_sender._AckBuffer(DAY, generation, starts)
+        for index in range(4):
+            acks.on_sent(-100, 'KO', index, types.SimpleNamespace(message_id=index))
+        acks.on_sent(-200, 'EN', 0, None)
+        await acks.close()
+
+    asyncio.run(send())
+    # 이어 보낸 채팅방은 시작 번호(2)부터 센 번호로 기록
+    assert outbox.progress(DAY, generation, [-100, -200]) == {(-100, 'KO'): 6, (-200, 'EN'): 1}
+    outbox.acked_many(DAY, generation, [(-200, 'EN', 1, None), (-200, 'EN', 2, 99)])
+    assert outbox.progress(DAY, generation, [-200]) == {(-200, 'EN'): 3}
+    outbox.close()
+
+
+def test_send_result_reports_skipped_runs_as_success_without_sends():
+    result = SendResult.from_report(
+        {'sent': {'KO': 0, 'EN': 0, 'MN': 0}, 'skipped': 3, 'failures': []}, ok=True)
+    assert result and result.all_skipped
+    assert result.describe() == "전송 0건, 이미 전송돼 건너뜀 3건, 실패 0건"
+    assert not SendResult(failed=1).all_skipped
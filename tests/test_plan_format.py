@@ -0,0 +1,83 @@
+import glob
+import json
+import os
+
+import pytest
+
+from core.citation import BOOK_IDS, parse_citation
+from core.plan_format import (
+    CITED,
+    COLUMN_BOOK_IDS,
+    PlanDay,
+    dump_plan,
+    load_plan,
+    parse_plan,
+    plan_version,
+)
+
+PLANS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'plans')
+PLAN_FILES = sorted(glob.glob(os.path.join(PLANS_DIR, '*.json')))
+
+
+def _key(cite):
+    return (cite.book_id, cite.start_chapter, cite.start_verse,
+            cite.end_book_id, cite.end_chapter, cite.end_verse)
+
+
+def _cites(plan):
+    return {day: {kind: _key(cite) for kind, cite in entry.citations().items()} for day, entry in plan.items()}
+
+
+V1_PLAN = {
+    "1": ["마 1-5", "왕하 1-3", "시 119-65-88", "잠 1", "욥 1:1-18"],
+    "2": ["마1-4", "35", "2", "삼상 1:1-18"],           # 4칸 달: 잠 칸에 다른 책
+    "3": ["", "", "1", "시28편", "1: 18-25"],            # 책 이름 없는 QT 는 마태복음
+    "4": ["수양회", "", "", "", ""],
+}
+
+
+def test_v1_to_v2_round_trip(tmp_path):
+    v1 = parse_plan(V1_PLAN)
+    path = tmp_path / "2026_01.json"
+    dump_plan(v1, str(path))
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    assert plan_version(data) == 2
+    v2 = load_plan(str(path))
+    assert {d: e.row for d, e in v2.items()} == {d: e.row for d, e in v1.items()}
+    assert _cites(v2) == _cites(v1)
+    # 저장된 구간을 쓰는 경로와 문자열을 다시 파싱하는 경로가 같은 결과
+    assert all(v2[d].spans is not None for d in v2)
+
+
+def test_foreign_book_cells_are_stored_without_spans():
+    day = PlanDay.from_row(V1_PLAN["2"]).decode_spans()
+    assert 'pr' not in day.spans
+    assert not day.citations()['pr'].is_resolvable
+    day = PlanDay.from_row(V1_PLAN["3"]).decode_spans()
+    assert 'pr' not in day.spans
+    assert day.spans['ps'] == (19, 1, None, 19, 1, None)
+    assert day.spans['qt'] == (40, 1, 18, 40, 1, 25)
+
+
+def test_stale_span_for_another_book_is_ignored():
+    # 이전 파서가 '삼상 1:1-18' 을 잠 1:1-18 로 풀어 저장한 v2 줄
+    entry = {"nt": "", "ot": "", "ps": "", "pr": "삼상 1:1-18", "qt": "",
+             "spans": {"pr": [20, 1, 1, 20, 1, 18]}}
+    assert not PlanDay.from_json(entry).citations()['pr'].is_resolvable
+
+
+@pytest.mark.parametrize("path", PLAN_FILES, ids=os.path.basename)
+def test_stored_plans_spans_match_cells(path):
+    """data/plans 의 저장된 구간 = 칸 문자열을 지금 파서로 다시 푼 결과, 시/잠 구간은 그 칸의 책"""
+    stored = load_plan(path)
+    for day, entry in stored.items():
+        fresh = PlanDay.from_row(entry.row).decode_spans()
+        assert entry.spans == fresh.spans, f"{day}일"
+        for kind, book_id in COLUMN_BOOK_IDS.items():
+            if kind in entry.spans:
+                assert entry.spans[kind][0] == book_id, f"{day}일 {kind}"
+        for kind in CITED:
+            written = parse_citation(getattr(entry, kind)).book if getattr(entry, kind) else None
+            if kind in entry.spans and written in BOOK_IDS:
+                assert entry.spans[kind][0] == BOOK_IDS[written], f"{day}일 {kind}"
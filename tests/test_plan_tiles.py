@@ -0,0 +1,42 @@
+import calendar
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from tools.plan_tiles import BR_TILE_SCHEMA, extract_plan_tiled
+
+YEAR, MONTH = 2026, 7
+LAST_DAY = calendar.monthrange(YEAR, MONTH)[1]
+
+
+class FakeProvider:
+    """타일 프롬프트가 맡긴 날짜 범위마다 항목을 돌려줌 (drop 에 든 날짜는 빠뜨림)"""
+
+    def __init__(self, drop=()):
+        self.drop = set(drop)
+
+    def generate_from_images(self, images, prompt, schema):
+        if schema is BR_TILE_SCHEMA:
+            first = 1 if "days 1 to" in prompt else 17
+            days = range(first, 17 if first == 1 else LAST_DAY + 1)
+            return {"days": [{"day": d, "nt": f"마 {d}", "ot": "", "psalms": str(d), "proverbs": ""}
+                             for d in days if d not in self.drop]}
+        return {"days": [{"day": d, "qt": f"요 {d}:1-5"} for d in range(1, LAST_DAY + 1)]}
+
+
+def _images():
+    # 괘선 없는 흰 이미지: BR 은 좌우 두 타일, QT 는 한 장
+    return Image.new("RGB", (200, 100), "white"), Image.new("RGB", (200, 100), "white")
+
+
+def test_tiles_are_merged_when_every_day_is_present():
+    result = extract_plan_tiled(FakeProvider(), *_images(), YEAR, MONTH, workers=2)
+    assert [entry["day"] for entry in result["days"]] == list(range(1, LAST_DAY + 1))
+    assert result["days"][16] == {"day": 17, "nt": "마 17", "ot": "", "psalms": "17", "proverbs": "", "qt": "요 17:1-5"}
+
+
+def test_missing_days_fall_back_to_whole_image(caplog):
+    with caplog.at_level("WARNING", logger="bible_bot.plan_tiles"):
+        assert extract_plan_tiled(FakeProvider(drop={16, 17}), *_images(), YEAR, MONTH, workers=2) is None
+    assert "BR [16, 17]" in caplog.text
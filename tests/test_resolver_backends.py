@@ -0,0 +1,113 @@
+import sqlite3
+
+import pytest
+
+from core.bible_binary import MmapVerseIndex, bin_path, write_bible_binary
+from core.bible_scripture_resolver import BIBLE_MAP, BOOK_IDS, TABLE_MAP, ScriptureResolver
+from core.plan_format import PlanDay
+from core.verse_index import MemoryVerseIndex
+
+# 책: {장: 절 수}. 시 3편은 일부러 빠뜨림 (빈 장)
+CHAPTERS = {
+    '욥': {1: 3, 2: 4},
+    '시': {1: 3, 2: 2, 4: 2, 119: 5},
+    '잠': {1: 2, 23: 2},
+    '마': {1: 4},
+    '행': {26: 2, 27: 1, 28: 2},
+    '롬': {1: 2, 2: 3},
+}
+
+
+def _rows(lang):
+    """(책 번호, book, chapter, verse, content) — 정경 순서"""
+    rows = []
+    for book_ko, chapters in CHAPTERS.items():
+        book = book_ko if lang == 'KO' else BIBLE_MAP[book_ko][lang]
+        for chapter, count in chapters.items():
+            for verse in range(1, count + 1):
+                rows.append((BOOK_IDS[book_ko], book, chapter, verse, f"{lang} {book_ko}{chapter}:{verse} 말씀 🙏"))
+    return rows
+
+
+@pytest.fixture(scope="module")
+def bible_dir(tmp_path_factory):
+    """신규 스키마 bible.db, 구 스키마 old.db, mmap 용 .bin 파일"""
+    path = tmp_path_factory.mktemp("bible")
+    new, old = sqlite3.connect(path / "bible.db"), sqlite3.connect(path / "old.db")
+    for lang, table in TABLE_MAP.items():
+        rows = _rows(lang)
+        new.execute(f"CREATE TABLE {table} (ordinal INTEGER PRIMARY KEY, book_id INTEGER, "
+                    f"book TEXT, chapter INTEGER, verse INTEGER, content TEXT)")
+        new.execute(f"CREATE UNIQUE INDEX idx_{table}_ref ON {table} (book_id, chapter, verse)")
+        new.executemany(f"INSERT INTO {table} VALUES (?,?,?,?,?,?)",
+                        [(ordinal, *row) for ordinal, row in enumerate(rows, 1)])
+        old.execute(f"CREATE TABLE {table} (book TEXT, chapter INTEGER, verse INTEGER, content TEXT)")
+        old.executemany(f"INSERT INTO {table} VALUES (?,?,?,?)", [row[1:] for row in rows])
+        write_bible_binary(bin_path(table, str(path)), [row[1:] for row in rows])
+    for conn in (new, old):
+        conn.commit()
+        conn.close()
+    return path
+
+
+@pytest.fixture(scope="module")
+def backends(bible_dir):
+    resolvers = {
+        'sqlite': ScriptureResolver(str(bible_dir / "bible.db")),
+        'sqlite-v1': ScriptureResolver(str(bible_dir / "old.db")),
+        'memory': MemoryVerseIndex(str(bible_dir / "bible.db")),
+        'mmap': MmapVerseIndex(str(bible_dir)),
+    }
+    yield resolvers
+    for resolver in resolvers.values():
+        resolver.close()
+
+
+CITATIONS = [
+    '욥 1:2-3', '욥 2', '욥 1:2-2:3', '욥 1:5-2:2',  # 시작 절이 없는 장 넘김 구간
+    '시 1-4', '시 3', '시 2-3', '시 119-2-4', '시 119:4-9',
+    '행26-롬1', '행 27-롬 2:2', '롬 2:9', '마 5', '1: 2-3',
+]
+
+
+def test_fixture_has_new_schema(backends):
+    assert backends['sqlite']._supports_ordinal(TABLE_MAP['KO'])
+    assert not backends['sqlite-v1']._supports_ordinal(TABLE_MAP['KO'])
+
+
+@pytest.mark.parametrize("lang", list(TABLE_MAP))
+@pytest.mark.parametrize("citation", CITATIONS)
+def test_backends_agree_on_passages(backends, citation, lang):
+    texts = {name: resolver.get_qt_text(citation, lang) for name, resolver in backends.items()}
+    assert len(set(texts.values())) == 1, texts
+
+
+@pytest.mark.parametrize("lang", list(TABLE_MAP))
+def test_backends_agree_on_chapter_cells(backends, lang):
+    for book, cell in [('시', '1-3'), ('시', '119-3-5'), ('잠', '23장'), ('잠', '삼상 1:1-18')]:
+        texts = {name: resolver.get_chapter_text(book, cell, lang) for name, resolver in backends.items()}
+        assert len(set(texts.values())) == 1, (cell, texts)
+
+
+def test_span_starting_after_last_verse_reads_next_chapter(backends):
+    text = backends['sqlite'].get_qt_text('욥 1:5-2:2', 'EN')
+    assert text.splitlines()[0] == "(Job 1:5-2:2 / ESV)"
+    assert "1. EN 욥2:1" in text and "2. EN 욥2:2" in text and "욥1:" not in text
+    assert backends['sqlite'].get_qt_text('욥 1:5-9', 'KO') is None
+
+
+def test_month_batch_matches_single_lookups(backends):
+    plan = {str(day): PlanDay.from_row(["", "", ps, pr, qt]) for day, (ps, pr, qt) in enumerate([
+        ("1-3", "1", "욥 1:5-2:2"),
+        ("119-2-4", "23", "행26-롬1"),
+        ("3", "딤전 6:11-21", "1: 2-3"),
+    ], 1)}
+    months = {name: resolver.resolve_month(plan) for name, resolver in backends.items()}
+    expected = {
+        day: {lang: {kind: backends['sqlite'].get_passage_text(cite, lang)
+                     for kind, cite in entry.citations().items()} for lang in TABLE_MAP}
+        for day, entry in plan.items()
+    }
+    for name, month in months.items():
+        assert month == expected, name
+    assert expected['3']['KO']['pr'] is None
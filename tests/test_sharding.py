@@ -0,0 +1,33 @@
+import zlib
+
+import pytest
+
+from core.bible_sender import _merge_reports, shard_of
+
+CHAT_IDS = sorted({-1001234567890, -100, -200, -300, 5929322817, 42, *range(-5000, 5000, 7)})
+
+
+@pytest.mark.parametrize("shards", [1, 2, 4, 7])
+def test_every_chat_lands_in_exactly_one_shard(shards):
+    buckets = [{chat for chat in CHAT_IDS if shard_of(chat, shards) == k} for k in range(shards)]
+    assert set().union(*buckets) == set(CHAT_IDS)
+    assert sum(len(bucket) for bucket in buckets) == len(CHAT_IDS)
+    if shards > 1:
+        assert all(buckets), "해시가 한 샤드로 몰림"
+
+
+def test_shard_is_stable_across_processes_and_id_types():
+    # 파이썬 hash() 와 달리 실행마다 바뀌지 않는 crc32 기준
+    assert shard_of(-1001234567890, 4) == zlib.crc32(b"-1001234567890") % 4
+    assert shard_of("-100", 4) == shard_of(-100, 4)
+
+
+def test_merge_reports_sums_shards_and_skips_failed_ones():
+    def report(sent, skipped, failures=()):
+        return {'sent': {'KO': sent, 'EN': 0, 'MN': 0}, 'total': {'KO': sent + len(failures), 'EN': 0, 'MN': 0},
+                'failures': list(failures), 'stats': {'sent': sent, 'throttled': 1, 'retried': 0},
+                'skipped': skipped, 'resumed': 0, 'elapsed': 1.0, 'shard': 0}
+    merged = _merge_reports([report(2, 1), report(1, 0, [(-5, 'KO', 'Forbidden')]), {'shard': 2, 'error': 'x'}])
+    assert merged['sent']['KO'] == 3 and merged['total']['KO'] == 4
+    assert merged['skipped'] == 1 and merged['failures'] == [(-5, 'KO', 'Forbidden')]
+    assert merged['stats'] == {'sent': 3, 'throttled': 2, 'retried': 0}
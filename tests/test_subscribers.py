@@ -0,0 +1,57 @@
+import sqlite3
+
+from core.subscribers import SCHEMA, SubscriberStore
+
+
+def _env(monkeypatch, ko="-100", en="-100", mn="-200"):
+    monkeypatch.setenv("KO_CHAT_ID", ko)
+    monkeypatch.setenv("EN_CHAT_ID", en)
+    monkeypatch.setenv("MN_CHAT_ID", mn)
+
+
+def _pages(store):
+    return [row for page in store.iter_pages(page_size=1) for row in page]
+
+
+def test_seeds_from_env_when_db_exists_but_is_empty(tmp_path, monkeypatch):
+    path = tmp_path / "subscribers.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    conn.close()
+    _env(monkeypatch)
+    store = SubscriberStore(str(path))
+    assert _pages(store) == [(-200, 'full', ['MN']), (-100, 'full', ['EN', 'KO'])]
+    store.close()
+
+
+def test_does_not_reseed_when_subscribers_exist(tmp_path, monkeypatch):
+    path = str(tmp_path / "subscribers.db")
+    monkeypatch.delenv("KO_CHAT_ID", raising=False)
+    monkeypatch.delenv("EN_CHAT_ID", raising=False)
+    monkeypatch.delenv("MN_CHAT_ID", raising=False)
+    store = SubscriberStore(path)
+    store.add(-300, ['KO'], delivery='summary')
+    store.set_active(-300, False)
+    store.close()
+
+    _env(monkeypatch)
+    store = SubscriberStore(path)
+    assert _pages(store) == []
+    assert [row[0] for row in store.list_all()] == [-300]
+    store.close()
+
+
+def test_worker_store_does_not_seed(tmp_path, monkeypatch):
+    path = str(tmp_path / "subscribers.db")
+    _env(monkeypatch)
+    worker = SubscriberStore(path, seed=False)
+    assert _pages(worker) == []
+    worker.close()
+
+    # 조정 프로세스가 한 번 열어 채운 뒤에는 워커도 같은 목록을 읽음
+    coordinator = SubscriberStore(path)
+    coordinator.open()
+    coordinator.close()
+    worker = SubscriberStore(path, seed=False)
+    assert [row[0] for row in _pages(worker)] == [-200, -100]
+    worker.close()
@@ -0,0 +1,117 @@
+"""본문 분할 벤치마크: 기존 split_text_for_telegram(문자 수 기준, 반복 슬라이싱) vs
+iter_telegram_chunks(UTF-16 기준, 한 번 훑기).
+
+사용법: python tools/bench_chunker.py [--db data/bible.db] [--rounds 20]
+
+- 여러 장에 걸친 긴 본문(시 1-150, 사 1-66, 창 1-50)을 KO/EN/MN 3개 문자 체계로 분할
+- bible.db 가 없으면 같은 분량의 합성 본문(한글/라틴/키릴)으로 측정
+- 조각 수, UTF-16 기준 길이 초과 조각 수, 절 중간에서 잘린 조각 수도 함께 출력
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+from core.bible_scripture_resolver import (
+    DB_FILE,
+    TELEGRAM_TEXT_LIMIT,
+    ScriptureResolver,
+    iter_telegram_chunks,
+    utf16_len,
+)
+
+PASSAGES = ['시 1-150', '사 1-66', '창 1-50']
+LANGS = ['KO', 'EN', 'MN']
+# 합성 본문용 문자 (MN 은 키릴, 문장 끝 이모지는 UTF-16 2단위 문자 확인용)
+ALPHABETS = {
+    'KO': '하나님여호와말씀사랑은혜평강백성빛길',
+    'EN': 'abcdefghijklmnopqrstuvwxyz',
+    'MN': 'абвгдеёжзийклмноөпрстуүфхцчшщыэюя',
+}
+
+
+def legacy_split(text, limit=TELEGRAM_TEXT_LIMIT):
+    """기존 구현 (비교용 사본)"""
+    if not text: return []
+    if len(text) <= limit: return [text]
+    parts = []
+    while len(text) > limit:
+        split_at = text.rfind('\n', 0, limit)
+        if split_at == -1: split_at = limit
+        parts.append(text[:split_at])
+        text = text[split_at:].strip()
+    if text: parts.append(text)
+    return parts
+
+
+def synthetic_passage(lang, chapters, seed):
+    rng = random.Random(seed)
+    letters = ALPHABETS[lang]
+    lines = [f"(synthetic 1-{chapters} / {lang})"]
+    for c in range(1, chapters + 1):
+        lines.append(f"[{c}]")
+        for v in range(1, rng.randint(15, 40)):
+            words = (''.join(rng.choice(letters) for _ in range(rng.randint(2, 7)))
+                     for _ in range(rng.randint(12, 30)))
+            lines.append(f"{v}. {' '.join(words)}" + (" 🙏" if v % 10 == 0 else ""))
+    return '\n'.join(lines)
+
+
+def load_passages(db_path):
+    if os.path.exists(db_path):
+        resolver = ScriptureResolver(db_path)
+        texts = {(cite, lang): resolver.get_qt_text(cite, lang) for cite in PASSAGES for lang in LANGS}
+        resolver.close()
+        if all(texts.values()):
+            return texts, db_path
+    sizes = {'시 1-150': 150, '사 1-66': 66, '창 1-50': 50}
+    texts = {(cite, lang): synthetic_passage(lang, sizes[cite], i)
+             for i, (cite, lang) in enumerate((c, l) for c in PASSAGES for l in LANGS)}
+    return texts, "합성 본문"
+
+
+def cut_verses(text, chunks):
+    """조각 경계가 줄(절) 경계가 아닌 곳의 수"""
+    line_starts = {0} | {i + 1 for i, ch in enumerate(text) if ch == '\n'}
+    cuts, pos = 0, 0
+    for chunk in chunks:
+        pos = text.find(chunk, pos)
+        if pos not in line_starts:
+            cuts += 1
+        pos += len(chunk)
+    return cuts
+
+
+def bench(fn, text, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        chunks = fn(text)
+    return (time.perf_counter() - start) / rounds * 1000, chunks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="본문 분할 벤치마크")
+    parser.add_argument("--db", default=DB_FILE, help="bible.db 경로")
+    parser.add_argument("--rounds", type=int, default=20, help="반복 횟수")
+    args = parser.parse_args()
+
+    texts, source = load_passages(args.db)
+    print(f"⏱️ 분할 벤치마크 ({args.rounds}회 반복, 본문: {source}, 제한 {TELEGRAM_TEXT_LIMIT} UTF-16)")
+    print(f"  {'본문':<12}{'언어':<5}{'길이':>9}  {'기존 ms':>9}{'신규 ms':>9}{'배':>7}  {'조각':>9}  {'초과':>7}  {'절 절단':>7}")
+    for (cite, lang), text in texts.items():
+        old_ms, old_chunks = bench(legacy_split, text, args.rounds)
+        new_ms, new_chunks = bench(lambda t: list(iter_telegram_chunks(t)), text, args.rounds)
+        over = (sum(utf16_len(c) > TELEGRAM_TEXT_LIMIT for c in old_chunks),
+                sum(utf16_len(c) > TELEGRAM_TEXT_LIMIT for c in new_chunks))
+        cuts = (cut_verses(text, old_chunks), cut_verses(text, new_chunks))
+        print(f"  {cite:<12}{lang:<5}{len(text):>9,}  {old_ms:9.2f}{new_ms:9.2f}{old_ms / new_ms:7.1f}"
+              f"  {len(old_chunks):>4}/{len(new_chunks):<4}  {over[0]:>3}/{over[1]:<3}  {cuts[0]:>3}/{cuts[1]:<3}")
+    print("  (조각/초과/절 절단: 기존/신규)")
+
+
+if __name__ == "__main__":
+    main()
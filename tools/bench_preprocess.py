@@ -0,0 +1,57 @@
+"""AI 업로드 전 이미지 전처리(ai.preprocess) 효과 측정.
+
+사용법: python tools/bench_preprocess.py [--mbps 10] [이미지 ...]   (생략 시 assets/*.jpg|png)
+
+- 공급자(openai/gemini)별로 원본 vs 전처리 결과의 크기(바이트), 예상 이미지 토큰, 예상 업로드 시간을 비교
+- 전처리 자체에 걸린 시간도 함께 출력 (API 는 호출하지 않음)
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+import PIL.Image  # noqa: E402
+
+from ai.preprocess import GEMINI_PROFILE, OPENAI_PROFILE, prepare_image  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI 업로드 이미지 전처리 효과 측정")
+    parser.add_argument("images", nargs="*", help="측정할 이미지 (생략 시 assets/ 전체)")
+    parser.add_argument("--mbps", type=float, default=10.0, help="업로드 시간 계산용 회선 속도 (Mbps, 기본 10)")
+    args = parser.parse_args()
+
+    paths = args.images or sorted(
+        p for ext in ("jpg", "jpeg", "png") for p in glob.glob(os.path.join(BASE_DIR, "assets", f"*.{ext}"))
+    )
+    if not paths:
+        print("❌ 측정할 이미지가 없습니다.")
+        sys.exit(1)
+
+    bytes_per_sec = args.mbps * 1_000_000 / 8
+    for profile in (OPENAI_PROFILE, GEMINI_PROFILE):
+        print(f"\n📐 {profile.name} (최대 {profile.max_side}px, 짧은 변 {profile.max_short}px)")
+        totals = [0, 0, 0, 0, 0.0]
+        for path in paths:
+            image = PIL.Image.open(path)
+            started = time.perf_counter()
+            stats = prepare_image(image, profile).stats
+            elapsed = time.perf_counter() - started
+            print(f"  {os.path.basename(path)}: {stats}  [{elapsed * 1000:.0f} ms]")
+            for i, value in enumerate((stats.bytes_before, stats.bytes_after,
+                                       stats.tokens_before, stats.tokens_after, elapsed)):
+                totals[i] += value
+
+        before, after, tokens_before, tokens_after, elapsed = totals
+        print(f"  ✅ 합계 {before / 1024:.0f}KB → {after / 1024:.0f}KB "
+              f"(-{100 * (1 - after / before):.0f}%), 토큰 ~{tokens_before} → ~{tokens_after}, "
+              f"업로드 {before / bytes_per_sec:.2f}s → {after / bytes_per_sec:.2f}s "
+              f"(전처리 {elapsed:.2f}s, {args.mbps:g}Mbps 기준)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""본문 조회 백엔드 벤치마크: SQLite(ScriptureResolver) vs 메모리 인덱스(MemoryVerseIndex)
+vs mmap 바이너리(MmapVerseIndex, data/*.bin 이 있을 때만).
+
+사용법: python tools/bench_resolver.py [--db data/bible.db] [--bin-dir data] [--rounds 200]
+
+- 하루 발송분(QT + 시편 + 잠언 × KO/EN/MN = 9회 조회)을 반복해 1회당 평균 시간을 비교
+- 메모리 인덱스의 적재 시간과 tracemalloc 기준 메모리를 '(book, chapter, verse) -> content'
+  튜플 dict 로 올렸을 때와 비교
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import time
+import tracemalloc
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+from core.bible_scripture_resolver import DB_FILE, TABLE_MAP, ScriptureResolver
+from core.bible_binary import BIN_DIR, MmapVerseIndex, bin_path
+from core.verse_index import MemoryVerseIndex
+
+# 실제 플랜(2026_07)과 비슷한 하루치 조회
+SAMPLE_DAY = [('qt', '욥 1:19-34'), ('ch', '시', '시 119'), ('ch', '잠', '잠 2')]
+LANGS = ['KO', 'EN', 'MN']
+
+
+def run_day(resolver):
+    for lang in LANGS:
+        for item in SAMPLE_DAY:
+            if item[0] == 'qt':
+                resolver.get_qt_text(item[1], lang)
+            else:
+                resolver.get_chapter_text(item[1], item[2], lang)
+
+
+def bench_lookups(name, resolver, rounds):
+    run_day(resolver)  # 연결/적재 비용은 제외
+    start = time.perf_counter()
+    for _ in range(rounds):
+        run_day(resolver)
+    elapsed = time.perf_counter() - start
+    per_day = elapsed / rounds * 1000
+    print(f"  {name:<8} 하루 9회 조회: {per_day:8.3f} ms  (1회 {per_day / 9 * 1000:8.1f} µs)")
+    return per_day
+
+
+def bench_memory(db_path):
+    print("\n📦 메모리 사용량 (tracemalloc, 3개 언어 전체)")
+
+    tracemalloc.start()
+    index = MemoryVerseIndex(db_path)
+    start = time.perf_counter()
+    for lang in LANGS:
+        index._table(lang)
+    load_ms = (time.perf_counter() - start) * 1000
+    index_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    index.close()
+
+    tracemalloc.start()
+    conn = sqlite3.connect(db_path)
+    baseline = {}
+    for lang in LANGS:
+        rows = conn.execute(f"SELECT book, chapter, verse, content FROM {TABLE_MAP[lang]}")
+        baseline[lang] = {(b, c, v): content for b, c, v, content in rows}
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    conn.close()
+    del baseline
+
+    print(f"  array 인덱스     : {index_bytes / 1048576:8.1f} MB  (적재 {load_ms:.0f} ms)")
+    print(f"  dict of tuples   : {dict_bytes / 1048576:8.1f} MB")
+    print(f"  절감             : {(1 - index_bytes / dict_bytes) * 100:8.1f} %")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="본문 조회 백엔드 벤치마크")
+    parser.add_argument("--db", default=DB_FILE, help="bible.db 경로")
+    parser.add_argument("--bin-dir", default=BIN_DIR, help="*.bin 폴더 (build_bible_db 7번 메뉴로 생성)")
+    parser.add_argument("--rounds", type=int, default=200, help="반복 횟수")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"❌ DB 파일이 없습니다: {args.db}")
+        sys.exit(1)
+
+    print(f"⏱️ 조회 벤치마크 ({args.rounds}회 반복, DB: {args.db})")
+    sqlite_ms = bench_lookups("sqlite", ScriptureResolver(args.db), args.rounds)
+    memory_ms = bench_lookups("memory", MemoryVerseIndex(args.db), args.rounds)
+    print(f"  → 메모리 인덱스가 {sqlite_ms / memory_ms:.1f}배 빠름")
+    if all(os.path.exists(bin_path(TABLE_MAP[lang], args.bin_dir)) for lang in LANGS):
+        mmap_ms = bench_lookups("mmap", MmapVerseIndex(args.bin_dir), args.rounds)
+        print(f"  → mmap 바이너리가 {sqlite_ms / mmap_ms:.1f}배 빠름")
+
+    bench_memory(args.db)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""main.py 서브커맨드별 기동(import) 시간 측정과 예산 검사.
+
+사용법: python tools/bench_startup.py [--runs 5] [명령 ...]
+
+- 명령마다 새 인터프리터에서 `python -X importtime` 으로 `import main; main.load_command(명령)` 을 실행
+  (실제 발송/파싱은 하지 않고, 그 명령이 실행 직전까지 불러오는 모듈만 측정)
+- 최상위 import 누적 시간의 합(중앙값)을 BUDGET_MS 와 비교
+- 발송 경로(send/summary/run/daemon)가 AI 파서 스택을 불러오면 실패로 표시
+- 예산 초과나 금지 모듈이 있으면 종료 코드 1
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+# 명령별 import 시간 예산 (ms). None 이면 측정만
+BUDGET_MS = {
+    "send": 400,
+    "summary": 400,
+    "run": 400,
+    "daemon": 450,
+    "prerender": 150,
+    "check": 300,
+    "parse": None,
+}
+
+AI_STACK = ["tools.plan_parser", "tools.hwpx_plan_parser", "ai.provider", "PIL", "openai", "google.genai"]
+FORBIDDEN = {
+    "send": AI_STACK,
+    "summary": AI_STACK,
+    "run": AI_STACK,
+    "daemon": AI_STACK,
+    "prerender": AI_STACK + ["telegram"],
+}
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+def measure(command):
+    """(최상위 import 누적 µs 합, 불러온 모듈 이름 집합)"""
+    code = f"import main; main.load_command({command!r})"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BASE_DIR, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{command}: 실행 실패\n{proc.stdout}{proc.stderr}")
+    total_us = 0
+    modules = set()
+    for line in proc.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, name = match.groups()
+        modules.add(name)
+        if not indent:
+            total_us += int(cumulative)
+    return total_us, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="main.py 서브커맨드 기동 시간 예산 검사")
+    parser.add_argument("commands", nargs="*", help="측정할 명령 (기본: 전체)")
+    parser.add_argument("--runs", type=int, default=5, help="명령별 반복 횟수 (중앙값 사용)")
+    args = parser.parse_args()
+
+    from main import COMMAND_MODULES
+    commands = args.commands or list(COMMAND_MODULES)
+
+    print(f"⏱️ 서브커맨드 import 시간 ({args.runs}회 중앙값, python -X importtime)")
+    failed = False
+    for command in commands:
+        samples = []
+        for _ in range(args.runs):
+            total_us, modules = measure(command)
+            samples.append(total_us / 1000)
+        median_ms = statistics.median(samples)
+        budget = BUDGET_MS.get(command)
+        banned = sorted(m for m in FORBIDDEN.get(command, []) if m in modules)
+
+        ok = (budget is None or median_ms <= budget) and not banned
+        failed |= not ok
+        budget_str = f"{budget:>5} ms" if budget is not None else "    -   "
+        print(f"  {'✅' if ok else '❌'} {command:<10} {median_ms:8.1f} ms  (예산 {budget_str}, 모듈 {len(modules)}개)")
+        if banned:
+            print(f"     ⛔ 불러오면 안 되는 모듈: {', '.join(banned)}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
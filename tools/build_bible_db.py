@@ -4,14 +4,25 @@ import re
 import sys
 from bs4 import BeautifulSoup, NavigableString
 
+# 프로젝트 루트 경로 추가 (core 모듈 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.bible_binary import bin_path, write_bible_binary
+from core.bible_scripture_resolver import book_id_of
+
 # ==========================================
 # ⚙️ 설정 (Configuration)
 # ==========================================
 
 # 프로젝트 루트 및 DB 경로
+# ⚠️ 데몬/관리 봇은 bible.db 를 immutable 로 열어 두므로, 실행 중일 때는 다른 경로에 빌드한 뒤
+#    os.replace 로 통째로 교체할 것 (제자리 수정은 실행 중인 프로세스가 감지하지 못함)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DB_FILE = os.path.join(BASE_DIR, 'bible.db')
 
+# mmap 조회용 바이너리(.bin) 출력 폴더 (resolver 가 읽는 위치)
+BIN_DIR = os.path.join(BASE_DIR, 'data')
+
 # 몽골어 성경 폴더 경로 (사용자 환경에 맞게 수정)
 MN_SOURCE_DIR = r"C:\Users\rjegj\OneDrive\Basic life\성경역본\mn_new"
 
@@ -55,11 +66,18 @@ class BibleDB:
             print("🔒 DB 연결 종료")
 
     def reset_table(self, table_name):
-        """테이블을 삭제하고 재생성"""
+        """테이블을 삭제하고 재생성
+
+        ordinal 은 정경 순서(book_id, chapter, verse)상 전체 절 번호이자 rowid 이므로,
+        장/책을 넘는 구간도 양 끝 ordinal 만 찾으면 rowid 범위 스캔 한 번으로 읽을 수 있다.
+        (book_id, chapter, verse) 인덱스는 rowid(=ordinal)를 포함하므로 양 끝 조회에 대한 커버링 인덱스다.
+        """
         print(f"\n🧹 [{table_name}] 테이블 초기화 중...")
         self.cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
         self.cursor.execute(f'''
             CREATE TABLE {table_name} (
+                ordinal INTEGER PRIMARY KEY,
+                book_id INTEGER,
                 book TEXT,
                 chapter INTEGER,
                 verse INTEGER,
@@ -67,16 +85,55 @@ class BibleDB:
             )
         ''')
         self.cursor.execute(f'CREATE INDEX idx_{table_name} ON {table_name} (book, chapter, verse)')
+        self.cursor.execute(f'CREATE UNIQUE INDEX idx_{table_name}_ref ON {table_name} (book_id, chapter, verse)')
 
     def insert_data(self, table_name, data_list):
-        """데이터 일괄 삽입"""
+        """데이터 일괄 삽입 (book_id 부여 후 정경 순서로 정렬해 ordinal 을 매김)"""
         if not data_list:
             print(f"⚠️ [{table_name}] 삽입할 데이터가 없습니다.")
             return
-        
-        self.cursor.executemany(f'INSERT INTO {table_name} VALUES (?,?,?,?)', data_list)
+
+        # 매핑에 없는 책 이름은 정경 66권 뒤에 등장 순서대로 배치
+        unknown = {}
+        def sort_key(row):
+            book, ch, v, _ = row
+            book_id = book_id_of(book)
+            if book_id is None:
+                book_id = 1000 + unknown.setdefault(book, len(unknown))
+            return book_id, ch, v
+
+        keyed = sorted(((sort_key(row), row) for row in data_list), key=lambda item: item[0])
+        # 같은 (책, 장, 절)이 중복되면 먼저 나온 것만 유지 (유니크 인덱스)
+        rows = []
+        last_key = None
+        for key, (book, ch, v, content) in keyed:
+            if key == last_key: continue
+            last_key = key
+            rows.append((len(rows) + 1, key[0], book, ch, v, content))
+        if unknown:
+            print(f"⚠️ [{table_name}] 매핑되지 않은 책 이름: {', '.join(unknown)}")
+
+        self.cursor.executemany(
+            f'INSERT INTO {table_name} (ordinal, book_id, book, chapter, verse, content) VALUES (?,?,?,?,?,?)',
+            rows
+        )
         self.conn.commit()
-        print(f"✅ [{table_name}] {len(data_list)}개 구절 저장 완료")
+        print(f"✅ [{table_name}] {len(rows)}개 구절 저장 완료")
+
+    def export_binary(self, table_name, out_dir):
+        """테이블을 mmap 조회용 바이너리 파일(data/<테이블명>.bin)로 내보내기"""
+        self.cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table_name,))
+        if not self.cursor.fetchone():
+            print(f"⚠️ [{table_name}] 테이블이 없어 내보내기를 건너뜁니다.")
+            return
+
+        os.makedirs(out_dir, exist_ok=True)
+        out_path = bin_path(table_name, out_dir)
+        # 신규 스키마는 rowid = ordinal (정경 순서)
+        rows = self.conn.execute(f"SELECT book, chapter, verse, content FROM {table_name} ORDER BY rowid")
+        count = write_bible_binary(out_path, rows)
+        size_mb = os.path.getsize(out_path) / 1048576
+        print(f"📦 [{table_name}] {count}개 구절 → {os.path.basename(out_path)} ({size_mb:.1f} MB)")
 
     def clean_unused_tables(self, keep_tables):
         """지정된 테이블 외의 모든 테이블 삭제 (청소)"""
@@ -226,6 +283,7 @@ def run():
         print("4. [몽골] MUV (bible_mn_MUV - TXT)")
         print("5. [정리] 미사용 구형 테이블 삭제")
         print("6. [몽골] MUV (HTML 원본 폴더 파싱 - 느림)")
+        print("7. [내보내기] mmap용 바이너리 파일 생성 (data/*.bin)")
         print("0. 종료")
         print("="*40)
         
@@ -279,6 +337,11 @@ def run():
             db.reset_table('bible_mn_MUV')
             db.insert_data('bible_mn_MUV', data)
 
+        # --- 7. 바이너리 내보내기 (전체 생성 시 함께 수행) ---
+        if choice in ['1', '7']:
+            for table in ['bible_ko_KRV', 'bible_en_ESV', 'bible_mn_MUV']:
+                db.export_binary(table, BIN_DIR)
+
         # --- 5. 정리 (Cleanup) ---
         if choice == '5':
             active_tables = ['bible_ko_KRV', 'bible_en_ESV', 'bible_mn_MUV']
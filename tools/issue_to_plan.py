@@ -1,7 +1,6 @@
 import os
 import sys
 import re
-import json
 import logging
 import tempfile
 import traceback
@@ -17,12 +16,14 @@ sys.path.append(BASE_DIR)
 
 from ai.interfaces import AIProviderError
 from ai.provider import get_provider
+from core.plan_format import dump_plan
 from tools.plan_parser import (
     BIBLE_PLAN_SCHEMA,
     _ai_days_to_sorted_data,
     build_prompt,
     postprocess_plan_data,
 )
+from tools.plan_tiles import extract_plan_tiled, tiled_enabled
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger("bible_bot.issue_to_plan")
@@ -58,7 +59,8 @@ def extract_image_urls(body):
 
 def main():
     try:
-        provider = get_provider()
+        # --no-cache: 같은 이미지라도 AI 응답 캐시(data/ai_cache)를 쓰지 않고 새로 요청
+        provider = get_provider(no_cache="--no-cache" in sys.argv[1:])
     except AIProviderError as e:
         logger.error(f"❌ 오류: {e}")
         sys.exit(1)
@@ -95,10 +97,15 @@ def main():
         sys.exit(1)
 
     prompt = build_prompt(year_str, month_str)
+    # 이미지 두 장(BR, QT 순)이면 --tiled / AI_TILED=1 로 타일 병렬 요청
+    tiled = tiled_enabled("--tiled" in sys.argv[1:]) and len(images) == 2
 
     try:
-        logger.info("[INFO] Sending request to OpenAI...")
-        ai_result = provider.generate_from_images(images, prompt, BIBLE_PLAN_SCHEMA)
+        if tiled:
+            ai_result = extract_plan_tiled(provider, images[0], images[1], year, month)
+        else:
+            logger.info("[INFO] Sending request to OpenAI...")
+            ai_result = provider.generate_from_images(images, prompt, BIBLE_PLAN_SCHEMA)
 
         logger.info("[INFO] Parsing structured output...")
         sorted_data = _ai_days_to_sorted_data(ai_result)
@@ -116,8 +123,7 @@ def main():
     os.makedirs(plans_dir, exist_ok=True)
     output_file = os.path.join(plans_dir, f"{year_str}_{month_str}.json")
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(sorted_data, f, ensure_ascii=False, indent=4)
+    dump_plan(sorted_data, output_file)
 
     logger.info(f"[SUCCESS] {year_str}-{month_str} data generated.")
     logger.info(f"✅ 생성 성공! 저장 위치: {output_file}")
@@ -0,0 +1,110 @@
+"""단체방 구독자 관리 (data/subscribers.db).
+
+사용법:
+  python tools/manage_subscribers.py list
+  python tools/manage_subscribers.py add -1001234567890 KO,EN [--summary-only] [--title "청년부"]
+  python tools/manage_subscribers.py remove -1001234567890
+  python tools/manage_subscribers.py deactivate -1001234567890   # 목록에 남겨 두고 발송만 중지
+  python tools/manage_subscribers.py activate -1001234567890
+  python tools/manage_subscribers.py stats
+
+DB 가 없으면 처음 열 때 .env 의 KO/EN/MN_CHAT_ID 채팅방으로 채워진다.
+"""
+import argparse
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+import main  # noqa: E402  (import 시 중앙 .env 로드 → 최초 DB 생성 때 환경변수 채팅방 등록)
+from core.message_render import LANGS  # noqa: E402
+from core.subscribers import get_store  # noqa: E402
+
+
+def parse_langs(value):
+    langs = [lang.strip().upper() for lang in value.split(',') if lang.strip()]
+    unknown = [lang for lang in langs if lang not in LANGS]
+    if not langs or unknown:
+        raise argparse.ArgumentTypeError(f"언어는 {', '.join(LANGS)} 중에서 쉼표로 구분해 지정하세요: {value}")
+    return langs
+
+
+def cmd_list(store, args):
+    rows = store.list_all()
+    if not rows:
+        print("ℹ️ 등록된 채팅방이 없습니다.")
+        return
+    print(f"📇 등록된 채팅방 {len(rows)}개")
+    for chat_id, title, delivery, active, langs in rows:
+        state = "✅" if active else "⏸️"
+        mode = "요약만" if delivery == 'summary' else "전체"
+        print(f"  {state} {chat_id:>16}  {langs or '-':<9} {mode:<4} {title or ''}")
+
+
+def cmd_add(store, args):
+    delivery = 'summary' if args.summary_only else 'full'
+    store.add(args.chat_id, args.langs, delivery=delivery, title=args.title)
+    print(f"✅ 등록: {args.chat_id} ({','.join(args.langs)}, {'요약만' if args.summary_only else '전체'})")
+
+
+def cmd_remove(store, args):
+    if store.remove(args.chat_id):
+        print(f"🗑️ 삭제: {args.chat_id}")
+    else:
+        print(f"⚠️ 등록되지 않은 채팅방: {args.chat_id}")
+
+
+def cmd_set_active(store, args):
+    active = args.command == 'activate'
+    if store.set_active(args.chat_id, active):
+        print(f"{'▶️ 발송 재개' if active else '⏸️ 발송 중지'}: {args.chat_id}")
+    else:
+        print(f"⚠️ 등록되지 않은 채팅방: {args.chat_id}")
+
+
+def cmd_stats(store, args):
+    counts = store.count_by_lang()
+    print("📊 언어별 활성 채팅방")
+    for lang in LANGS:
+        print(f"  [{lang}] {counts.get(lang, 0)}개")
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="단체방 구독자 관리")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("list", help="등록된 채팅방 목록")
+
+    add_p = sub.add_parser("add", help="채팅방 등록/갱신 (언어 목록은 새로 지정한 것으로 교체)")
+    add_p.add_argument("chat_id", type=int)
+    add_p.add_argument("langs", type=parse_langs, help="예: KO 또는 KO,EN")
+    add_p.add_argument("--summary-only", action="store_true", help="본문 없이 요약 메시지만 발송")
+    add_p.add_argument("--title", help="메모용 채팅방 이름")
+
+    for name, help_text in (("remove", "채팅방 삭제"),
+                            ("activate", "발송 재개"),
+                            ("deactivate", "발송 중지 (목록에는 유지)")):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("chat_id", type=int)
+
+    sub.add_parser("stats", help="언어별 활성 채팅방 수")
+
+    args = parser.parse_args()
+    handlers = {
+        "list": cmd_list,
+        "add": cmd_add,
+        "remove": cmd_remove,
+        "activate": cmd_set_active,
+        "deactivate": cmd_set_active,
+        "stats": cmd_stats,
+    }
+    store = get_store()
+    try:
+        handlers[args.command](store, args)
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,126 @@
+"""data/plans/*.json 을 플랜 형식 v2 로 변환 (한 번 실행용).
+
+사용법: python tools/migrate_plans_v2.py [--dry-run] [YYYY_MM ...]   (생략 시 전체)
+
+- v1 파일([nt, ot, ps, pr, qt] 목록)을 이름 붙은 칸 + 미리 풀어 둔 인용 구간(spans)으로 바꿔 저장
+- 저장 전에 변환 결과를 다시 읽어 칸 내용과 인용 해석이 v1 과 똑같은지 확인하고, 다르면 그 파일은 건너뜀
+- 시/잠 칸의 구간은 항상 그 칸의 책(시편/잠언)이어야 함. 다른 책 이름이 적힌 칸(예: 잠 칸의 '삼상 1:1-18')은
+  구간 없이 문자열만 보관하고, 그런 칸에 구간이 생기면 그 파일은 건너뜀
+- 이미 v2 인 파일은 저장된 구간을 칸 문자열에서 다시 풀어 보고, 다르면 새 구간으로 다시 저장
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+from core.citation import BOOK_IDS, parse_citation  # noqa: E402
+from core.plan_format import CITED, PlanDay, dump_plan, parse_plan, plan_to_json, plan_version  # noqa: E402
+
+PLANS_DIR = os.path.join(BASE_DIR, 'data', 'plans')
+
+# 시/잠 칸이 가리켜야 하는 책
+COLUMN_BOOK = {'ps': '시', 'pr': '잠'}
+
+
+def _cite_key(cite):
+    return (cite.book_id, cite.start_chapter, cite.start_verse,
+            cite.end_book_id, cite.end_chapter, cite.end_verse)
+
+
+def foreign_book_cells(plan):
+    """시/잠 칸 중 다른 책 이름이 적힌 칸 [(day, kind, 문자열), ...]"""
+    cells = []
+    for day, entry in plan.items():
+        for kind, book in COLUMN_BOOK.items():
+            raw = getattr(entry, kind)
+            written = parse_citation(raw).book if raw else None
+            if written not in (None, book):
+                cells.append((day, kind, raw))
+    return cells
+
+
+def verify(v1_plan, v2_plan):
+    """칸 내용과 qt/ps/pr 인용 해석이 같은지, 시/잠 칸 구간이 그 칸의 책인지. 문제 있는 날짜 목록 반환"""
+    mismatched = []
+    if set(v1_plan) != set(v2_plan):
+        return sorted(set(v1_plan) ^ set(v2_plan), key=int)
+    for day, old in v1_plan.items():
+        new = v2_plan[day]
+        old_cites, new_cites = old.citations(), new.citations()
+        same = old.row == new.row and set(old_cites) == set(new_cites) and all(
+            _cite_key(old_cites[kind]) == _cite_key(new_cites[kind]) for kind in CITED if kind in old_cites
+        )
+        # 파서와 별개로: 저장될 시/잠 구간의 책 번호는 칸의 책과 같아야 함
+        same = same and all(
+            new.spans[kind][0] == BOOK_IDS[book] for kind, book in COLUMN_BOOK.items() if kind in new.spans
+        )
+        if not same:
+            mismatched.append(day)
+    return mismatched
+
+
+def migrate(path, dry_run=False):
+    name = os.path.basename(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if plan_version(data) >= 2:
+        stored = parse_plan(data)
+        # 칸 문자열에서 구간을 다시 풀어 저장된 것과 비교 (이전 파서로 만든 구간 갱신용)
+        v1_plan = {day: PlanDay.from_row(entry.row) for day, entry in stored.items()}
+        fresh = {day: PlanDay.from_row(entry.row).decode_spans() for day, entry in stored.items()}
+        if all(fresh[day].spans == stored[day].spans for day in stored):
+            print(f"  ⏭️ {name}: 이미 v2")
+            return True
+        changed = [day for day in stored if fresh[day].spans != stored[day].spans]
+        print(f"  🔁 {name}: 저장된 인용 구간이 칸 문자열과 다름 ({', '.join(changed)}일) → 다시 풀어 저장")
+    else:
+        v1_plan = parse_plan(data)
+    v2_plan = parse_plan(json.loads(json.dumps(plan_to_json(v1_plan), ensure_ascii=False)))
+    mismatched = verify(v1_plan, v2_plan)
+    if mismatched:
+        print(f"  ❌ {name}: 변환 결과가 원본과 다름 ({', '.join(mismatched)}일) → 건너뜀")
+        return False
+
+    unresolved = sum(
+        1 for day in v2_plan.values() for kind in CITED if getattr(day, kind) and kind not in day.spans
+    )
+    foreign = foreign_book_cells(v2_plan)
+    note = f", 해석할 수 없는 인용 {unresolved}칸은 문자열만 보관" if unresolved else ""
+    if foreign:
+        note += f" (그중 시/잠 칸에 다른 책이 적힌 칸 {len(foreign)}개)"
+    if dry_run:
+        print(f"  🔎 {name}: {len(v2_plan)}일 변환 가능{note}")
+        return True
+    dump_plan(v1_plan, path)
+    print(f"  ✅ {name}: {len(v2_plan)}일 → v2{note}")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="플랜 JSON 을 v2 형식으로 변환")
+    parser.add_argument("months", nargs="*", help="변환할 달 (예: 2026_07, 생략 시 전체)")
+    parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 검사만")
+    args = parser.parse_args()
+
+    if args.months:
+        paths = [os.path.join(PLANS_DIR, f"{month}.json") for month in args.months]
+    else:
+        paths = sorted(glob.glob(os.path.join(PLANS_DIR, '*.json')))
+
+    print(f"📦 플랜 v2 변환 ({len(paths)}개 파일{', 검사만' if args.dry_run else ''})")
+    ok = True
+    for path in paths:
+        if not os.path.exists(path):
+            print(f"  ❌ {os.path.basename(path)}: 파일 없음")
+            ok = False
+            continue
+        ok &= migrate(path, dry_run=args.dry_run)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,6 @@
 import logging
 import os
 import sys
-import json
-import re
 import traceback
 import PIL.Image
 from datetime import datetime, timedelta
@@ -24,7 +22,10 @@ from tools.hwpx_plan_parser import (
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(BASE_DIR)
 
-from core.bible_scripture_resolver import BIBLE_MAP
+from core.bible_scripture_resolver import DB_FILE, resolve_monthly_plan
+from core.citation import BIBLE_MAP, parse_citation
+from core.plan_format import dump_plan
+from tools.plan_tiles import extract_plan_tiled, tiled_enabled
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger("bible_bot.plan_parser")
@@ -153,23 +154,22 @@ def postprocess_plan_data(sorted_data: dict) -> dict:
                     cell = cell.replace(full, abbr, 1).strip()
                     break
 
-            # 2. 열(Column) 특성에 맞춘 후처리 로직 분리
+            # 2. 열(Column) 특성에 맞춘 후처리 로직 분리 (인용 파싱은 core.citation 캐시 사용)
+            cite = parse_citation(cell)
             if i in [0, 1, 4]:  # 신약(NT), 구약(OT), QT
-                match = re.match(r"^([가-힣]+)\s*(.*)", cell)
-                if match:
-                    book, chapters = match.groups()
-                    if book in allowed_books:
-                        last_books[i] = book
-                        row[i] = f"{book} {chapters}".strip()
-                elif last_books[i] and re.match(r"^\d", cell):
+                if cite.book is not None:
+                    if cite.book in allowed_books:
+                        last_books[i] = cite.book
+                        row[i] = f"{cite.book} {cite.rest}".strip()
+                elif last_books[i] and cite.is_bare:
                     row[i] = f"{last_books[i]} {cell}"
 
             elif i == 2:  # 시편 (Psalms)
-                if re.match(r"^\d", cell):
+                if cite.is_bare:
                     row[i] = f"시 {cell}"
 
             elif i == 3:  # 잠언 (Proverbs)
-                if re.match(r"^\d", cell):
+                if cite.is_bare:
                     row[i] = f"잠 {cell}"
 
         sorted_data[day] = row
@@ -184,7 +184,7 @@ def get_next_month():
     return next_month_date.year, next_month_date.month
 
 
-def _extract_plan_from_images(year, month):
+def _extract_plan_from_images(year, month, no_cache=False, tiled=False):
     year_str = str(year)
     month_str = str(month).zfill(2)
     assets_dir = os.path.join(BASE_DIR, 'assets')
@@ -202,21 +202,21 @@ def _extract_plan_from_images(year, month):
     logger.info(f"\n🔍 [실행] {year_str}년 {month_str}월 데이터 생성 중...")
 
     try:
-        provider = get_provider()
+        provider = get_provider(no_cache=no_cache)
     except AIProviderError as e:
         logger.error(f"❌ 오류: {e}")
         return None
 
     try:
-        images = []
+        images = {}
         image_info = []
 
         if br_path or qt_path:
             if br_path:
-                images.append(PIL.Image.open(br_path))
+                images["BR"] = PIL.Image.open(br_path)
                 image_info.append("BR")
             if qt_path:
-                images.append(PIL.Image.open(qt_path))
+                images["QT"] = PIL.Image.open(qt_path)
                 image_info.append("QT")
             logger.info(f"  소스: 로컬 assets ({', '.join(image_info)})")
         else:
@@ -230,11 +230,16 @@ def _extract_plan_from_images(year, month):
                 return None
             for prefix in ["BR", "QT"]:
                 if prefix in drive_images:
-                    images.append(drive_images[prefix])
+                    images[prefix] = drive_images[prefix]
             logger.info(f"  소스: Google Drive ({', '.join(image_info)})")
 
-        prompt = build_prompt(year_str, month_str)
-        ai_result = provider.generate_from_images(images, prompt, BIBLE_PLAN_SCHEMA)
+        ai_result = None
+        if tiled_enabled(tiled):
+            # 빠진 날짜가 있으면 None → 아래에서 이미지 전체로 다시 요청
+            ai_result = extract_plan_tiled(provider, images.get("BR"), images.get("QT"), year, month)
+        if ai_result is None:
+            prompt = build_prompt(year_str, month_str)
+            ai_result = provider.generate_from_images(list(images.values()), prompt, BIBLE_PLAN_SCHEMA)
 
         logger.info("[INFO] Parsing structured output...")
         sorted_data = _ai_days_to_sorted_data(ai_result)
@@ -253,7 +258,10 @@ def _extract_plan_from_images(year, month):
         return None
 
 
-def generate_monthly_plan(year, month):
+def generate_monthly_plan(year, month, no_cache=False, tiled=False):
+    """HWPX(우선) 또는 이미지/AI 로 한 달치 플랜 생성.
+    no_cache 면 같은 이미지라도 AI 응답 캐시(data/ai_cache)를 쓰지 않고 새로 요청,
+    tiled 면(또는 AI_TILED=1) 이미지를 표/주 단위 타일로 나눠 병렬 요청 (tools.plan_tiles)"""
     year_str = str(year)
     month_str = str(month).zfill(2)
     assets_dir = os.path.join(BASE_DIR, 'assets')
@@ -284,7 +292,7 @@ def generate_monthly_plan(year, month):
 
     if not br_path or not qt_path or not br_plan or not qt_plan:
         logger.info("  HWPX가 부족하여 기존 이미지/AI 방식으로 보강합니다...")
-        fallback_plan = _extract_plan_from_images(year, month)
+        fallback_plan = _extract_plan_from_images(year, month, no_cache=no_cache, tiled=tiled)
         if fallback_plan is None:
             logger.error("❌ HWPX 보강에 실패했습니다. 이미지/AI fallback도 실패했습니다.")
             return
@@ -300,34 +308,65 @@ def generate_monthly_plan(year, month):
 
     output_file = os.path.join(plans_dir, f"{year_str}_{month_str}.json")
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(final_plan, f, ensure_ascii=False, indent=4)
+    dump_plan(final_plan, output_file)
 
     source_label = "HWPX"
     if fallback_plan:
         source_label = "HWPX + AI fallback"
     logger.info(f"✅ 생성 성공! 저장 위치: data/plans/{year_str}_{month_str}.json ({source_label})")
 
+    verify_plan_citations(final_plan)
+
+
+def verify_plan_citations(plan):
+    """생성 직후 한 달치 QT/시편/잠언 인용을 일괄 해석해, 본문을 못 찾는 칸을 파싱 시점에 알린다."""
+    if not os.path.exists(DB_FILE):
+        logger.info("  (bible.db 없음 → 인용 검증 생략)")
+        return None
+
+    resolved = resolve_monthly_plan(plan)
+    labels = {'qt': 'QT', 'ps': '시편', 'pr': '잠언'}
+    missing = {}
+    for day, langs in resolved.items():
+        for lang, texts in langs.items():
+            for kind, text in texts.items():
+                if text is None:
+                    missing.setdefault((int(day), kind), []).append(lang)
+
+    if not missing:
+        logger.info("🔎 인용 검증 완료: 모든 QT/시편/잠언 본문을 찾았습니다.")
+    else:
+        logger.warning(f"⚠️ 본문을 찾지 못한 인용 {len(missing)}건:")
+        kind_index = {'qt': 4, 'ps': 2, 'pr': 3}
+        for (day, kind), langs in sorted(missing.items()):
+            cell = plan[str(day)][kind_index[kind]]
+            logger.warning(f"   - {day}일 {labels[kind]} '{cell}' ({', '.join(langs)})")
+    return resolved
+
 
 if __name__ == "__main__":
     now = datetime.now(ZoneInfo("Asia/Seoul"))
+    # --no-cache: AI 응답 캐시를 무시하고 새로 요청 / --tiled: 타일로 나눠 병렬 요청
+    no_cache = "--no-cache" in sys.argv
+    tiled = "--tiled" in sys.argv
+    sys.argv = [arg for arg in sys.argv if arg not in ("--no-cache", "--tiled")]
     if len(sys.argv) >= 3:
         input_year = sys.argv[1]
         input_month = sys.argv[2]
-        generate_monthly_plan(input_year, input_month)
+        generate_monthly_plan(input_year, input_month, no_cache=no_cache, tiled=tiled)
     elif len(sys.argv) == 2:
         input_year = now.year
         input_month = sys.argv[1]
-        generate_monthly_plan(input_year, input_month)
+        generate_monthly_plan(input_year, input_month, no_cache=no_cache, tiled=tiled)
     else:
         if sys.stdin.isatty():
             try:
                 print("=== 📅 월간 성경읽기 생성기 (수동 모드) ===")
                 y = input(f"연도 (기본 {now.year}): ").strip() or now.year
                 m = input(f"월 (기본 {now.month}): ").strip() or now.month
-                generate_monthly_plan(y, m)
+                generate_monthly_plan(y, m, no_cache=no_cache, tiled=tiled)
             except Exception:
                 pass
         else:
             next_year, next_month = get_next_month()
-            generate_monthly_plan(next_year, next_month)
+            generate_monthly_plan(next_year, next_month, no_cache=no_cache, tiled=tiled)
@@ -0,0 +1,213 @@
+"""이미지를 타일로 나눠 병렬로 AI 추출 (plan_parser --tiled / AI_TILED=1).
+
+한 번에 BR+QT 이미지 전체를 보내는 대신:
+- BR(성경읽기표): 좌우 두 표(1~16일 / 17~말일)를 반으로 잘라 각각 요청 (nt/ot/시/잠만 받는 작은 스키마)
+- QT(달력): 가로 괘선으로 주(週) 단위 줄을 찾아 한 줄씩 요청 (qt 만 받는 스키마).
+  괘선을 찾지 못하면 QT 이미지 전체를 한 번에 요청
+타일 요청은 ThreadPoolExecutor 로 동시에 보내고, 각 타일이 맡은 날짜만 골라
+{"days": [...]} 한 덩어리로 합친 뒤 plan_parser._ai_days_to_sorted_data 로 넘긴다.
+합친 결과에 빠진 날짜가 있으면(타일 경계 오판 등) 일부만 채운 플랜을 쓰지 않고
+None 을 돌려주어 plan_parser 가 그 달을 이미지 전체 요청으로 다시 추출한다.
+요청 하나가 작아져 응답이 잘리는(finish_reason == "length") 위험도 줄어든다.
+"""
+import calendar
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger("bible_bot.plan_tiles")
+
+# 동시에 보낼 타일 요청 수 (BR 2 + QT 최대 6주)
+DEFAULT_WORKERS = 8
+# BR 을 반으로 자를 때 가운데 경계 양쪽으로 겹치게 둘 폭 (이미지 너비 비율)
+BR_OVERLAP = 0.02
+# 괘선 판정: 표 가로 폭의 이 비율 이상이 어둡고, 두께가 RULE_MAX_THICKNESS 픽셀 이하인 줄
+RULE_COVER = 0.95
+RULE_MAX_THICKNESS = 4
+RULE_DARK = 200
+# 주 줄을 자를 때 위아래로 더 포함할 여백 (픽셀)
+ROW_PADDING = 6
+
+
+def tiled_enabled(flag=False):
+    return flag or os.getenv("AI_TILED", "").lower() in ("1", "on", "true", "yes")
+
+
+def _days_schema(name, fields):
+    """{"days": [{"day": int, <fields>: str, ...}]} 형태의 작은 스키마"""
+    properties = {"day": {"type": "integer", "description": "1부터 시작하는 날짜"}}
+    for field, description in fields.items():
+        properties[field] = {"type": "string", "description": f"{description}, 없으면 빈 문자열"}
+    return {
+        "name": name,
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "days": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": properties,
+                        "required": list(properties),
+                        "additionalProperties": False,
+                    },
+                }
+            },
+            "required": ["days"],
+            "additionalProperties": False,
+        },
+    }
+
+
+BR_TILE_SCHEMA = _days_schema("bible_reading_tile", {
+    "nt": "신약(NT) 본문", "ot": "구약(OT) 본문", "psalms": "시편 장", "proverbs": "잠언 장",
+})
+QT_TILE_SCHEMA = _days_schema("qt_calendar_tile", {"qt": "QT 본문"})
+
+
+def build_br_tile_prompt(year_str, month_str, first_day, last_day):
+    return f"""
+    You are a Bible data extraction expert. This image is ONE table cut from the {year_str}-{month_str} Bible Reading Plan.
+    - Columns: Date (날짜), 신약 (NT), 구약 (OT), 시 (Psalms), 잠 (Proverbs).
+    - This table covers days {first_day} to {last_day} only. Ignore any partial column from a neighbouring table at the edge.
+
+    1. Look EXACTLY at the "Date" column number. Match the row content to that date.
+    2. If a cell is blank (especially NT/OT on Sundays), use an empty string "".
+    3. Capture the Bible book names (e.g., '눅', '막', '창', '출') carefully.
+    4. For Psalms (시) and Proverbs (잠) columns, just extract the numbers if that's all that is there.
+
+    Return one entry per day from {first_day} to {last_day} in the "days" array: day (integer), nt, ot, psalms, proverbs.
+    """
+
+
+def build_qt_tile_prompt(year_str, month_str, days):
+    day_list = ", ".join(map(str, days))
+    return f"""
+    You are a Bible data extraction expert. This image is part of the {year_str}-{month_str} QT (Quiet Time) calendar.
+    - Each box contains a Date number and a QT passage.
+    - On Sundays the passage usually starts with a book name like '시편' or '잠언'.
+    - Copy each passage exactly as printed. If a box shows only numbers like "1: 18-25" with no book name, output just those numbers.
+
+    Return one entry for each of these days visible in the image: {day_list}.
+    Each entry has: day (integer), qt (string, "" when blank).
+    """
+
+
+def horizontal_rules(image):
+    """가로 괘선(얇고 표 폭 대부분을 가로지르는 어두운 줄)의 y 좌표 목록"""
+    gray = image.convert("L")
+    width, height = gray.size
+    x0, x1 = int(width * 0.1), int(width * 0.9)
+    span = x1 - x0
+    rules = []
+    start = None
+    for y in range(height + 1):
+        dark = False
+        if y < height:
+            histogram = gray.crop((x0, y, x1, y + 1)).histogram()
+            dark = sum(histogram[:RULE_DARK]) >= RULE_COVER * span
+        if dark and start is None:
+            start = y
+        elif not dark and start is not None:
+            if y - start <= RULE_MAX_THICKNESS:
+                rules.append((start + y - 1) // 2)
+            start = None
+    return rules
+
+
+def split_br(image, last_day):
+    """BR 이미지를 좌(1~16일)/우(17~말일) 두 표로. [(image, first_day, last_day), ...]"""
+    width, height = image.size
+    middle, overlap = width // 2, int(width * BR_OVERLAP)
+    return [
+        (image.crop((0, 0, middle + overlap, height)), 1, 16),
+        (image.crop((middle - overlap, 0, width, height)), 17, last_day),
+    ]
+
+
+def split_qt(image, year, month):
+    """QT 달력을 주 단위 줄로. [(image, [그 주의 날짜, ...]), ...]
+    괘선 수가 주 수와 맞지 않으면 이미지 전체 한 장 (날짜는 1~말일)"""
+    weeks = [
+        [day for day in week if day]
+        for week in calendar.Calendar(firstweekday=calendar.SUNDAY).monthdayscalendar(year, month)
+    ]
+    rules = horizontal_rules(image)
+    if len(rules) < len(weeks) + 1:
+        logger.warning("⚠️ QT 달력 괘선을 찾지 못해 QT 이미지는 나누지 않고 보냅니다.")
+        return [(image, [day for week in weeks for day in week])]
+
+    # 달력은 이미지 아래쪽에 있으므로 마지막 (주 수 + 1)개 괘선이 표의 위/주 경계/아래
+    rules = rules[-(len(weeks) + 1):]
+    width, height = image.size
+    return [
+        (image.crop((0, max(0, top - ROW_PADDING), width, min(height, bottom + ROW_PADDING))), days)
+        for (top, bottom), days in zip(zip(rules, rules[1:]), weeks)
+    ]
+
+
+def build_tile_requests(br_image, qt_image, year, month):
+    """[(설명, image, prompt, schema, 맡은 날짜 set), ...]"""
+    year_str, month_str = str(year), str(month).zfill(2)
+    last_day = calendar.monthrange(int(year), int(month))[1]
+    requests = []
+    if br_image is not None:
+        for tile, first, last in split_br(br_image, last_day):
+            requests.append((f"BR {first}~{last}일", tile,
+                             build_br_tile_prompt(year_str, month_str, first, last),
+                             BR_TILE_SCHEMA, set(range(first, last + 1))))
+    if qt_image is not None:
+        for tile, days in split_qt(qt_image, int(year), int(month)):
+            requests.append((f"QT {days[0]}~{days[-1]}일", tile,
+                             build_qt_tile_prompt(year_str, month_str, days),
+                             QT_TILE_SCHEMA, set(days)))
+    return requests
+
+
+def extract_plan_tiled(provider, br_image, qt_image, year, month, workers=None):
+    """타일 요청을 동시에 보내고 {"days": [...]} (BIBLE_PLAN_SCHEMA 와 같은 모양) 로 합침.
+    타일 하나라도 실패하면 그 AIProviderError 를 그대로 올림.
+    어느 이미지(BR/QT)든 타일 결과에 빠진 날짜가 있으면 경고를 남기고 None (이미지 전체로 다시 요청할 것)"""
+    requests = build_tile_requests(br_image, qt_image, year, month)
+    workers = workers or int(os.getenv("AI_TILE_WORKERS", DEFAULT_WORKERS))
+    logger.info(f"  🧩 타일 {len(requests)}개를 최대 {workers}개씩 동시에 요청합니다...")
+
+    def run(request):
+        label, tile, prompt, schema, _ = request
+        started = time.perf_counter()
+        result = provider.generate_from_images([tile], prompt, schema)
+        logger.info(f"    - {label}: {len(result.get('days', []))}일 ({time.perf_counter() - started:.1f}s)")
+        return result
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(requests)))) as pool:
+        results = list(pool.map(run, requests))
+
+    last_day = calendar.monthrange(int(year), int(month))[1]
+    merged = {
+        day: {"day": day, "nt": "", "ot": "", "psalms": "", "proverbs": "", "qt": ""}
+        for day in range(1, last_day + 1)
+    }
+    # 이미지별로 타일 결과에 실제로 들어 있던 날짜 (빈 칸 날짜도 항목이 있으면 포함)
+    covered = {label.split()[0]: set() for label, *_ in requests}
+    for (label, _, _, _, days), result in zip(requests, results):
+        for entry in result.get("days", []):
+            day = int(entry.get("day", 0))
+            if day not in days:
+                # 겹치게 자른 가장자리의 옆 표/옆 주 칸은 버림
+                continue
+            covered[label.split()[0]].add(day)
+            for field, value in entry.items():
+                if field != "day" and value:
+                    merged[day][field] = value
+
+    missing = {kind: sorted(set(merged) - days) for kind, days in covered.items()}
+    missing = {kind: days for kind, days in missing.items() if days}
+    if missing:
+        detail = ", ".join(f"{kind} {days}" for kind, days in missing.items())
+        logger.warning(f"  ⚠️ 타일 결과에 빠진 날짜가 있습니다 ({detail}). 이미지 전체로 다시 요청합니다.")
+        return None
+    logger.info(f"  🧩 타일 병합 완료 ({time.perf_counter() - started:.1f}s)")
+    return {"days": list(merged.values())}